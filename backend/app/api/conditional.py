@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Response, status
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Return True if an `If-None-Match` header value matches `etag`.
+
+    Notes:
+        - Handles `*` and comma-separated lists.
+        - Uses weak comparison (a `W/` prefix is ignored), as RFC 9110
+          requires for `If-None-Match`.
+    """
+
+    if not if_none_match:
+        return False
+
+    def _opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    target = _opaque(etag)
+    return any(candidate.strip() == "*" or _opaque(candidate) == target for candidate in if_none_match.split(","))
+
+
+def is_not_modified(
+    *,
+    if_none_match: str | None,
+    if_modified_since: str | None,
+    etag: str,
+    last_modified: datetime | None,
+) -> bool:
+    """Evaluate conditional GET headers (RFC 9110 §13.2.2 order).
+
+    `If-Modified-Since` is only considered when `If-None-Match` is absent;
+    unparsable dates are ignored.
+    """
+
+    if if_none_match:
+        return etag_matches(if_none_match, etag)
+
+    if not if_modified_since or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return last_modified.replace(microsecond=0) <= since
+
+
+def validator_headers(etag: str, last_modified: datetime | None) -> dict[str, str]:
+    """Return `ETag` (and `Last-Modified` when known) response headers."""
+
+    headers = {"ETag": etag}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+    return headers
+
+
+def not_modified(etag: str, last_modified: datetime | None = None) -> Response:
+    """Return an empty `304 Not Modified` response carrying the validators."""
+
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validator_headers(etag, last_modified))
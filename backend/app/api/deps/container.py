@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from pathlib import Path
+
+from fastapi import Request
+
+from app.api.idempotency import IdempotencyStore
+from app.api.profiling import ProfileStore
+from app.core.settings import Settings
+from app.domain.practice.generation_control import GenerationController
+from app.domain.practice.prefetch import QuestionPrefetcher
+from app.domain.practice.progress_view import ProgressViewCache
+from app.domain.practice.report_jobs import ReportJobWorker
+from app.domain.practice.sampler import ConceptSelectorCache
+from app.domain.practice.service import PracticeService
+from app.domain.practice.session import SessionPlanStore
+from app.infra.llm.backends import BackendPool, OllamaBackendConfig, parse_backends
+from app.infra.llm.cassette import OllamaCassette
+from app.infra.llm.ollama_client import OllamaClient
+from app.infra.llm.scheduler import LLMScheduler, parse_model_concurrency
+from app.infra.repositories.async_repositories import (
+    AsyncAttemptsRepository,
+    AsyncConceptsRepository,
+    AsyncProgressRepository,
+    AsyncQuestionBankRepository,
+    AsyncQuestionReportsRepository,
+    AsyncRecentHistoryRepository,
+    AsyncReportJobsRepository,
+)
+from app.infra.repositories.attempts_repository import AttemptsRepository
+from app.infra.repositories.concepts_repository import ConceptsRepository
+from app.infra.repositories.progress_repository import ProgressRepository
+from app.infra.repositories.question_bank_repository import QuestionBankRepository
+from app.infra.repositories.question_reports_repository import QuestionReportsRepository
+from app.infra.repositories.recent_history_repository import RecentHistoryRepository
+from app.infra.repositories.report_jobs_repository import ReportJobsRepository
+from app.infra.storage.executor import StorageExecutor
+from app.infra.storage.yaml_store import YamlStore
+
+
+@dataclass(frozen=True)
+class AppContainer:
+    """Everything a request needs that outlives the request.
+
+    Purpose:
+        Build the settings-dependent object graph once per application (in the
+        lifespan) instead of once per request, so dependencies resolve to
+        attribute lookups.
+
+    Fields:
+        settings: Settings the graph was built from.
+        store: The single `YamlStore` for `settings.data_dir`; every
+            repository shares it.
+        executor: Storage executor the async repositories dispatch to.
+        ollama: LLM client.
+        llm_backends: Backend pool of `ollama` (health-checked between
+            `start` and `close`); None when a client was injected.
+        llm_cassette: Record/replay cassette of `ollama`, if enabled.
+        *_repo: Async repository facades.
+        selector_cache, progress_view_cache, session_plans, idempotency:
+            App-scoped caches.
+        prefetcher: Speculatively generated questions and their LLM budget.
+        generation_control: Generate-versus-reuse controller (LLM load and
+            generation budget).
+        practice: Practice service shared by all requests.
+        profiles: Recent request profiles (filled by `ProfilingMiddleware`).
+        report_worker: Background worker for queued question-report jobs
+            (started by `start`).
+    """
+
+    settings: Settings
+    store: YamlStore
+    executor: StorageExecutor
+    ollama: OllamaClient
+    llm_backends: BackendPool | None
+    llm_cassette: OllamaCassette | None
+    concepts_repo: AsyncConceptsRepository
+    progress_repo: AsyncProgressRepository
+    bank_repo: AsyncQuestionBankRepository
+    attempts_repo: AsyncAttemptsRepository
+    reports_repo: AsyncQuestionReportsRepository
+    history_repo: AsyncRecentHistoryRepository
+    report_jobs_repo: AsyncReportJobsRepository
+    selector_cache: ConceptSelectorCache
+    progress_view_cache: ProgressViewCache
+    session_plans: SessionPlanStore
+    idempotency: IdempotencyStore
+    prefetcher: QuestionPrefetcher
+    generation_control: GenerationController
+    practice: PracticeService
+    profiles: ProfileStore
+    report_worker: ReportJobWorker
+
+    async def start(self) -> None:
+        """Start background work (called from the app lifespan)."""
+
+        if self.llm_backends is not None:
+            await self.llm_backends.start()
+        await self.report_worker.start()
+
+    async def close(self) -> None:
+        """Stop background work and release resources (waits for in-flight storage work)."""
+
+        await self.report_worker.stop()
+        if self.llm_backends is not None:
+            await self.llm_backends.stop()
+        if self.llm_cassette is not None:
+            self.llm_cassette.close()
+        self.executor.shutdown(wait=True)
+
+
+def build_container(settings: Settings, *, ollama: OllamaClient | None = None) -> AppContainer:
+    """Build the app container from `settings`.
+
+    Inputs:
+        settings: Application settings.
+        ollama: Optional LLM client override (tests use a fake).
+
+    Outputs:
+        A container; `await start()` it, and `await close()` it when the app
+        shuts down.
+    """
+
+    store = YamlStore(settings.data_dir)
+    executor = StorageExecutor(workers=settings.storage_workers)
+    llm_backends: BackendPool | None = None
+    llm_cassette: OllamaCassette | None = None
+    scheduler: LLMScheduler | None = None
+    if ollama is None:
+        if settings.ollama_cassette_mode != "off":
+            llm_cassette = OllamaCassette(
+                settings.ollama_cassette_path or Path(settings.data_dir) / "ollama_cassette.ndjson.gz",
+                mode=settings.ollama_cassette_mode,
+                latency_scale=settings.ollama_cassette_latency_scale,
+            )
+        replaying = llm_cassette is not None and llm_cassette.replaying
+        llm_backends = BackendPool(
+            parse_backends(settings.ollama_backends) or [OllamaBackendConfig(url=settings.ollama_base_url.rstrip("/"))],
+            max_concurrency=settings.ollama_max_concurrency,
+            eject_after_failures=settings.ollama_eject_after_failures,
+            health_interval_seconds=0 if replaying else settings.ollama_health_interval_seconds,
+        )
+        scheduler = LLMScheduler(
+            max_concurrency=llm_backends.capacity,
+            model_concurrency=parse_model_concurrency(settings.ollama_model_concurrency),
+            max_queue_depth=settings.llm_max_queue_depth,
+            queue_timeout_seconds=settings.llm_queue_timeout_seconds,
+        )
+        ollama = OllamaClient(pool=llm_backends, scheduler=scheduler, cassette=llm_cassette)
+
+    concepts_repo = AsyncConceptsRepository(ConceptsRepository(store), executor)
+    progress_repo = AsyncProgressRepository(ProgressRepository(store), executor)
+    bank_repo = AsyncQuestionBankRepository(QuestionBankRepository(store), executor)
+    attempts_repo = AsyncAttemptsRepository(AttemptsRepository(store), executor)
+    history_repo = AsyncRecentHistoryRepository(
+        RecentHistoryRepository(store, capacity=settings.recent_history_size), executor
+    )
+    report_jobs_repo = AsyncReportJobsRepository(ReportJobsRepository(store), executor)
+    selector_cache = ConceptSelectorCache()
+    prefetcher = QuestionPrefetcher(
+        concepts=settings.prefetch_concepts,
+        max_generations_per_hour=settings.prefetch_max_generations_per_hour,
+    )
+    generation_control = GenerationController(
+        unit=settings.generation_budget_unit,
+        budget_per_window=settings.generation_budget_per_hour,
+        concept_budget_per_window=settings.generation_concept_budget_per_hour,
+        idle_boost=settings.generation_idle_boost,
+        load=None if scheduler is None else scheduler.load,
+    )
+    practice = PracticeService(
+        concepts_repo=concepts_repo,
+        progress_repo=progress_repo,
+        bank_repo=bank_repo,
+        attempts_repo=attempts_repo,
+        ollama=ollama,
+        generation_model=settings.ollama_generation_model,
+        evaluator_model=settings.ollama_evaluator_model,
+        selector_cache=selector_cache,
+        history_repo=history_repo,
+        rng=None if settings.practice_random_seed is None else random.Random(settings.practice_random_seed),
+        prefetcher=prefetcher,
+        generation_control=generation_control,
+    )
+
+    return AppContainer(
+        settings=settings,
+        store=store,
+        executor=executor,
+        ollama=ollama,
+        llm_backends=llm_backends,
+        llm_cassette=llm_cassette,
+        concepts_repo=concepts_repo,
+        progress_repo=progress_repo,
+        bank_repo=bank_repo,
+        attempts_repo=attempts_repo,
+        reports_repo=AsyncQuestionReportsRepository(QuestionReportsRepository(store), executor),
+        history_repo=history_repo,
+        report_jobs_repo=report_jobs_repo,
+        selector_cache=selector_cache,
+        progress_view_cache=ProgressViewCache(),
+        session_plans=SessionPlanStore(),
+        idempotency=IdempotencyStore(
+            ttl_seconds=settings.idempotency_ttl_seconds, max_entries=settings.idempotency_max_entries
+        ),
+        prefetcher=prefetcher,
+        generation_control=generation_control,
+        practice=practice,
+        profiles=ProfileStore(max_profiles=settings.profiling_max_profiles),
+        report_worker=ReportJobWorker(
+            jobs_repo=report_jobs_repo,
+            practice=practice,
+            workers=settings.report_job_workers,
+            max_attempts=settings.report_job_max_attempts,
+            backoff_seconds=settings.report_job_backoff_seconds,
+            max_backoff_seconds=settings.report_job_max_backoff_seconds,
+        ),
+    )
+
+
+def get_container(request: Request) -> AppContainer:
+    """Return the container built by the app lifespan.
+
+    Raises:
+        RuntimeError: if the lifespan has not run (e.g. a `TestClient` used
+            without `with`).
+    """
+
+    try:
+        return request.app.state.container
+    except AttributeError:
+        raise RuntimeError("App container is not initialised; run the app with its lifespan") from None
+
+
+def get_app_settings(request: Request) -> Settings:
+    """FastAPI dependency for the settings the app was built with."""
+
+    return get_container(request).settings
@@ -1,12 +1,10 @@
 from __future__ import annotations
 
-from functools import lru_cache
+from fastapi import Request
 
-from app.core.settings import get_settings
+from app.api.deps.container import get_container
 from app.infra.llm.ollama_client import OllamaClient
 
 
-@lru_cache
-def get_ollama_client() -> OllamaClient:
-    settings = get_settings()
-    return OllamaClient(base_url=settings.ollama_base_url)
+def get_ollama_client(request: Request) -> OllamaClient:
+    return get_container(request).ollama
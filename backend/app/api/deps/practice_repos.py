@@ -1,41 +1,80 @@
 from __future__ import annotations
 
-from functools import lru_cache
+from fastapi import Request
 
-from app.core.settings import get_settings
-from app.infra.repositories.attempts_repository import AttemptsRepository
-from app.infra.repositories.concepts_repository import ConceptsRepository
-from app.infra.repositories.progress_repository import ProgressRepository
-from app.infra.repositories.question_bank_repository import QuestionBankRepository
-from app.infra.repositories.question_reports_repository import QuestionReportsRepository
-from app.infra.storage.yaml_store import YamlStore
+from app.api.deps.container import get_container
+from app.api.idempotency import IdempotencyStore
+from app.domain.practice.generation_control import GenerationController
+from app.domain.practice.progress_view import ProgressViewCache
+from app.domain.practice.report_jobs import ReportJobWorker
+from app.domain.practice.sampler import ConceptSelectorCache
+from app.domain.practice.service import PracticeService
+from app.domain.practice.session import SessionPlanStore
+from app.infra.repositories.async_repositories import (
+    AsyncAttemptsRepository,
+    AsyncConceptsRepository,
+    AsyncProgressRepository,
+    AsyncQuestionBankRepository,
+    AsyncQuestionReportsRepository,
+    AsyncRecentHistoryRepository,
+    AsyncReportJobsRepository,
+)
 
+# All dependencies are lookups on the app container (see `container.py`);
+# nothing is constructed per request.
 
-@lru_cache
-def _store(data_dir: str) -> YamlStore:
-    return YamlStore(data_dir)
 
+def get_concepts_repo(request: Request) -> AsyncConceptsRepository:
+    return get_container(request).concepts_repo
 
-def get_store() -> YamlStore:
-    settings = get_settings()
-    return _store(settings.data_dir)
 
+def get_progress_repo(request: Request) -> AsyncProgressRepository:
+    return get_container(request).progress_repo
 
-def get_concepts_repo() -> ConceptsRepository:
-    return ConceptsRepository(get_store())
 
+def get_question_bank_repo(request: Request) -> AsyncQuestionBankRepository:
+    return get_container(request).bank_repo
 
-def get_progress_repo() -> ProgressRepository:
-    return ProgressRepository(get_store())
 
+def get_attempts_repo(request: Request) -> AsyncAttemptsRepository:
+    return get_container(request).attempts_repo
 
-def get_question_bank_repo() -> QuestionBankRepository:
-    return QuestionBankRepository(get_store())
 
+def get_question_reports_repo(request: Request) -> AsyncQuestionReportsRepository:
+    return get_container(request).reports_repo
 
-def get_attempts_repo() -> AttemptsRepository:
-    return AttemptsRepository(get_store())
 
+def get_recent_history_repo(request: Request) -> AsyncRecentHistoryRepository:
+    return get_container(request).history_repo
 
-def get_question_reports_repo() -> QuestionReportsRepository:
-    return QuestionReportsRepository(get_store())
+
+def get_concept_selector_cache(request: Request) -> ConceptSelectorCache:
+    return get_container(request).selector_cache
+
+
+def get_progress_view_cache(request: Request) -> ProgressViewCache:
+    return get_container(request).progress_view_cache
+
+
+def get_session_plan_store(request: Request) -> SessionPlanStore:
+    return get_container(request).session_plans
+
+
+def get_practice_service(request: Request) -> PracticeService:
+    return get_container(request).practice
+
+
+def get_report_jobs_repo(request: Request) -> AsyncReportJobsRepository:
+    return get_container(request).report_jobs_repo
+
+
+def get_report_worker(request: Request) -> ReportJobWorker:
+    return get_container(request).report_worker
+
+
+def get_idempotency_store(request: Request) -> IdempotencyStore:
+    return get_container(request).idempotency
+
+
+def get_generation_controller(request: Request) -> GenerationController:
+    return get_container(request).generation_control
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from fastapi import Request
+
+from app.api.deps.container import get_container
+from app.api.profiling import ProfileStore
+
+
+def get_profile_store(request: Request) -> ProfileStore:
+    return get_container(request).profiles
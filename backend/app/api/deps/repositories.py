@@ -1,20 +1,26 @@
 from __future__ import annotations
 
-from functools import lru_cache
+from fastapi import Request
 
-from app.core.settings import get_settings
-from app.infra.repositories.concepts_repository import ConceptsRepository
+from app.api.deps.container import get_container
+from app.infra.repositories.async_repositories import AsyncConceptsRepository
+from app.infra.storage.executor import StorageExecutor
 from app.infra.storage.yaml_store import YamlStore
 
 
-@lru_cache
-def _store(data_dir: str) -> YamlStore:
-    return YamlStore(data_dir)
+def get_store(request: Request) -> YamlStore:
+    """FastAPI dependency for the app-scoped YAML store."""
 
+    return get_container(request).store
 
-def get_concepts_repository() -> ConceptsRepository:
+
+def get_storage_executor(request: Request) -> StorageExecutor:
+    """FastAPI dependency for the storage executor."""
+
+    return get_container(request).executor
+
+
+def get_concepts_repository(request: Request) -> AsyncConceptsRepository:
     """FastAPI dependency for the concepts repository."""
 
-    settings = get_settings()
-    store = _store(settings.data_dir)
-    return ConceptsRepository(store)
+    return get_container(request).concepts_repo
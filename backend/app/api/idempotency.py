@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class IdempotencyKeyReused(ValueError):
+    """Raised when an idempotency key is reused with a different request body."""
+
+
+class _Completed(Generic[T]):
+    __slots__ = ("fingerprint", "result", "expires_at")
+
+    def __init__(self, fingerprint: str, result: T, expires_at: float) -> None:
+        self.fingerprint = fingerprint
+        self.result = result
+        self.expires_at = expires_at
+
+
+class IdempotencyStore:
+    """Results of completed requests by `Idempotency-Key`, plus in-flight ones.
+
+    Purpose:
+        Make retried requests (flaky mobile networks) return the first
+        result instead of running the operation again.
+
+    Behavior:
+        - Completed results are kept for `ttl_seconds`, at most
+          `max_entries` of them (oldest evicted first).
+        - A duplicate that arrives while the first request is still running
+          awaits that request's result.
+        - Failures are not stored: concurrent duplicates get the same error,
+          later retries run the operation again. If the first request is
+          cancelled (client went away), one waiting duplicate takes over.
+
+    Notes:
+        - In-memory and app-scoped; keys do not survive a restart.
+        - Must be used from a single event loop (the app's).
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = 86_400.0,
+        max_entries: int = 1_000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._max_entries = max(1, int(max_entries))
+        self._clock = clock
+        self._completed: OrderedDict[str, _Completed[Any]] = OrderedDict()
+        self._in_flight: dict[str, tuple[str, asyncio.Future[Any]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._completed)
+
+    def _evict(self, now: float) -> None:
+        while self._completed:
+            key, entry = next(iter(self._completed.items()))
+            if entry.expires_at > now and len(self._completed) <= self._max_entries:
+                break
+            del self._completed[key]
+
+    async def run(self, key: str, fingerprint: str, operation: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """Run `operation` once per `key`.
+
+        Inputs:
+            key: Client-supplied idempotency key.
+            fingerprint: Digest of the request body; a key is bound to it.
+            operation: Produces the result (may raise).
+
+        Outputs:
+            `(result, replayed)`; `replayed` is True if the result came from
+            an earlier or concurrent request with the same key.
+
+        Raises:
+            IdempotencyKeyReused: if `key` was used with another fingerprint.
+            Whatever `operation` raises (also for concurrent duplicates).
+        """
+
+        while True:
+            self._evict(self._clock())
+
+            completed = self._completed.get(key)
+            if completed is not None:
+                if completed.fingerprint != fingerprint:
+                    raise IdempotencyKeyReused(key)
+                return completed.result, True
+
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                break
+
+            in_flight_fingerprint, future = in_flight
+            if in_flight_fingerprint != fingerprint:
+                raise IdempotencyKeyReused(key)
+            try:
+                return await asyncio.shield(future), True
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise  # this duplicate itself was cancelled
+                # The original request was cancelled: try to take over.
+
+        future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = (fingerprint, future)
+        try:
+            result = await operation()
+        except BaseException as exc:
+            del self._in_flight[key]
+            if isinstance(exc, Exception):
+                future.set_exception(exc)
+                future.exception()  # retrieved: no "never retrieved" warning without waiters
+            else:
+                future.cancel()
+            raise
+
+        del self._in_flight[key]
+        future.set_result(result)
+        self._completed[key] = _Completed(fingerprint, result, self._clock() + self._ttl)
+        self._evict(self._clock())
+        return result, False
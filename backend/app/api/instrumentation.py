@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_FLIGHT, HTTP_RESPONSES
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware recording request latency, in-flight count and status codes.
+
+    Notes:
+        - Requests are labelled with the matched route template (e.g.
+          `/concepts/{concept_id}`), read from the scope after routing, so
+          label cardinality is bounded; unmatched paths are `unmatched`.
+        - Latency covers the whole response, including streamed bodies.
+        - A plain ASGI wrapper (no `BaseHTTPMiddleware`) keeps the overhead to
+          two clock reads and three metric updates per request.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            route = scope.get("route")
+            template = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            HTTP_REQUEST_DURATION.observe(elapsed, method, template)
+            HTTP_RESPONSES.inc(method, template, str(status_code))
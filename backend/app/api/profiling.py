@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import cProfile
+import hmac
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from urllib.parse import parse_qsl
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.profiling import ProfileSession, ProfileSummary, profile_session
+
+PROFILE_TOKEN_HEADER = "X-Profile-Token"
+PROFILE_TOKEN_QUERY = "profile_token"
+PROFILE_ID_HEADER = "X-Profile-Id"
+PROFILES_PATH = "/debug/profiles"
+
+_TOKEN_HEADER = PROFILE_TOKEN_HEADER.lower().encode("latin-1")
+_TOKEN_QUERY = PROFILE_TOKEN_QUERY.encode("ascii") + b"="
+_ID_HEADER = PROFILE_ID_HEADER.lower().encode("latin-1")
+
+
+@dataclass(frozen=True)
+class RequestProfile:
+    """Stored profile of one request.
+
+    Fields:
+        duration_seconds: Until the last response byte was sent (background
+            tasks excluded).
+        summary: Phases, package totals and top functions.
+    """
+
+    id: str
+    method: str
+    path: str
+    status: int
+    started_at: datetime
+    duration_seconds: float
+    summary: ProfileSummary
+
+
+class ProfileStore:
+    """The most recent request profiles by id.
+
+    Notes:
+        - Keeps at most `max_profiles` (oldest evicted first); profiles only
+          hold summaries, not raw profiler data.
+        - In-memory and app-scoped; profiles do not survive a restart.
+    """
+
+    def __init__(self, *, max_profiles: int = 50) -> None:
+        self._max_profiles = max(1, int(max_profiles))
+        self._lock = threading.Lock()
+        self._profiles: OrderedDict[str, RequestProfile] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def add(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._profiles[profile.id] = profile
+            while len(self._profiles) > self._max_profiles:
+                self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> RequestProfile | None:
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+    def recent(self) -> list[RequestProfile]:
+        """Stored profiles, newest first."""
+
+        with self._lock:
+            return list(reversed(self._profiles.values()))
+
+
+class ProfilingMiddleware:
+    """Pure ASGI middleware that profiles requests carrying the profiling token.
+
+    Purpose:
+        Show where one slow request spends its time (YAML storage, pydantic,
+        route code, LLM wait) without a profiler attached to the process.
+
+    Behavior:
+        - A request is profiled when its `X-Profile-Token` header (or
+          `profile_token` query parameter) equals `token`. Other requests,
+          including ones with a wrong token, are served unchanged, as are
+          the `/debug/profiles` requests that read profiles.
+        - The request runs under `cProfile` on the event loop, storage calls
+          under their own profilers on their threads (see
+          `ProfileSession`). Profiling stops when the last response byte is
+          sent; the summary is stored in the container's `ProfileStore` and
+          its id returned in `X-Profile-Id`.
+        - One request is profiled at a time (a thread has one profiler); a
+          flagged request that arrives meanwhile is served unprofiled,
+          without `X-Profile-Id`.
+
+    Notes:
+        - Only installed when `PROFILING_TOKEN` is set, so it costs nothing
+          otherwise; unflagged requests pay one header scan.
+        - The event loop profile also sees other requests' coroutines that
+          run while the profiled one awaits.
+    """
+
+    def __init__(self, app: ASGIApp, *, token: str, top_functions: int = 30) -> None:
+        self.app = app
+        self._token = token.encode("utf-8")
+        self._top_functions = top_functions
+        self._busy = False
+
+    def _flagged(self, scope: Scope) -> bool:
+        for name, value in scope["headers"]:
+            if name == _TOKEN_HEADER:
+                return hmac.compare_digest(value, self._token)
+        query = scope.get("query_string", b"")
+        if _TOKEN_QUERY in query:
+            for name, value in parse_qsl(query.decode("latin-1")):
+                if name == PROFILE_TOKEN_QUERY:
+                    return hmac.compare_digest(value.encode("utf-8"), self._token)
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or self._busy
+            or not self._flagged(scope)
+            or scope["path"].startswith(PROFILES_PATH)  # reading profiles sends the token too
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:  # Python 3.12+: another profiler is active in the process
+            await self.app(scope, receive, send)
+            return
+
+        self._busy = True
+        profile_id = uuid.uuid4().hex
+        session = ProfileSession()
+        status_code = 500
+        started_at = datetime.now(timezone.utc)
+        start = time.perf_counter()
+
+        def stop() -> None:
+            if session.active:
+                profiler.disable()
+                session.active = False
+                self._busy = False
+                session.add(profiler)
+                self._store(scope, profile_id, status_code, started_at, time.perf_counter() - start, session)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [*message.get("headers", []), (_ID_HEADER, profile_id.encode("ascii"))]
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                stop()
+
+        with profile_session(session):
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                stop()
+
+    def _store(
+        self,
+        scope: Scope,
+        profile_id: str,
+        status_code: int,
+        started_at: datetime,
+        duration: float,
+        session: ProfileSession,
+    ) -> None:
+        container = getattr(scope["app"].state, "container", None)
+        if container is None:
+            return
+        container.profiles.add(
+            RequestProfile(
+                id=profile_id,
+                method=scope["method"],
+                path=scope["path"],
+                status=status_code,
+                started_at=started_at,
+                duration_seconds=duration,
+                summary=session.summary(top=self._top_functions),
+            )
+        )
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import PydanticSerializationError, to_jsonable_python
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson installed
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    try:
+        return to_jsonable_python(value)  # datetimes, UUIDs, ... rendered as pydantic does
+    except PydanticSerializationError:
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable") from None
+
+
+def dump_json(content: Any) -> bytes:
+    """Serialize `content` to JSON bytes.
+
+    Notes:
+        - Pydantic models go through pydantic-core (`model_dump_json`), which
+          is faster than dumping to dicts and re-encoding.
+        - Everything else uses orjson when installed (UTC rendered as `Z`,
+          matching pydantic), else the stdlib encoder; both fall back to
+          pydantic's encoding for types they do not know (e.g. `datetime`
+          in the stdlib encoder).
+    """
+
+    if isinstance(content, BaseModel):
+        return content.__pydantic_serializer__.to_json(content)
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_UTC_Z)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response that skips re-encoding where it can.
+
+    Accepts pre-serialized `bytes` (sent as-is), pydantic models, or plain
+    JSON-compatible data. Used as the app's default response class, and
+    returned directly by read routes to bypass `response_model` re-validation.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dump_json(content)
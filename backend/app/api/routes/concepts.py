@@ -1,18 +1,69 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import base64
+import binascii
+from datetime import datetime
+from typing import Literal
 
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from app.api.conditional import is_not_modified, not_modified, validator_headers
 from app.api.deps.repositories import get_concepts_repository
+from app.api.responses import FastJSONResponse, dump_json
+from app.api.streaming import iter_json_array, iter_ndjson
+from app.domain.concept_catalog import CatalogKey
 from app.domain.concepts import Concept, ConceptCreate
-from app.infra.repositories.concepts_repository import ConceptsRepository
+from app.infra.repositories.async_repositories import AsyncConceptsRepository
+from app.infra.repositories.concepts_repository import ConceptDedupKey
 
 router = APIRouter(prefix="/concepts", tags=["concepts"])
 
+_CONCEPT_LIST = TypeAdapter(list[Concept])
+_DEFAULT_PAGE_SIZE = 100
+_MAX_IMPORT_ROWS = 50_000
+_NDJSON_TYPES = {"application/x-ndjson", "application/ndjson", "application/jsonl"}
+
+
+def _bad_request(code: str, message: str) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={"error": {"code": code, "message": message}},
+    )
+
+
+def _encode_cursor(key: CatalogKey) -> str:
+    created_at, concept_id = key
+    raw = f"{created_at.isoformat()}|{concept_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> CatalogKey:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        created_at, concept_id = raw.split("|", 1)
+        key = (datetime.fromisoformat(created_at), concept_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise _bad_request("invalid_cursor", "Malformed cursor") from exc
+    if key[0].tzinfo is None:
+        raise _bad_request("invalid_cursor", "Malformed cursor")
+    return key
+
+
+def _parse_fields(fields: str | None) -> set[str] | None:
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(Concept.model_fields)
+    if unknown:
+        raise _bad_request("invalid_fields", f"Unknown fields: {', '.join(sorted(unknown))}")
+    return requested | {"id"}
+
 
 @router.post("", response_model=Concept, status_code=status.HTTP_201_CREATED)
-def create_concept(
+async def create_concept(
     payload: ConceptCreate,
-    repo: ConceptsRepository = Depends(get_concepts_repository),
+    repo: AsyncConceptsRepository = Depends(get_concepts_repository),
 ) -> Concept:
     """Create a new concept.
 
@@ -26,23 +77,185 @@ def create_concept(
         - 400 if validation fails (handled by FastAPI/Pydantic)
     """
 
-    return repo.create_concept(payload)
+    return await repo.create_concept(payload)
+
+
+class ConceptImportRow(BaseModel):
+    row: int
+    status: Literal["created", "duplicate", "invalid"]
+    id: str | None = None
+    error: str | None = None
+
+
+class ConceptImportResponse(BaseModel):
+    created: int
+    duplicates: int
+    invalid: int
+    rows: list[ConceptImportRow]
+
+
+def _validation_message(exc: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc']) or 'row'}: {error['msg']}" for error in exc.errors()
+    )
+
+
+@router.post("/import", response_model=ConceptImportResponse)
+async def import_concepts(
+    request: Request,
+    dedup: ConceptDedupKey | None = Query(
+        default=None, description="Skip rows matching an existing concept (or earlier row) on this field"
+    ),
+    repo: AsyncConceptsRepository = Depends(get_concepts_repository),
+) -> Response:
+    """Create many concepts from one streamed request body.
+
+    Inputs:
+        Body as NDJSON (`Content-Type: application/x-ndjson`, one
+        `ConceptCreate` object per line) or a JSON array of them
+        (`application/json`).
+        dedup: Optional `title` (case-insensitive) or `source_url`.
+
+    Outputs:
+        Counts plus one result per row (1-based, blank NDJSON lines are not
+        counted): `created` with the new id, `duplicate` with the id of the
+        matching concept, or `invalid` with the validation error.
+
+    Error cases:
+        - 400 `invalid_body` if the JSON array is malformed as a whole.
+        - 413 `too_many_rows` above 50,000 rows.
+        - 415 `unsupported_media_type` for other content types.
+
+    Notes:
+        - Rows are validated while the body streams in; valid rows are
+          committed with a single storage write, so cost is linear in the
+          number of rows instead of one full file rewrite per concept.
+        - Nothing is written if the body is rejected.
+    """
+
+    content_type = request.headers.get("content-type", "application/json").split(";")[0].strip().lower()
+    if content_type in _NDJSON_TYPES:
+        rows = iter_ndjson(request.stream())
+    elif content_type == "application/json":
+        rows = iter_json_array(request.stream())
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail={
+                "error": {"code": "unsupported_media_type", "message": f"Unsupported content type: {content_type}"}
+            },
+        )
+
+    results: list[ConceptImportRow] = []
+    payloads: list[ConceptCreate] = []
+    positions: list[int] = []
+    try:
+        async for raw in rows:
+            if len(results) >= _MAX_IMPORT_ROWS:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail={
+                        "error": {"code": "too_many_rows", "message": f"At most {_MAX_IMPORT_ROWS} rows per import"}
+                    },
+                )
+            row = ConceptImportRow(row=len(results) + 1, status="invalid")
+            try:
+                payloads.append(ConceptCreate.model_validate_json(raw))
+            except ValidationError as exc:
+                row.error = _validation_message(exc)
+            else:
+                positions.append(len(results))
+            results.append(row)
+    except ValueError as exc:
+        raise _bad_request("invalid_body", str(exc)) from exc
+
+    outcome = await repo.create_concepts(payloads, dedup=dedup)
+    for position, concept in outcome.created:
+        row = results[positions[position]]
+        row.status, row.id = "created", concept.id
+    for position, existing_id in outcome.duplicates:
+        row = results[positions[position]]
+        row.status, row.id = "duplicate", existing_id
+
+    return FastJSONResponse(
+        content=ConceptImportResponse(
+            created=len(outcome.created),
+            duplicates=len(outcome.duplicates),
+            invalid=len(results) - len(payloads),
+            rows=results,
+        )
+    )
 
 
 @router.get("", response_model=list[Concept])
-def list_concepts(
-    repo: ConceptsRepository = Depends(get_concepts_repository),
-) -> list[Concept]:
-    """List all concepts."""
+async def list_concepts(
+    request: Request,
+    limit: int | None = Query(default=None, ge=1, le=500),
+    cursor: str | None = Query(default=None, description="`X-Next-Cursor` of the previous page"),
+    tag: str | None = Query(default=None, description="Only concepts with this tag"),
+    title_prefix: str | None = Query(default=None, min_length=1, description="Case-insensitive title prefix"),
+    fields: str | None = Query(default=None, description="Comma-separated fields to return (`id` is always included)"),
+    if_none_match: str | None = Header(default=None),
+    if_modified_since: str | None = Header(default=None),
+    repo: AsyncConceptsRepository = Depends(get_concepts_repository),
+) -> Response:
+    """List concepts ordered by `created_at`, then id.
+
+    Inputs:
+        limit / cursor: Page size and continuation token. Without either, all
+            matching concepts are returned; a cursor alone uses pages of 100.
+        tag, title_prefix: Optional filters (combined with AND).
+        fields: Optional projection, e.g. `id,title`.
+
+    Outputs:
+        JSON array of (projected) concepts. When more items follow, the
+        `X-Next-Cursor` header and a `Link: <...>; rel="next"` header are set.
 
-    return repo.list_concepts()
+    Error cases:
+        - 400 `invalid_cursor` / `invalid_fields`.
+
+    Notes:
+        - Served from the in-memory concept catalog; cost depends on the page
+          size and number of filter matches, not the library size.
+        - `ETag` / `Last-Modified` come from the store version of the concepts
+          file; a matching conditional request gets 304 without reading it.
+    """
+
+    version = await repo.version()
+    etag = f'"{version.tag}"'
+    if is_not_modified(
+        if_none_match=if_none_match, if_modified_since=if_modified_since, etag=etag, last_modified=version.modified_at
+    ):
+        return not_modified(etag, version.modified_at)
+
+    projection = _parse_fields(fields)
+    after = None if cursor is None else _decode_cursor(cursor)
+    if limit is None:
+        limit = _DEFAULT_PAGE_SIZE if cursor is not None else max(1, await repo.count())
+
+    page = await repo.page(limit=limit, after=after, tag=tag, title_prefix=title_prefix)
+
+    if projection is None:
+        body = _CONCEPT_LIST.dump_json(page.items)
+    else:
+        body = dump_json([concept.model_dump(include=projection) for concept in page.items])
+
+    headers = validator_headers(etag, version.modified_at)
+    if page.next_key is not None:
+        next_cursor = _encode_cursor(page.next_key)
+        headers["X-Next-Cursor"] = next_cursor
+        headers["Link"] = f'<{request.url.include_query_params(cursor=next_cursor, limit=limit)}>; rel="next"'
+
+    return FastJSONResponse(content=body, headers=headers)
 
 
 @router.get("/{concept_id}", response_model=Concept)
-def get_concept(
+async def get_concept(
     concept_id: str,
-    repo: ConceptsRepository = Depends(get_concepts_repository),
-) -> Concept:
+    if_none_match: str | None = Header(default=None),
+    if_modified_since: str | None = Header(default=None),
+    repo: AsyncConceptsRepository = Depends(get_concepts_repository),
+) -> Concept | Response:
     """Get a concept by ID.
 
     Inputs:
@@ -53,13 +266,25 @@ def get_concept(
 
     Error cases:
         - 404 if the concept does not exist.
+
+    Notes:
+        - Conditional GET as for `GET /concepts` (validators are per file),
+          evaluated only once the concept exists: `If-None-Match: *` on a
+          missing concept is a 404, not a 304.
     """
 
-    concept = repo.get_concept(concept_id)
+    version = await repo.version()
+    concept = await repo.get_concept(concept_id)
     if concept is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={"error": {"code": "concept_not_found", "message": "Concept not found"}},
         )
 
-    return concept
+    etag = f'"{version.tag}"'
+    if is_not_modified(
+        if_none_match=if_none_match, if_modified_since=if_modified_since, etag=etag, last_modified=version.modified_at
+    ):
+        return not_modified(etag, version.modified_at)
+
+    return FastJSONResponse(content=concept, headers=validator_headers(etag, version.modified_at))
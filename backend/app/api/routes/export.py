@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.api.deps.practice_repos import get_attempts_repo, get_progress_repo, get_question_bank_repo
+from app.api.streaming import ndjson_stream
+from app.domain.practice.models import PracticeQuestion
+from app.domain.time_range import TimeRange
+from app.infra.repositories.async_repositories import (
+    AsyncAttemptsRepository,
+    AsyncProgressRepository,
+    AsyncQuestionBankRepository,
+)
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+_NDJSON = "application/x-ndjson"
+
+
+class QuestionBankRecord(BaseModel):
+    concept_id: str
+    p_new: float
+    questions: list[PracticeQuestion]
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+def _filters(
+    concept_id: list[str] | None = Query(default=None, description="Only these concepts (repeatable)"),
+    since: datetime | None = Query(default=None, description="Inclusive lower bound (naive = UTC)"),
+    until: datetime | None = Query(default=None, description="Exclusive upper bound (naive = UTC)"),
+) -> tuple[set[str] | None, TimeRange]:
+    time_range = TimeRange(since=_as_utc(since), until=_as_utc(until))
+    if time_range.since is not None and time_range.until is not None and time_range.since >= time_range.until:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": {"code": "invalid_range", "message": "`since` must be before `until`"}},
+        )
+    return (None if concept_id is None else set(concept_id)), time_range
+
+
+@router.get("/attempts", response_class=StreamingResponse)
+async def export_attempts(
+    filters: tuple[set[str] | None, TimeRange] = Depends(_filters),
+    attempts_repo: AsyncAttemptsRepository = Depends(get_attempts_repo),
+) -> StreamingResponse:
+    """Stream attempts as NDJSON, oldest first.
+
+    Inputs:
+        concept_id (repeatable), since / until on `created_at`.
+
+    Outputs:
+        One `PracticeAttempt` JSON object per line.
+
+    Error cases:
+        - 400 `invalid_range` if `since` is not before `until`.
+
+    Notes:
+        - Streams from `attempts.yaml` item by item; memory use is constant
+          regardless of history size.
+    """
+
+    concept_ids, time_range = filters
+    records = attempts_repo.sync.iter_attempts(concept_ids=concept_ids, time_range=time_range)
+    return StreamingResponse(ndjson_stream(attempts_repo.executor, records), media_type=_NDJSON)
+
+
+@router.get("/progress", response_class=StreamingResponse)
+async def export_progress(
+    filters: tuple[set[str] | None, TimeRange] = Depends(_filters),
+    progress_repo: AsyncProgressRepository = Depends(get_progress_repo),
+) -> StreamingResponse:
+    """Stream stored per-concept progress as NDJSON.
+
+    Inputs:
+        concept_id (repeatable), since / until on `next_due_at`.
+
+    Outputs:
+        One `ConceptProgress` JSON object per line (concepts never practiced
+        have no stored progress and are not exported).
+
+    Error cases:
+        - 400 `invalid_range` if `since` is not before `until`.
+    """
+
+    concept_ids, time_range = filters
+    records = progress_repo.sync.iter_progress(concept_ids=concept_ids, time_range=time_range)
+    return StreamingResponse(ndjson_stream(progress_repo.executor, records), media_type=_NDJSON)
+
+
+@router.get("/question-banks", response_class=StreamingResponse)
+async def export_question_banks(
+    filters: tuple[set[str] | None, TimeRange] = Depends(_filters),
+    bank_repo: AsyncQuestionBankRepository = Depends(get_question_bank_repo),
+) -> StreamingResponse:
+    """Stream question banks as NDJSON, one bank per line.
+
+    Inputs:
+        concept_id (repeatable), since / until on each question's `created_at`.
+
+    Outputs:
+        `{"concept_id", "p_new", "questions": [...]}` per line. With a time
+        range, only matching questions are included and empty banks skipped.
+
+    Error cases:
+        - 400 `invalid_range` if `since` is not before `until`.
+    """
+
+    concept_ids, time_range = filters
+    records = (
+        QuestionBankRecord(concept_id=concept_id, p_new=p_new, questions=questions)
+        for concept_id, p_new, questions in bank_repo.sync.iter_banks(concept_ids=concept_ids, time_range=time_range)
+    )
+    return StreamingResponse(ndjson_stream(bank_repo.executor, records), media_type=_NDJSON)
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import REGISTRY
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Expose request, storage and LLM metrics in Prometheus text format.
+
+    Outputs:
+        `text/plain; version=0.0.4` exposition of every registered metric.
+
+    Error cases:
+        None expected.
+    """
+
+    return PlainTextResponse(REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,27 +1,51 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import hashlib
+import logging
+from typing import Literal
+
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Response, status
 from pydantic import BaseModel, Field
 
-from app.api.deps.llm import get_ollama_client
 from app.api.deps.practice_repos import (
-    get_attempts_repo,
-    get_concepts_repo,
-    get_progress_repo,
-    get_question_bank_repo,
+    get_generation_controller,
+    get_idempotency_store,
+    get_practice_service,
+    get_recent_history_repo,
+    get_session_plan_store,
 )
-from app.core.settings import get_settings
+from app.api.idempotency import IdempotencyKeyReused, IdempotencyStore
 from app.domain.practice.models import ConceptProgress, PracticeAttempt, PracticeQuestion
+from app.domain.concepts import Concept
+from app.domain.practice.generation_control import GenerationController
 from app.domain.practice.scheduling import utc_now
 from app.domain.practice.service import NoConceptsDue, PracticeService
-from app.infra.llm.ollama_client import OllamaClient, OllamaUnavailable
-from app.infra.repositories.attempts_repository import AttemptsRepository
-from app.infra.repositories.concepts_repository import ConceptsRepository
-from app.infra.repositories.progress_repository import ProgressRepository
-from app.infra.repositories.question_bank_repository import QuestionBankRepository
+from app.domain.practice.session import SessionPlan, SessionPlanStore, SessionSlot
+from app.infra.llm.ollama_client import LLMOverloaded, LLMPriority, OllamaUnavailable
+from app.infra.repositories.async_repositories import AsyncRecentHistoryRepository
 
 router = APIRouter(prefix="/practice", tags=["practice"])
 
+logger = logging.getLogger(__name__)
+
+# Suggested client back-off when the LLM queue is full.
+_OVERLOADED_RETRY_AFTER_SECONDS = 5
+
+
+def _ai_error(exc: OllamaUnavailable) -> HTTPException:
+    """Map LLM failures: 429 when admission control refused the call, else 503."""
+
+    if isinstance(exc, LLMOverloaded):
+        return HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail={"error": {"code": "ai_overloaded", "message": str(exc)}},
+            headers={"Retry-After": str(_OVERLOADED_RETRY_AFTER_SECONDS)},
+        )
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail={"error": {"code": "ai_unavailable", "message": str(exc)}},
+    )
+
 
 class PracticeGenerateResponse(BaseModel):
     concept_id: str
@@ -29,54 +53,36 @@ class PracticeGenerateResponse(BaseModel):
 
 
 @router.post("/generate", response_model=PracticeGenerateResponse)
-def generate(
-    concepts_repo: ConceptsRepository = Depends(get_concepts_repo),
-    progress_repo: ProgressRepository = Depends(get_progress_repo),
-    bank_repo: QuestionBankRepository = Depends(get_question_bank_repo),
-    attempts_repo: AttemptsRepository = Depends(get_attempts_repo),
-    ollama: OllamaClient = Depends(get_ollama_client),
+async def generate(
+    background_tasks: BackgroundTasks,
+    service: PracticeService = Depends(get_practice_service),
+    history_repo: AsyncRecentHistoryRepository = Depends(get_recent_history_repo),
 ) -> PracticeGenerateResponse:
     """Generate a single practice question.
 
     Notes:
         - Blocks if AI is unavailable.
         - Blocks if no concepts are due.
-        - Recent tags are currently not tracked in persistence; MVP uses empty set.
+        - 429 `ai_overloaded` if the LLM queue is full; generation queues
+          behind grading in the LLM scheduler.
+        - Recent tags come from the recent-history buffer (last 3 served/answered questions).
+        - After the response is sent, questions for the likely next concepts
+          are generated in the background (`PracticeService.prefetch_next`).
     """
 
-    settings = get_settings()
-    now = utc_now()
-
-    recent_tags: set[str] = set()
-    for attempt in attempts_repo.list_recent(limit=3):
-        concept = concepts_repo.get_concept(attempt.concept_id)
-        if concept is not None:
-            recent_tags.update(concept.tags)
-
-    service = PracticeService(
-        concepts_repo=concepts_repo,
-        progress_repo=progress_repo,
-        bank_repo=bank_repo,
-        attempts_repo=attempts_repo,
-        ollama=ollama,
-        generation_model=settings.ollama_generation_model,
-        evaluator_model=settings.ollama_evaluator_model,
-        now=now,
-    )
+    recent_tags = await history_repo.recent_tags(limit=3)
 
     try:
-        result = service.generate_one(recent_tags=recent_tags)
+        result = await service.generate_one(recent_tags=recent_tags)
     except NoConceptsDue as exc:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail={"error": {"code": "no_concepts_due", "message": str(exc)}},
         ) from exc
     except OllamaUnavailable as exc:
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail={"error": {"code": "ai_unavailable", "message": str(exc)}},
-        ) from exc
+        raise _ai_error(exc) from exc
 
+    background_tasks.add_task(service.prefetch_next, served_concept_id=result.concept.id)
     return PracticeGenerateResponse(concept_id=result.concept.id, question=result.question)
 
 
@@ -92,45 +98,234 @@ class PracticeSubmitResponse(BaseModel):
 
 
 @router.post("/submit", response_model=PracticeSubmitResponse)
-def submit(
+async def submit(
     payload: PracticeSubmitRequest,
-    concepts_repo: ConceptsRepository = Depends(get_concepts_repo),
-    progress_repo: ProgressRepository = Depends(get_progress_repo),
-    bank_repo: QuestionBankRepository = Depends(get_question_bank_repo),
-    attempts_repo: AttemptsRepository = Depends(get_attempts_repo),
-    ollama: OllamaClient = Depends(get_ollama_client),
+    response: Response,
+    idempotency_key: str | None = Header(default=None, min_length=1, max_length=255),
+    service: PracticeService = Depends(get_practice_service),
+    idempotency: IdempotencyStore = Depends(get_idempotency_store),
 ) -> PracticeSubmitResponse:
-    """Submit an answer for grading and update progress."""
+    """Submit an answer for grading and update progress.
 
-    settings = get_settings()
-    now = utc_now()
+    Inputs:
+        JSON payload with concept_id, question_id and user_answer.
+        Idempotency-Key: Optional client-chosen key (e.g. a UUID per answer).
 
-    service = PracticeService(
-        concepts_repo=concepts_repo,
-        progress_repo=progress_repo,
-        bank_repo=bank_repo,
-        attempts_repo=attempts_repo,
-        ollama=ollama,
-        generation_model=settings.ollama_generation_model,
-        evaluator_model=settings.ollama_evaluator_model,
-        now=now,
-    )
+    Error cases:
+        - 404 if the concept or question is unknown.
+        - 422 `idempotency_key_reused` if the key was used with a different body.
+        - 429 `ai_overloaded` if the LLM queue is full (`Retry-After` is set).
+        - 503 if AI is unavailable.
+
+    Notes:
+        - With a key, retries return the first response (marked
+          `Idempotent-Replayed: true`) without grading again or writing a
+          second attempt; a retry that arrives while the first is still
+          grading waits for it. Errors are not replayed.
+    """
+
+    async def grade() -> PracticeSubmitResponse:
+        try:
+            result = await service.submit(
+                concept_id=payload.concept_id,
+                question_id=payload.question_id,
+                user_answer=payload.user_answer,
+            )
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={"error": {"code": "not_found", "message": str(exc)}},
+            ) from exc
+        except OllamaUnavailable as exc:
+            raise _ai_error(exc) from exc
+
+        return PracticeSubmitResponse(attempt=result.attempt, progress=result.progress)
 
+    if idempotency_key is None:
+        return await grade()
+
+    fingerprint = hashlib.sha256(payload.model_dump_json().encode("utf-8")).hexdigest()
     try:
-        result = service.submit(
-            concept_id=payload.concept_id,
-            question_id=payload.question_id,
-            user_answer=payload.user_answer,
-        )
-    except ValueError as exc:
+        result, replayed = await idempotency.run(idempotency_key, fingerprint, grade)
+    except IdempotencyKeyReused as exc:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={"error": {"code": "not_found", "message": str(exc)}},
+            # Literal: HTTP_422_UNPROCESSABLE_CONTENT is missing before Starlette 0.48,
+            # HTTP_422_UNPROCESSABLE_ENTITY is deprecated from then on.
+            status_code=422,
+            detail={
+                "error": {
+                    "code": "idempotency_key_reused",
+                    "message": "Idempotency-Key was already used with a different request body",
+                }
+            },
         ) from exc
-    except OllamaUnavailable as exc:
+
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+    return result
+
+
+class PracticeSessionRequest(BaseModel):
+    count: int = Field(default=5, ge=1, le=20)
+
+
+class PracticeSessionItem(BaseModel):
+    concept_id: str
+    status: Literal["ready", "pending", "failed"]
+    question: PracticeQuestion | None = None
+
+
+class PracticeSessionResponse(BaseModel):
+    session_id: str
+    items: list[PracticeSessionItem]
+
+
+def _session_response(plan: SessionPlan) -> PracticeSessionResponse:
+    return PracticeSessionResponse(
+        session_id=plan.id,
+        items=[
+            PracticeSessionItem(concept_id=slot.concept_id, status=slot.status, question=slot.question)
+            for slot in plan.slots
+        ],
+    )
+
+
+async def _fill_pending_slots(
+    service: PracticeService,
+    plans: SessionPlanStore,
+    plan_id: str,
+    pending: list[tuple[int, Concept]],
+) -> None:
+    """Generate questions for pending slots (runs after the response is sent).
+
+    Notes:
+        - Any failure (LLM, storage) fails only its slot; the remaining slots
+          are still filled, so polling clients always see every slot settle.
+        - A filled slot is recorded as served (recent history) once its
+          question exists; failed slots never are.
+    """
+
+    for position, concept in pending:
+        try:
+            question = await service.generate_question(concept, priority=LLMPriority.BACKGROUND)
+        except Exception as exc:  # noqa: BLE001
+            if not isinstance(exc, (OllamaUnavailable, ValueError)):
+                logger.exception("Filling session %s slot %d failed", plan_id, position)
+            plans.update_slot(
+                plan_id, position, SessionSlot(concept_id=concept.id, status="failed", error=str(exc))
+            )
+            continue
+        plans.update_slot(plan_id, position, SessionSlot(concept_id=concept.id, status="ready", question=question))
+        try:
+            await service.record_served(concept, question)
+        except Exception:  # noqa: BLE001 - the slot is filled; only tag continuity suffers
+            logger.exception("Recording session %s slot %d as served failed", plan_id, position)
+
+
+@router.post("/session", response_model=PracticeSessionResponse)
+async def plan_session(
+    payload: PracticeSessionRequest,
+    background_tasks: BackgroundTasks,
+    service: PracticeService = Depends(get_practice_service),
+    plans: SessionPlanStore = Depends(get_session_plan_store),
+    history_repo: AsyncRecentHistoryRepository = Depends(get_recent_history_repo),
+) -> PracticeSessionResponse:
+    """Plan the next N questions of a mixed session in one call.
+
+    Inputs:
+        JSON payload with `count` (1-20, default 5).
+
+    Outputs:
+        Session id and items in serving order. Items drawn from the question
+        bank are `ready`; items that need a new question are `pending` and are
+        generated in the background (poll `GET /practice/session/{id}`).
+
+    Error cases:
+        - 409 if no concepts are due.
+    """
+
+    now = utc_now()
+
+    recent_tag_history = await history_repo.recent_tag_history(limit=3)
+
+    try:
+        planned = await service.plan_session(recent_tag_history=recent_tag_history, count=payload.count, now=now)
+    except NoConceptsDue as exc:
         raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail={"error": {"code": "ai_unavailable", "message": str(exc)}},
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"error": {"code": "no_concepts_due", "message": str(exc)}},
         ) from exc
 
-    return PracticeSubmitResponse(attempt=result.attempt, progress=result.progress)
+    slots = [
+        SessionSlot(
+            concept_id=item.concept.id,
+            status="pending" if item.question is None else "ready",
+            question=item.question,
+        )
+        for item in planned
+    ]
+    plan = plans.create(slots, now=now)
+
+    pending = [(position, item.concept) for position, item in enumerate(planned) if item.question is None]
+    if pending:
+        background_tasks.add_task(_fill_pending_slots, service, plans, plan.id, pending)
+
+    return _session_response(plan)
+
+
+@router.get("/session/{session_id}", response_model=PracticeSessionResponse)
+async def get_session(
+    session_id: str,
+    plans: SessionPlanStore = Depends(get_session_plan_store),
+) -> PracticeSessionResponse:
+    """Return the current state of a planned session.
+
+    Error cases:
+        - 404 if the session is unknown or expired.
+    """
+
+    plan = plans.get(session_id)
+    if plan is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": {"code": "session_not_found", "message": "Session not found"}},
+        )
+
+    return _session_response(plan)
+
+
+class GenerationBudgetEntry(BaseModel):
+    spent: float
+    budget: float | None = Field(description="None when unlimited")
+    remaining: float | None
+
+
+class ConceptGenerationBudget(GenerationBudgetEntry):
+    concept_id: str
+
+
+class GenerationBudgetResponse(BaseModel):
+    unit: Literal["seconds", "tokens"]
+    window_seconds: float
+    load: float
+    load_factor: float
+    global_: GenerationBudgetEntry = Field(alias="global")
+    concepts: list[ConceptGenerationBudget]
+
+
+@router.get("/generation-budget", response_model=GenerationBudgetResponse, response_model_by_alias=True)
+async def generation_budget(
+    control: GenerationController = Depends(get_generation_controller),
+) -> GenerationBudgetResponse:
+    """Report question-generation spend and the current generate-versus-reuse pressure.
+
+    Outputs:
+        Global and per-concept spend in the rolling window (concepts with no
+        spend are omitted), plus the LLM load and the factor it applies to
+        `p_new`.
+
+    Error cases:
+        None expected.
+    """
+
+    return GenerationBudgetResponse.model_validate(control.report())
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import hmac
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+from pydantic import BaseModel
+
+from app.api.deps.container import get_app_settings
+from app.api.deps.profiling import get_profile_store
+from app.api.profiling import PROFILES_PATH, ProfileStore, RequestProfile
+from app.core.settings import Settings
+
+router = APIRouter(prefix=PROFILES_PATH, tags=["debug"])
+
+
+class ProfilePhase(BaseModel):
+    calls: int
+    seconds: float
+
+
+class ProfileFunction(BaseModel):
+    function: str
+    package: str
+    calls: int
+    self_seconds: float
+    cumulative_seconds: float
+
+
+class ProfileListItem(BaseModel):
+    id: str
+    method: str
+    path: str
+    status: int
+    started_at: datetime
+    duration_seconds: float
+
+
+class ProfileListResponse(BaseModel):
+    profiles: list[ProfileListItem]
+
+
+class ProfileResponse(ProfileListItem):
+    phases: dict[str, ProfilePhase]
+    packages: dict[str, float]
+    functions: list[ProfileFunction]
+
+
+def require_profiling_token(
+    x_profile_token: str | None = Header(default=None),
+    settings: Settings = Depends(get_app_settings),
+) -> None:
+    """Profiles expose internals: reading them needs the same token that enables profiling."""
+
+    if not x_profile_token or not hmac.compare_digest(x_profile_token.encode(), settings.profiling_token.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail={"error": {"code": "invalid_profile_token", "message": "Missing or wrong X-Profile-Token"}},
+        )
+
+
+def _list_item(profile: RequestProfile) -> ProfileListItem:
+    return ProfileListItem(
+        id=profile.id,
+        method=profile.method,
+        path=profile.path,
+        status=profile.status,
+        started_at=profile.started_at,
+        duration_seconds=profile.duration_seconds,
+    )
+
+
+@router.get("", response_model=ProfileListResponse, dependencies=[Depends(require_profiling_token)])
+async def list_profiles(store: ProfileStore = Depends(get_profile_store)) -> ProfileListResponse:
+    """List the stored request profiles, newest first.
+
+    Outputs:
+        Id, method, path, status, start time and duration of each profile.
+
+    Error cases:
+        - 403 without the profiling token.
+    """
+
+    return ProfileListResponse(profiles=[_list_item(profile) for profile in store.recent()])
+
+
+@router.get("/{profile_id}", response_model=ProfileResponse, dependencies=[Depends(require_profiling_token)])
+async def get_profile(profile_id: str, store: ProfileStore = Depends(get_profile_store)) -> ProfileResponse:
+    """Return one request profile (id from the `X-Profile-Id` response header).
+
+    Outputs:
+        Wall time per phase (`storage`, `llm_queue`, `llm`), self time per
+        top-level package, and the functions with the most self time.
+
+    Error cases:
+        - 403 without the profiling token.
+        - 404 if the profile is unknown or was evicted.
+    """
+
+    profile = store.get(profile_id)
+    if profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": {"code": "profile_not_found", "message": "Profile not found"}},
+        )
+
+    summary = profile.summary
+    return ProfileResponse(
+        **_list_item(profile).model_dump(),
+        phases={name: ProfilePhase(calls=phase.calls, seconds=phase.seconds) for name, phase in summary.phases.items()},
+        packages=summary.packages,
+        functions=[
+            ProfileFunction(
+                function=stat.function,
+                package=stat.package,
+                calls=stat.calls,
+                self_seconds=stat.self_seconds,
+                cumulative_seconds=stat.cumulative_seconds,
+            )
+            for stat in summary.functions
+        ],
+    )
@@ -2,13 +2,17 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
 from pydantic import BaseModel
 
-from app.api.deps.practice_repos import get_concepts_repo, get_progress_repo
+from app.api.conditional import etag_matches, is_not_modified, not_modified, validator_headers
+from app.api.responses import FastJSONResponse, dump_json
+from app.api.deps.practice_repos import get_concepts_repo, get_progress_repo, get_progress_view_cache
 from app.domain.practice.models import ConceptProgress
+from app.domain.practice.progress_view import ProgressView, ProgressViewCache, ProgressViewEntry, is_view_version
 from app.domain.practice.selection import is_due
 from app.domain.practice.scheduling import utc_now
+from app.infra.repositories.async_repositories import AsyncConceptsRepository, AsyncProgressRepository
 from app.infra.repositories.concepts_repository import ConceptsRepository
 from app.infra.repositories.progress_repository import ProgressRepository
 
@@ -23,35 +27,198 @@ class ProgressItem(BaseModel):
 
 class ProgressListResponse(BaseModel):
     items: list[ProgressItem]
+    version: str
+    partial: bool = False
+
+
+def _synced_progress_view(
+    cache: ProgressViewCache,
+    *,
+    concepts_repo: ConceptsRepository,
+    progress_repo: ProgressRepository,
+    now: datetime,
+) -> ProgressView:
+    """Bring the cached view up to date with storage and the clock.
+
+    Callers must hold `cache.lock`. Only changed rows are touched unless the
+    view has to be rebuilt (first use, or files changed outside the app).
+
+    The progress cursor is read before any data, so writes racing with a
+    rebuild are replayed on the next call (re-applying a row is a no-op).
+    """
+
+    generation, revision = cache.progress_cursor or (-1, -1)
+    changes = progress_repo.changes_since(generation=generation, revision=revision)
+    concepts_signature = concepts_repo.signature()
+
+    view = cache.view
+    if view is not None and changes.changed is not None:
+        for progress in changes.changed.values():
+            view.apply_progress(progress)
+        if concepts_signature != cache.concepts_signature and not view.set_concepts(concepts_repo.concept_ids()):
+            view = None
+    else:
+        view = None
+
+    if view is None:
+        cache.row_json.clear()
+        view = ProgressView(
+            concept_ids=concepts_repo.concept_ids(),
+            progress_by_concept_id=progress_repo.get_all(),
+            now=now,
+        )
+
+    view.advance(now)
+    cache.view = view
+    cache.concepts_signature = concepts_signature
+    cache.progress_cursor = (changes.generation, changes.revision)
+    return view
+
+
+def _progress_body(
+    cache: ProgressViewCache, entries: list[ProgressViewEntry], *, version: str, partial: bool
+) -> bytes:
+    """Serialize a `ProgressListResponse` from per-row JSON fragments.
+
+    Fragments are cached per row and only re-serialized when the row's `seq`
+    changes, so a new version costs one join instead of one model per row.
+    Callers must hold `cache.lock`.
+    """
+
+    fragments: list[bytes] = []
+    for entry in entries:
+        cached = cache.row_json.get(entry.concept_id)
+        if cached is None or cached[0] != entry.seq:
+            item = ProgressItem(concept_id=entry.concept_id, progress=entry.progress, is_due=entry.is_due)
+            cached = (entry.seq, dump_json(item))
+            cache.row_json[entry.concept_id] = cached
+        fragments.append(cached[1])
+
+    tail = dump_json({"version": version, "partial": partial})
+    return b'{"items":[' + b",".join(fragments) + b"]," + tail[1:]
+
+
+def _render_progress(
+    cache: ProgressViewCache,
+    *,
+    concepts_repo: ConceptsRepository,
+    progress_repo: ProgressRepository,
+    now: datetime,
+    since: str | None,
+    if_none_match: str | None,
+) -> tuple[bytes | None, str]:
+    """Sync the view and build the `GET /progress` body (storage thread).
+
+    Inputs:
+        since: A version already checked with `is_view_version` (it becomes
+            part of the ETag), or None.
+
+    Returns:
+        `(body, etag)`; `body` is None when `If-None-Match` matches.
+    """
+
+    with cache.lock:
+        view = _synced_progress_view(cache, concepts_repo=concepts_repo, progress_repo=progress_repo, now=now)
+        version = view.version
+        etag = f'"{version}"' if since is None else f'"{version};since={since}"'
+
+        if etag_matches(if_none_match, etag):
+            return None, etag
+
+        if since is None:
+            if cache.body_version != version:
+                cache.body = _progress_body(cache, view.entries(), version=version, partial=False)
+                cache.body_version = version
+            return cache.body, etag
+
+        changed = view.changed_since(since)
+        if changed is None:
+            return _progress_body(cache, view.entries(), version=version, partial=False), etag
+        return _progress_body(cache, changed, version=version, partial=True), etag
 
 
 @router.get("/progress", response_model=ProgressListResponse)
-def list_progress(
-    concepts_repo: ConceptsRepository = Depends(get_concepts_repo),
-    progress_repo: ProgressRepository = Depends(get_progress_repo),
-) -> ProgressListResponse:
+async def list_progress(
+    since: str | None = Query(default=None, description="`version` of a previous response"),
+    if_none_match: str | None = Header(default=None),
+    concepts_repo: AsyncConceptsRepository = Depends(get_concepts_repo),
+    progress_repo: AsyncProgressRepository = Depends(get_progress_repo),
+    view_cache: ProgressViewCache = Depends(get_progress_view_cache),
+) -> Response:
     """List per-concept progress.
 
     Notes:
         - Returns progress entries for all concepts.
         - If a concept has no stored progress yet, returns default progress values.
+        - Served from a materialized view updated incrementally on progress
+          writes, new concepts and expiring cooldowns.
+        - Strong `ETag`; `If-None-Match` returns 304 without building a body.
+        - `since=<version>` returns only rows changed after that version
+          (`partial: true`); an unknown version returns every row.
+        - Versions and ETags are per process (see `ProgressView`).
+
+    Error cases:
+        - 400 `invalid_since` if `since` is not a `<epoch>.<seq>` version.
     """
 
-    now = utc_now()
-    progress_by = progress_repo.get_all()
-
-    items: list[ProgressItem] = []
-    for concept in concepts_repo.list_concepts():
-        progress = progress_by.get(concept.id) or ConceptProgress(concept_id=concept.id)
-        items.append(
-            ProgressItem(
-                concept_id=concept.id,
-                progress=progress,
-                is_due=is_due(progress, now=now),
-            )
+    if since is not None and not is_view_version(since):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={"error": {"code": "invalid_since", "message": "since must be a version from a previous response"}},
         )
 
-    return ProgressListResponse(items=items)
+    body, etag = await progress_repo.executor.run(
+        _render_progress,
+        view_cache,
+        concepts_repo=concepts_repo.sync,
+        progress_repo=progress_repo.sync,
+        now=utc_now(),
+        since=since,
+        if_none_match=if_none_match,
+    )
+    if body is None:
+        return not_modified(etag)
+
+    return FastJSONResponse(content=body, headers={"ETag": etag})
+
+
+class ForecastDay(BaseModel):
+    start: datetime
+    end: datetime
+    count: int
+
+
+class ProgressForecastResponse(BaseModel):
+    generated_at: datetime
+    bucket_minutes: int
+    due_now: int
+    days: list[ForecastDay]
+
+
+@router.get("/progress/forecast", response_model=ProgressForecastResponse)
+async def get_progress_forecast(
+    days: int = Query(default=7, ge=1, le=60),
+    concepts_repo: AsyncConceptsRepository = Depends(get_concepts_repo),
+    progress_repo: AsyncProgressRepository = Depends(get_progress_repo),
+) -> ProgressForecastResponse:
+    """Forecast how many concepts become due per day.
+
+    Notes:
+        - Served from the due-time histogram; cost is O(buckets), not O(concepts).
+        - `due_now` includes concepts that were never practiced.
+        - Day windows are rolling 24h windows starting at the current bucket.
+    """
+
+    now = utc_now()
+    forecast, tracked = await progress_repo.due_forecast(now=now, windows=days)
+    never_practiced = max(0, await concepts_repo.count() - tracked)
+
+    return ProgressForecastResponse(
+        generated_at=now,
+        bucket_minutes=forecast.bucket_minutes,
+        due_now=forecast.due_now + never_practiced,
+        days=[ForecastDay(start=w.start, end=w.end, count=w.count) for w in forecast.windows],
+    )
 
 
 class ProgressGetResponse(BaseModel):
@@ -61,18 +228,28 @@ class ProgressGetResponse(BaseModel):
 
 
 @router.get("/concepts/{concept_id}/progress", response_model=ProgressGetResponse)
-def get_concept_progress(
+async def get_concept_progress(
     concept_id: str,
-    concepts_repo: ConceptsRepository = Depends(get_concepts_repo),
-    progress_repo: ProgressRepository = Depends(get_progress_repo),
-) -> ProgressGetResponse:
+    if_none_match: str | None = Header(default=None),
+    if_modified_since: str | None = Header(default=None),
+    concepts_repo: AsyncConceptsRepository = Depends(get_concepts_repo),
+    progress_repo: AsyncProgressRepository = Depends(get_progress_repo),
+) -> ProgressGetResponse | Response:
     """Get progress for a single concept.
 
     Error cases:
         - 404 if the concept does not exist.
+
+    Notes:
+        - `ETag` combines the concept id, the concepts and progress store
+          versions and the current `is_due`; `Last-Modified` also accounts
+          for the moment the cooldown expired.
+        - The concept is looked up (in the in-memory catalog) before the
+          conditional headers are evaluated, so a missing concept is a 404
+          whatever they say.
     """
 
-    concept = concepts_repo.get_concept(concept_id)
+    concept = await concepts_repo.get_concept(concept_id)
     if concept is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -80,6 +257,23 @@ def get_concept_progress(
         )
 
     now = utc_now()
-    progress = progress_repo.get(concept_id) or ConceptProgress(concept_id=concept_id)
+    concepts_version = await concepts_repo.version()
+    progress_version = await progress_repo.version()
+    progress = await progress_repo.get(concept_id) or ConceptProgress(concept_id=concept_id)
+    due = is_due(progress, now=now)
+
+    etag = f'"{concept.id}.{concepts_version.tag}.{progress_version.tag}.{int(due)}"'
+    modified = [concepts_version.modified_at, progress_version.modified_at]
+    if due and progress.next_due_at is not None:
+        modified.append(progress.next_due_at)
+    last_modified = max((value for value in modified if value is not None), default=None)
+
+    if is_not_modified(
+        if_none_match=if_none_match, if_modified_since=if_modified_since, etag=etag, last_modified=last_modified
+    ):
+        return not_modified(etag, last_modified)
 
-    return ProgressGetResponse(concept_id=concept_id, progress=progress, is_due=is_due(progress, now=now))
+    return FastJSONResponse(
+        content=ProgressGetResponse(concept_id=concept_id, progress=progress, is_due=due),
+        headers=validator_headers(etag, last_modified),
+    )
@@ -1,17 +1,24 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from pydantic import BaseModel
 
-from app.api.deps.llm import get_ollama_client
-from app.api.deps.practice_repos import get_concepts_repo, get_question_bank_repo, get_question_reports_repo
-from app.core.settings import get_settings
-from app.domain.practice.prompts import evaluator_prompt, generation_prompt
+from app.api.deps.practice_repos import (
+    get_concepts_repo,
+    get_question_bank_repo,
+    get_question_reports_repo,
+    get_report_jobs_repo,
+    get_report_worker,
+)
+from app.domain.practice.models import ReportJob, ReportJobStatus
+from app.domain.practice.report_jobs import ReportJobWorker
 from app.domain.practice.scheduling import utc_now
-from app.infra.llm.ollama_client import OllamaClient, OllamaUnavailable
-from app.infra.repositories.concepts_repository import ConceptsRepository
-from app.infra.repositories.question_bank_repository import QuestionBankRepository
-from app.infra.repositories.question_reports_repository import QuestionReportsRepository
+from app.infra.repositories.async_repositories import (
+    AsyncConceptsRepository,
+    AsyncQuestionBankRepository,
+    AsyncQuestionReportsRepository,
+    AsyncReportJobsRepository,
+)
 
 router = APIRouter(prefix="/questions", tags=["questions"])
 
@@ -20,97 +27,85 @@ class ReportRequest(BaseModel):
     reason: str | None = None
 
 
-class ReportResponse(BaseModel):
-    removed: bool
+class ReportAcceptedResponse(BaseModel):
+    job_id: str
+    status: ReportJobStatus
+    deduplicated: bool
 
 
-@router.post("/{question_id}/report", response_model=ReportResponse)
-def report_question(
+@router.post("/{question_id}/report", response_model=ReportAcceptedResponse, status_code=status.HTTP_202_ACCEPTED)
+async def report_question(
     question_id: str,
     payload: ReportRequest,
-    concepts_repo: ConceptsRepository = Depends(get_concepts_repo),
-    bank_repo: QuestionBankRepository = Depends(get_question_bank_repo),
-    reports_repo: QuestionReportsRepository = Depends(get_question_reports_repo),
-    ollama: OllamaClient = Depends(get_ollama_client),
-) -> ReportResponse:
+    response: Response,
+    concepts_repo: AsyncConceptsRepository = Depends(get_concepts_repo),
+    bank_repo: AsyncQuestionBankRepository = Depends(get_question_bank_repo),
+    reports_repo: AsyncQuestionReportsRepository = Depends(get_question_reports_repo),
+    jobs_repo: AsyncReportJobsRepository = Depends(get_report_jobs_repo),
+    worker: ReportJobWorker = Depends(get_report_worker),
+) -> ReportAcceptedResponse:
     """Report a question as poor.
 
     Behavior:
         - Always stores the report event.
-        - Re-evaluates the question via evaluator model.
-        - If evaluator confirms poor (pass=false): remove and return removed=true.
+        - Queues a background job that re-evaluates the question via the
+          evaluator model and, if confirmed poor (pass=false), removes it and
+          generates a replacement.
+        - Returns at once; poll `GET /questions/report-jobs/{job_id}`.
+
+    Error cases:
+        - 404 if the question (or its concept) does not exist.
+
+    Notes:
+        - While a job for the question is queued or running, further reports
+          join it (`deduplicated=true`) instead of queueing another one.
     """
 
-    settings = get_settings()
     now = utc_now()
 
-    reports_repo.append_report(question_id=question_id, reason=payload.reason, now=now)
+    await reports_repo.append_report(question_id=question_id, reason=payload.reason, now=now)
 
-    question = bank_repo.get_question(question_id)
+    question = await bank_repo.get_question(question_id)
     if question is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={"error": {"code": "question_not_found", "message": "Question not found"}},
         )
 
-    concept = concepts_repo.get_concept(question.concept_id)
+    concept = await concepts_repo.get_concept(question.concept_id)
     if concept is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail={"error": {"code": "concept_not_found", "message": "Concept not found"}},
         )
 
-    candidate = {
-        "question_text": question.question_text,
-        "model_answer": question.model_answer,
-        "rubric": question.rubric,
-    }
+    job, created = await jobs_repo.enqueue(question_id=question_id, concept_id=concept.id, now=now)
+    if created:
+        worker.notify()
 
-    try:
-        verdict = ollama.generate_json(
-            model=settings.ollama_evaluator_model,
-            prompt=evaluator_prompt(concept=concept, candidate=candidate),
-        )
-    except OllamaUnavailable as exc:
+    response.headers["Location"] = f"/questions/report-jobs/{job.id}"
+    return ReportAcceptedResponse(job_id=job.id, status=job.status, deduplicated=not created)
+
+
+@router.get("/report-jobs/{job_id}", response_model=ReportJob)
+async def get_report_job(
+    job_id: str,
+    jobs_repo: AsyncReportJobsRepository = Depends(get_report_jobs_repo),
+) -> ReportJob:
+    """Return the state of a question-report job.
+
+    Outputs:
+        The job: `status` (`queued`, `running`, `succeeded`, `failed`),
+        `attempts`, `removed` / `replaced` once known, and the last `error`.
+
+    Error cases:
+        - 404 if the job is unknown (or pruned long after finishing).
+    """
+
+    job = await jobs_repo.get(job_id)
+    if job is None:
         raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail={"error": {"code": "ai_unavailable", "message": str(exc)}},
-        ) from exc
-
-    if bool(verdict.get("pass")):
-        return ReportResponse(removed=False)
-
-    removed = bank_repo.remove_question(question_id)
-    # Best-effort replacement generation to keep the bank size stable.
-    try:
-        candidate = ollama.generate_json(
-            model=settings.ollama_generation_model,
-            prompt=generation_prompt(concept=concept),
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": {"code": "job_not_found", "message": "Report job not found"}},
         )
-
-        for _ in range(3):
-            replacement_verdict = ollama.generate_json(
-                model=settings.ollama_evaluator_model,
-                prompt=evaluator_prompt(concept=concept, candidate=candidate),
-            )
-            if bool(replacement_verdict.get("pass")):
-                break
-            candidate = ollama.generate_json(
-                model=settings.ollama_generation_model,
-                prompt=generation_prompt(concept=concept),
-            )
-
-        if bool(replacement_verdict.get("pass")):
-            bank_repo.upsert_question(
-                concept_id=concept.id,
-                question_text=str(candidate.get("question_text", "")).strip(),
-                model_answer=str(candidate.get("model_answer", "")).strip(),
-                rubric=str(candidate.get("rubric", "")).strip(),
-                now=now,
-            )
-    except OllamaUnavailable:
-        # AI is required for practice, but reporting should still be able to
-        # remove known-bad questions even if replacement generation is down.
-        pass
-
-    return ReportResponse(removed=removed)
+    return job
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import re
+from collections.abc import AsyncIterable, AsyncIterator, Iterator
+from itertools import islice
+from typing import Any
+
+from app.api.responses import dump_json
+from app.infra.storage.executor import StorageExecutor
+
+# Characters that matter when splitting a JSON array: string delimiters,
+# escapes (consumed as a pair), nesting brackets and element separators.
+_ARRAY_TOKENS = re.compile(rb'\\.|["\[\]{},]', re.DOTALL)
+
+
+class _JsonArraySplitter:
+    """Incrementally split a top-level JSON array into raw element bytes.
+
+    Elements are not parsed, only delimited; callers validate each one (e.g.
+    with `model_validate_json`), so a bad element becomes a per-row error.
+    Only structural characters are visited, via one regex scan per chunk.
+    """
+
+    def __init__(self) -> None:
+        self._buf = b""
+        self._scan = 0
+        self._start = 0
+        self._depth = 0
+        self._in_string = False
+        self._opened = False
+        self._closed = False
+        self._separators = 0
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Add a chunk; return the elements completed by it.
+
+        Raises:
+            ValueError: if the body is not a JSON array.
+        """
+
+        if self._closed:
+            if chunk.strip():
+                raise ValueError("Unexpected data after the JSON array")
+            return []
+
+        self._buf += chunk
+        out: list[bytes] = []
+        last_end = self._scan
+
+        for match in _ARRAY_TOKENS.finditer(self._buf, self._scan):
+            last_end = match.end()
+            token = match.group()
+            if len(token) == 2:  # escape pair
+                continue
+            if self._in_string:
+                if token == b'"':
+                    self._in_string = False
+                continue
+            if token == b'"':
+                self._in_string = True
+            elif token in b"[{":
+                if not self._opened:
+                    if token != b"[" or self._buf[: match.start()].strip():
+                        raise ValueError("Expected a JSON array")
+                    self._opened = True
+                    self._start = match.end()
+                self._depth += 1
+            elif token in b"]}":
+                self._depth -= 1
+                if self._depth == 0:
+                    element = self._buf[self._start : match.start()]
+                    if element.strip() or self._separators:
+                        out.append(element)
+                    self._closed = True
+                    rest = self._buf[match.end() :]
+                    self._buf = b""
+                    if rest.strip():
+                        raise ValueError("Unexpected data after the JSON array")
+                    return out
+            elif self._depth == 1:  # element separator
+                out.append(self._buf[self._start : match.start()])
+                self._start = match.end()
+                self._separators += 1
+
+        if not self._opened and self._buf.strip():
+            raise ValueError("Expected a JSON array")
+
+        # Resume after the last structural character, unless the chunk ended
+        # inside an escape sequence (`\` whose escaped byte is still to come).
+        self._scan = len(self._buf)
+        if self._in_string and self._buf.endswith(b"\\") and last_end < len(self._buf):
+            self._scan -= 1
+
+        # Drop bytes of elements already emitted.
+        self._buf = self._buf[self._start :]
+        self._scan -= self._start
+        self._start = 0
+        return out
+
+    def close(self) -> None:
+        """Raise ValueError if the array was not terminated."""
+
+        if not self._closed:
+            raise ValueError("Unterminated JSON array")
+
+
+async def iter_json_array(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Yield the raw bytes of each element of a streamed JSON array.
+
+    Raises:
+        ValueError: if the body is not a (complete) JSON array.
+    """
+
+    splitter = _JsonArraySplitter()
+    async for chunk in chunks:
+        for element in splitter.feed(chunk):
+            yield element
+    splitter.close()
+
+
+async def iter_ndjson(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Yield each non-blank line of a streamed NDJSON body."""
+
+    pending = b""
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+    if pending.strip():
+        yield pending
+
+
+def _ndjson_chunk(records: Iterator[Any], size: int) -> bytes:
+    return b"".join(dump_json(record) + b"\n" for record in islice(records, size))
+
+
+async def ndjson_stream(
+    executor: StorageExecutor, records: Iterator[Any], *, batch_size: int = 256
+) -> AsyncIterator[bytes]:
+    """Serialize `records` as NDJSON, `batch_size` records per chunk.
+
+    Notes:
+        - The iterator is advanced (and each batch serialized) on the storage
+          executor, so file-backed iterators never block the event loop.
+        - Only one batch is held in memory at a time.
+        - If the client disconnects, the iterator is closed (releasing its
+          file handle) unless a batch is still in flight, in which case it is
+          released when garbage-collected.
+    """
+
+    try:
+        while True:
+            chunk = await executor.run(_ndjson_chunk, records, batch_size)
+            if not chunk:
+                return
+            yield chunk
+    finally:
+        close = getattr(records, "close", None)
+        if close is not None:
+            try:
+                close()
+            except ValueError:  # generator still running on a storage thread
+                pass
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Iterable, Sequence
+from typing import TypeVar
+
+# Latency buckets in seconds: sub-millisecond storage reads up to multi-minute LLM calls.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0,
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+    @abstractmethod
+    def render(self) -> list[str]:
+        """Return the exposition lines of this metric (header included)."""
+
+
+class _ValueMetric(_Metric):
+    """One float per label-value tuple (shared by `Counter` and `Gauge`)."""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        lines = self._header()
+        for labels, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Counter(_ValueMetric):
+    """Monotonic counter, one series per label-value tuple."""
+
+    kind = "counter"
+
+
+class Gauge(_ValueMetric):
+    """Value that can go up and down, one series per label-value tuple."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, help, labelnames)
+        if not labelnames:
+            self._values[()] = 0.0
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+    def set(self, value: float, *labels: str) -> None:
+        with self._lock:
+            self._values[labels] = float(value)
+
+
+class Histogram(_Metric):
+    """Bucketed distribution (Prometheus `histogram`), one series per label-value tuple.
+
+    Notes:
+        `observe` is O(log buckets): one bisect plus three increments under
+        the metric's lock. Buckets are stored non-cumulatively and summed at
+        render time.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, help: str, labelnames: Sequence[str] = (), *, buckets: Iterable[float] = DEFAULT_BUCKETS
+    ) -> None:
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [bucket counts..., +Inf count], sum
+        self._series: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = ([0] * (len(self.buckets) + 1), [0.0])
+                self._series[labels] = series
+            series[0][index] += 1
+            series[1][0] += value
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return 0 if series is None else sum(series[0])
+
+    def render(self) -> list[str]:
+        with self._lock:
+            items = sorted((labels, (list(counts), total[0])) for labels, (counts, total) in self._series.items())
+        lines = self._header()
+        for labels, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                bucket_labels = _format_labels(self.labelnames, labels, 'le="' + le + '"')
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            suffix = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{suffix} {_format_value(total)}")
+            lines.append(f"{self.name}_count{suffix} {cumulative}")
+        return lines
+
+
+M = TypeVar("M", bound=_Metric)
+
+
+class MetricsRegistry:
+    """Ordered collection of metrics rendered together on `/metrics`."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+
+    def register(self, metric: M) -> M:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, help, labelnames))
+
+    def histogram(
+        self, name: str, help: str, labelnames: Sequence[str] = (), *, buckets: Iterable[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, help, labelnames, buckets=buckets))
+
+    def render(self) -> str:
+        """Return all metrics in the Prometheus text exposition format (0.0.4)."""
+
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Process-wide registry. Storage and LLM clients record into it directly so
+# they need no extra wiring; the HTTP middleware and `/metrics` use it too.
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template", ("method", "route")
+)
+HTTP_REQUESTS_IN_FLIGHT = REGISTRY.gauge("http_requests_in_flight", "HTTP requests currently being served")
+HTTP_RESPONSES = REGISTRY.counter(
+    "http_responses_total", "HTTP responses by route template and status code", ("method", "route", "status")
+)
+STORAGE_OPERATION_DURATION = REGISTRY.histogram(
+    "storage_operation_duration_seconds", "YAML storage reads and writes", ("operation", "file")
+)
+LLM_REQUEST_DURATION = REGISTRY.histogram(
+    "llm_request_duration_seconds", "Ollama calls by model and outcome", ("model", "outcome")
+)
+LLM_QUEUE_WAIT = REGISTRY.histogram(
+    "llm_queue_wait_seconds", "Time LLM calls waited for a scheduler slot", ("model", "priority")
+)
+LLM_QUEUE_DEPTH = REGISTRY.gauge("llm_queue_depth", "LLM calls waiting for a scheduler slot", ("priority",))
+LLM_REJECTED = REGISTRY.counter(
+    "llm_rejected_total", "LLM calls refused by admission control", ("priority", "reason")
+)
+LLM_BACKEND_REQUESTS = REGISTRY.counter(
+    "llm_backend_requests_total", "Ollama calls by backend and outcome", ("backend", "outcome")
+)
+LLM_BACKEND_OUTSTANDING = REGISTRY.gauge(
+    "llm_backend_outstanding", "Ollama calls in flight per backend", ("backend",)
+)
+LLM_BACKEND_HEALTHY = REGISTRY.gauge(
+    "llm_backend_healthy", "1 if the backend receives traffic, 0 if ejected", ("backend",)
+)
+LLM_BACKEND_EJECTIONS = REGISTRY.counter(
+    "llm_backend_ejections_total", "Times a backend was ejected after failures", ("backend",)
+)
+PRACTICE_PREFETCH = REGISTRY.counter(
+    "practice_prefetch_total",
+    "Speculative question generation (generated, hit, miss, failed, budget_exhausted)",
+    ("result",),
+)
+PRACTICE_GENERATION_DECISIONS = REGISTRY.counter(
+    "practice_generation_decisions_total",
+    "Bank draws by decision, one per draw (generate, reuse, forced: empty bank generating over budget)",
+    ("decision",),
+)
+PRACTICE_GENERATION_COST = REGISTRY.counter(
+    "practice_generation_cost_total", "LLM cost of question generation", ("unit",)
+)
+REPORT_JOBS = REGISTRY.counter(
+    "report_jobs_total", "Question-report job runs by result (succeeded, failed, retried)", ("result",)
+)
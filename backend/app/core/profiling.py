@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import cProfile
+import pstats
+import re
+import sysconfig
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TypeVar
+
+T = TypeVar("T")
+
+_APP_PARENT = str(Path(__file__).resolve().parents[2])  # the directory holding the `app` package
+_STDLIB = sysconfig.get_paths()["stdlib"]
+# C functions have no file; cProfile names them e.g. "<method 'poll' of 'select.epoll' objects>"
+# or "<built-in method builtins.exec>".
+_C_OWNER = re.compile(r"of '([\w.]+)' objects|built-in method ([\w.]+)")
+
+
+@dataclass(frozen=True)
+class FunctionStat:
+    """One profiled function.
+
+    Fields:
+        function: `path:line(name)`, the path relative to site-packages, the
+            standard library or the backend directory.
+        package: Top-level package the function belongs to (`app`, `yaml`,
+            `pydantic_core`, `asyncio`, ...).
+        calls: Primitive plus recursive calls.
+        self_seconds: Time spent in the function itself.
+        cumulative_seconds: Time including callees.
+    """
+
+    function: str
+    package: str
+    calls: int
+    self_seconds: float
+    cumulative_seconds: float
+
+
+@dataclass(frozen=True)
+class PhaseStat:
+    """Wall time a request spent awaiting one kind of work (`storage`, `llm_queue`, `llm`)."""
+
+    calls: int
+    seconds: float
+
+
+@dataclass(frozen=True)
+class ProfileSummary:
+    """Condensed result of a `ProfileSession`.
+
+    Fields:
+        phases: Wall time per phase.
+        packages: Self time per top-level package, highest first.
+        functions: The functions with the most self time, highest first.
+    """
+
+    phases: dict[str, PhaseStat]
+    packages: dict[str, float]
+    functions: list[FunctionStat]
+
+
+def _short_path(filename: str) -> str:
+    for marker in ("site-packages/", "dist-packages/"):
+        _, sep, rest = filename.rpartition(marker)
+        if sep:
+            return rest
+    for root in (_APP_PARENT, _STDLIB):
+        if filename.startswith(root + "/"):
+            return filename[len(root) + 1 :]
+    return filename
+
+
+def _package(filename: str, name: str) -> str:
+    if filename == "~":
+        match = _C_OWNER.search(name)
+        owner = (match.group(1) or match.group(2)) if match else ""
+        return owner.split(".")[0] if "." in owner else "builtins"  # methods of str, dict, type, ...
+    if filename.startswith("<frozen "):
+        return filename.removeprefix("<frozen ").removesuffix(">").split(".")[0]
+    return _short_path(filename).split("/", 1)[0].removesuffix(".py")
+
+
+class ProfileSession:
+    """Profile of one request in progress.
+
+    Purpose:
+        Collect deterministic (`cProfile`) profiles from the event loop and
+        from the storage threads that work for the request, plus wall time
+        per phase, and condense them into a `ProfileSummary`.
+
+    Notes:
+        - Code that awaits storage or the LLM reports its wall time with
+          `record_phase`; storage work runs on its thread under `call`.
+        - Phases and thread profiles are only collected while `active`;
+          work that outlives the response (background tasks) is not.
+        - Thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self.active = True
+        self._lock = threading.Lock()
+        self._profilers: list[cProfile.Profile] = []
+        self._phases: dict[str, list[float]] = {}
+
+    def add(self, profiler: cProfile.Profile) -> None:
+        with self._lock:
+            self._profilers.append(profiler)
+
+    def record_phase(self, name: str, seconds: float) -> None:
+        with self._lock:
+            phase = self._phases.setdefault(name, [0, 0.0])
+            phase[0] += 1
+            phase[1] += seconds
+
+    def call(self, fn: Callable[[], T]) -> T:
+        """Run `fn` on the current (worker) thread under a profiler of its own."""
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:  # Python 3.12+: the request's profiler already covers every thread
+            return fn()
+        try:
+            return fn()
+        finally:
+            profiler.disable()
+            self.add(profiler)
+
+    def summary(self, *, top: int = 30) -> ProfileSummary:
+        """Merge the collected profiles (all profilers must be disabled)."""
+
+        with self._lock:
+            profilers = list(self._profilers)
+            phases = {
+                name: PhaseStat(calls=int(calls), seconds=round(seconds, 6))
+                for name, (calls, seconds) in self._phases.items()
+            }
+
+        functions: list[FunctionStat] = []
+        packages: dict[str, float] = {}
+        if profilers:
+            stats = pstats.Stats(profilers[0])
+            for profiler in profilers[1:]:
+                stats.add(profiler)
+            raw: dict = stats.stats  # type: ignore[attr-defined]
+            for (filename, line, name), (_, calls, self_seconds, cumulative, _) in raw.items():
+                package = _package(filename, name)
+                packages[package] = packages.get(package, 0.0) + self_seconds
+                label = name if filename == "~" else f"{_short_path(filename)}:{line}({name})"
+                functions.append(FunctionStat(label, package, calls, round(self_seconds, 6), round(cumulative, 6)))
+
+        functions.sort(key=lambda stat: stat.self_seconds, reverse=True)
+        return ProfileSummary(
+            phases=phases,
+            packages={
+                package: round(seconds, 6)
+                for package, seconds in sorted(packages.items(), key=lambda item: item[1], reverse=True)
+            },
+            functions=functions[:top],
+        )
+
+
+_current: ContextVar[ProfileSession | None] = ContextVar("profile_session", default=None)
+
+
+@contextmanager
+def profile_session(session: ProfileSession) -> Iterator[ProfileSession]:
+    """Make `session` the active profile for this context (task) and the tasks it starts."""
+
+    token = _current.set(session)
+    try:
+        yield session
+    finally:
+        _current.reset(token)
+
+
+def current_profile() -> ProfileSession | None:
+    """The active profile session, if the current request is being profiled."""
+
+    session = _current.get()
+    return session if session is not None and session.active else None
+
+
+def record_phase(name: str, seconds: float) -> None:
+    """Add wall time to a phase of the active profile, if any (a context lookup otherwise)."""
+
+    session = current_profile()
+    if session is not None:
+        session.record_phase(name, seconds)
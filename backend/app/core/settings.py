@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -28,6 +31,10 @@ class Settings(BaseSettings):
     data_dir: str = Field(default="../data", description="Path to the YAML data directory")
 
     ollama_base_url: str = Field(default="http://localhost:11434", description="Ollama base URL")
+    ollama_backends: str = Field(
+        default="",
+        description="Comma-separated Ollama servers `url[=model|model]`; empty uses OLLAMA_BASE_URL only",
+    )
     ollama_generation_model: str = Field(
         default="qwen2.5:14b",
         description="Placeholder generation/grading model name (can be changed later)",
@@ -37,17 +44,168 @@ class Settings(BaseSettings):
         description="Placeholder evaluator model name (can be changed later)",
     )
 
+    ollama_max_concurrency: int = Field(
+        default=2,
+        ge=1,
+        description="Maximum concurrent calls per Ollama backend; further LLM work waits without holding a thread",
+    )
+    ollama_model_concurrency: str = Field(
+        default="",
+        description="Per-model concurrency limits, e.g. `qwen2.5:14b=1,llama3.1:8b=2` (others: OLLAMA_MAX_CONCURRENCY)",
+    )
+    ollama_eject_after_failures: int = Field(
+        default=2,
+        ge=1,
+        description="Consecutive connection errors/5xx after which a backend stops receiving traffic",
+    )
+    ollama_health_interval_seconds: float = Field(
+        default=10.0,
+        ge=0,
+        description="Seconds between backend health checks (re-adds recovered backends); 0 disables them",
+    )
+    ollama_cassette_mode: Literal["off", "record", "replay"] = Field(
+        default="off",
+        description="Record Ollama responses to a cassette, or replay them instead of calling Ollama (benchmarks)",
+    )
+    ollama_cassette_path: str = Field(
+        default="",
+        description="Cassette file (NDJSON, gzip if it ends in .gz); empty: DATA_DIR/ollama_cassette.ndjson.gz",
+    )
+    ollama_cassette_latency_scale: float = Field(
+        default=1.0,
+        ge=0,
+        description="Replay delay as a multiple of the recorded latency; 0 replays instantly",
+    )
+    llm_max_queue_depth: int = Field(
+        default=32,
+        ge=0,
+        description="LLM calls allowed to wait for a slot; beyond that requests get 429 (lower-priority waiters are shed first)",
+    )
+    llm_queue_timeout_seconds: float = Field(
+        default=120.0,
+        gt=0,
+        description="Longest an LLM call waits for a slot before failing with 503",
+    )
+
+    storage_workers: int = Field(
+        default=4,
+        ge=1,
+        description="Threads in the dedicated executor that runs blocking YAML storage work",
+    )
+
+    practice_random_seed: int | None = Field(
+        default=None,
+        description="Seed for concept/question selection; set it for repeatable benchmark runs",
+    )
+
+    recent_history_size: int = Field(
+        default=10,
+        ge=1,
+        description="Number of recently served/answered questions kept for tag continuity",
+    )
+
+    prefetch_concepts: int = Field(
+        default=2,
+        ge=0,
+        description="Likely next concepts given a question ahead of time after each served question; 0 disables",
+    )
+    prefetch_max_generations_per_hour: int = Field(
+        default=30,
+        ge=0,
+        description="LLM budget for speculative question generation (questions per rolling hour)",
+    )
+
+    generation_budget_unit: Literal["seconds", "tokens"] = Field(
+        default="seconds",
+        description="Unit of the generation budgets: Ollama compute seconds or prompt+output tokens",
+    )
+    generation_budget_per_hour: float = Field(
+        default=0.0,
+        ge=0,
+        description="LLM budget for question generation across all concepts per rolling hour; 0 is unlimited",
+    )
+    generation_concept_budget_per_hour: float = Field(
+        default=0.0,
+        ge=0,
+        description="LLM budget for question generation per concept per rolling hour; 0 is unlimited",
+    )
+    generation_idle_boost: float = Field(
+        default=1.5,
+        ge=1,
+        description="Multiplier on p_new while the LLM is idle (falls to 1 at saturation, below 1 when queueing)",
+    )
+
+    idempotency_ttl_seconds: float = Field(
+        default=86_400.0,
+        gt=0,
+        description="How long a completed /practice/submit response is replayed for its Idempotency-Key",
+    )
+    idempotency_max_entries: int = Field(
+        default=1_000,
+        ge=1,
+        description="Completed Idempotency-Key responses kept in memory (oldest evicted first)",
+    )
+
+    report_job_workers: int = Field(
+        default=1,
+        ge=0,
+        description="Question-report jobs processed concurrently; 0 leaves jobs queued",
+    )
+    report_job_max_attempts: int = Field(
+        default=5,
+        ge=1,
+        description="Attempts per question-report job before it is marked failed",
+    )
+    report_job_backoff_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="First retry delay after Ollama is unavailable; doubles per attempt",
+    )
+    report_job_max_backoff_seconds: float = Field(
+        default=900.0,
+        gt=0,
+        description="Upper bound for the question-report retry delay",
+    )
+
+    metrics_enabled: bool = Field(
+        default=True,
+        description=(
+            "Time HTTP requests and expose all metrics on /metrics; storage, LLM and practice metrics are "
+            "recorded in-process either way"
+        ),
+    )
+    profiling_token: str = Field(
+        default="",
+        description="Profile requests sending this token (X-Profile-Token or ?profile_token=); empty disables profiling",
+    )
+    profiling_max_profiles: int = Field(
+        default=50,
+        ge=1,
+        description="Request profiles kept for GET /debug/profiles (oldest evicted first)",
+    )
+    profiling_top_functions: int = Field(
+        default=30,
+        ge=1,
+        description="Functions (by self time) kept in each request profile",
+    )
+
     cors_allow_origins: str = Field(
         default="http://localhost:5173,http://127.0.0.1:5173",
         description="Comma-separated list of allowed CORS origins",
     )
 
 
+@lru_cache
 def get_settings() -> Settings:
-    """Return the current settings.
+    """Return the process-wide settings.
 
-    This function exists so future changes (caching, overrides in tests) have a
-    single place to hook into.
+    Notes:
+        - Parsed once: building `Settings` re-reads the environment and `.env`
+          (~0.5ms), so it must not happen per request.
+        - Request handlers read settings from the app container instead (see
+          `app.api.deps.container`), which tests can build from their own
+          `Settings`; call `get_settings.cache_clear()` after changing the
+          environment.
     """
 
     return Settings()
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.domain.concepts import Concept
+
+# Sort key of the listing order: oldest first, ties broken by id.
+CatalogKey = tuple[datetime, str]
+
+
+def catalog_key(concept: Concept) -> CatalogKey:
+    return (concept.created_at, concept.id)
+
+
+@dataclass(frozen=True)
+class ConceptPage:
+    """One page of concepts in `(created_at, id)` order.
+
+    Fields:
+        next_key: Key of the last item when more items follow, else None.
+    """
+
+    items: list[Concept]
+    next_key: CatalogKey | None
+
+
+class ConceptCatalog:
+    """In-memory, ordered view of all concepts.
+
+    Purpose:
+        Serve paginated / filtered concept listings without re-reading and
+        re-validating `concepts.yaml` per request.
+
+    Structure:
+        - `_by_id`: validated models.
+        - `_order`: sorted `(created_at, id)` keys (listing order).
+        - `_titles`: sorted `(casefolded title, id)` pairs for prefix search.
+
+    Complexity:
+        - Unfiltered page: O(log n + limit).
+        - Title-prefix or tag-filtered page: O(m log m) for m matches.
+
+    Notes:
+        Not thread-safe on its own; owners serialize access.
+    """
+
+    def __init__(self, concepts: Iterable[Concept] = ()) -> None:
+        self._by_id: dict[str, Concept] = {}
+        self._order: list[CatalogKey] = []
+        self._titles: list[tuple[str, str]] = []
+        self.reset(concepts)
+
+    def reset(self, concepts: Iterable[Concept]) -> None:
+        """Replace the catalog contents with `concepts`."""
+
+        self._by_id = {concept.id: concept for concept in concepts}
+        self._order = sorted(catalog_key(concept) for concept in self._by_id.values())
+        self._titles = sorted((concept.title.casefold(), concept.id) for concept in self._by_id.values())
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def get(self, concept_id: str) -> Concept | None:
+        return self._by_id.get(concept_id)
+
+    def in_file_order(self) -> list[Concept]:
+        """Return every concept in insertion (file) order."""
+
+        return list(self._by_id.values())
+
+    def add(self, concept: Concept) -> None:
+        """Insert a new concept (O(n) worst case for the sorted lists, O(log n) when appended in order)."""
+
+        if concept.id in self._by_id:
+            self._remove(self._by_id[concept.id])
+        self._by_id[concept.id] = concept
+        insort(self._order, catalog_key(concept))
+        insort(self._titles, (concept.title.casefold(), concept.id))
+
+    def extend(self, concepts: Iterable[Concept]) -> None:
+        """Insert many new concepts, re-sorting once (O((n + k) log(n + k)))."""
+
+        for concept in concepts:
+            if concept.id in self._by_id:
+                self._remove(self._by_id[concept.id])
+            self._by_id[concept.id] = concept
+            self._order.append(catalog_key(concept))
+            self._titles.append((concept.title.casefold(), concept.id))
+        self._order.sort()
+        self._titles.sort()
+
+    def _remove(self, concept: Concept) -> None:
+        del self._order[bisect_left(self._order, catalog_key(concept))]
+        del self._titles[bisect_left(self._titles, (concept.title.casefold(), concept.id))]
+
+    def ids_with_title_prefix(self, prefix: str) -> set[str]:
+        """Return ids of concepts whose title starts with `prefix` (case-insensitive)."""
+
+        prefix = prefix.casefold()
+        out: set[str] = set()
+        for title, concept_id in self._titles[bisect_left(self._titles, (prefix, "")) :]:
+            if not title.startswith(prefix):
+                break
+            out.add(concept_id)
+        return out
+
+    def page(self, *, limit: int, after: CatalogKey | None = None, only: set[str] | None = None) -> ConceptPage:
+        """Return up to `limit` concepts after `after`, optionally restricted to the ids in `only`."""
+
+        limit = max(0, int(limit))
+
+        if only is None:
+            start = 0 if after is None else bisect_right(self._order, after)
+            keys = self._order[start : start + limit + 1]
+        else:
+            candidates = sorted(catalog_key(self._by_id[i]) for i in only if i in self._by_id)
+            start = 0 if after is None else bisect_right(candidates, after)
+            keys = candidates[start : start + limit + 1]
+
+        has_more = len(keys) > limit
+        keys = keys[:limit]
+        return ConceptPage(
+            items=[self._by_id[concept_id] for _, concept_id in keys],
+            next_key=keys[-1] if has_more and keys else None,
+        )
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+from app.domain.practice.models import ConceptProgress
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class ForecastWindow:
+    """Number of concepts becoming due in `[start, end)`."""
+
+    start: datetime
+    end: datetime
+    count: int
+
+
+@dataclass(frozen=True)
+class DueForecast:
+    """Result of `DueHistogram.forecast`.
+
+    Fields:
+        due_now: Concepts due before the current bucket, plus stored progress
+            entries that were never scheduled (`next_due_at` missing).
+        windows: Consecutive windows starting at the current bucket.
+        bucket_minutes: Resolution of the window boundaries.
+    """
+
+    due_now: int
+    windows: tuple[ForecastWindow, ...]
+    bucket_minutes: int
+
+
+class DueHistogram:
+    """Count of scheduled concepts per fixed-width `next_due_at` bucket.
+
+    Purpose:
+        Answer "how many reviews are due today / tomorrow / this week?" in
+        O(buckets) instead of bucketing every progress entry per request.
+
+    Structure:
+        - `_bucket_of[concept_id]`: bucket of the concept's `next_due_at`.
+        - `_counts[bucket]`: number of concepts in that bucket (> 0).
+        - `_buckets`: sorted keys of `_counts`.
+
+    Invariants:
+        - Bucket `k` covers `[epoch + k * width, epoch + (k + 1) * width)`.
+        - Entries without `next_due_at` are counted in `_unscheduled` only.
+
+    Notes:
+        - Resolution is one bucket: concepts in the bucket containing `now` are
+          reported in the first window even if they are already due.
+        - Not thread-safe on its own; owners serialize access.
+    """
+
+    def __init__(self, progress: Iterable[ConceptProgress] = (), *, bucket_minutes: int = 60) -> None:
+        if bucket_minutes <= 0:
+            raise ValueError("bucket_minutes must be positive")
+        self._width = timedelta(minutes=bucket_minutes)
+        self._bucket_of: dict[str, int] = {}
+        self._counts: dict[int, int] = {}
+        self._buckets: list[int] = []
+        self._unscheduled: set[str] = set()
+        self.reset(progress)
+
+    @property
+    def bucket_minutes(self) -> int:
+        return int(self._width / timedelta(minutes=1))
+
+    def __len__(self) -> int:
+        """Return the number of progress entries tracked (scheduled or not)."""
+
+        return len(self._bucket_of) + len(self._unscheduled)
+
+    def reset(self, progress: Iterable[ConceptProgress]) -> None:
+        """Replace the histogram contents with `progress`."""
+
+        self._bucket_of = {}
+        self._counts = {}
+        self._buckets = []
+        self._unscheduled = set()
+        for item in progress:
+            self.upsert(item)
+
+    def _bucket(self, when: datetime) -> int:
+        return (when - _EPOCH) // self._width
+
+    def upsert(self, progress: ConceptProgress) -> None:
+        """Move one concept to the bucket of its current `next_due_at` (O(buckets) worst case)."""
+
+        concept_id = progress.concept_id
+        new_bucket = None if progress.next_due_at is None else self._bucket(progress.next_due_at)
+        old_bucket = self._bucket_of.get(concept_id)
+        if old_bucket is not None and old_bucket == new_bucket:
+            return
+
+        if old_bucket is not None:
+            del self._bucket_of[concept_id]
+            self._counts[old_bucket] -= 1
+            if not self._counts[old_bucket]:
+                del self._counts[old_bucket]
+                del self._buckets[bisect_left(self._buckets, old_bucket)]
+        self._unscheduled.discard(concept_id)
+
+        if new_bucket is None:
+            self._unscheduled.add(concept_id)
+            return
+
+        self._bucket_of[concept_id] = new_bucket
+        if new_bucket not in self._counts:
+            self._counts[new_bucket] = 0
+            insort(self._buckets, new_bucket)
+        self._counts[new_bucket] += 1
+
+    def forecast(self, *, now: datetime, windows: int, window_minutes: int = 1440) -> DueForecast:
+        """Return due counts for `windows` consecutive windows starting at `now`'s bucket.
+
+        Window boundaries are rounded up to whole buckets.
+        """
+
+        current = self._bucket(now)
+        per_window = max(1, -(-window_minutes // self.bucket_minutes))
+
+        start = bisect_left(self._buckets, current)
+        due_now = len(self._unscheduled) + sum(self._counts[b] for b in self._buckets[:start])
+
+        counts = [0] * max(0, windows)
+        for bucket in self._buckets[start:]:
+            offset = (bucket - current) // per_window
+            if offset >= len(counts):
+                break
+            counts[offset] += self._counts[bucket]
+
+        window_start = _EPOCH + current * self._width
+        step = per_window * self._width
+        return DueForecast(
+            due_now=due_now,
+            windows=tuple(
+                ForecastWindow(start=window_start + i * step, end=window_start + (i + 1) * step, count=count)
+                for i, count in enumerate(counts)
+            ),
+            bucket_minutes=self.bucket_minutes,
+        )
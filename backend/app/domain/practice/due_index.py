@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable
+from datetime import datetime
+
+from app.domain.practice.models import ConceptProgress
+
+
+class DueIndex:
+    """In-memory index of concept progress ordered by `next_due_at`.
+
+    Purpose:
+        Answer "which concepts are cooling down right now?" without scanning
+        every progress entry on every selection.
+
+    Structure:
+        - `_progress`: latest progress per concept id.
+        - `_heap`: min-heap of `(next_due_at, concept_id)` for cooling entries.
+        - `_cooling`: concept ids whose `next_due_at` is still in the future.
+
+    Invariants:
+        - A concept is due iff it is not in `_cooling` (matches `is_due`).
+        - Heap entries are lazily invalidated: an entry is only honored while it
+          still matches the concept's current `next_due_at`.
+        - Concepts without stored progress are due and never enter the index.
+
+    Notes:
+        - Advancing assumes `now` moves forward; if it moves backwards the
+          cooling set is rebuilt from `_progress` (O(n), rare).
+        - Not thread-safe on its own; owners serialize access.
+    """
+
+    def __init__(self, progress: Iterable[ConceptProgress] = ()) -> None:
+        self._progress: dict[str, ConceptProgress] = {}
+        self._heap: list[tuple[datetime, str]] = []
+        self._cooling: set[str] = set()
+        self._watermark: datetime | None = None
+        self.reset(progress)
+
+    def reset(self, progress: Iterable[ConceptProgress]) -> None:
+        """Replace the index contents with `progress`."""
+
+        self._progress = {item.concept_id: item for item in progress}
+        self._watermark = None
+        self._rebuild_cooling()
+
+    def _rebuild_cooling(self) -> None:
+        self._heap = [
+            (item.next_due_at, concept_id)
+            for concept_id, item in self._progress.items()
+            if item.next_due_at is not None
+        ]
+        heapq.heapify(self._heap)
+        self._cooling = {concept_id for _, concept_id in self._heap}
+
+    def upsert(self, progress: ConceptProgress) -> None:
+        """Insert or replace the progress for one concept (O(log n))."""
+
+        self._progress[progress.concept_id] = progress
+        self._cooling.discard(progress.concept_id)
+
+        if progress.next_due_at is None:
+            return
+        if self._watermark is not None and progress.next_due_at <= self._watermark:
+            return
+
+        heapq.heappush(self._heap, (progress.next_due_at, progress.concept_id))
+        self._cooling.add(progress.concept_id)
+
+    def advance(self, now: datetime) -> list[str]:
+        """Move the index clock to `now`.
+
+        Outputs:
+            Concept ids that became due since the previous call, in due order.
+        """
+
+        if self._watermark is not None and now < self._watermark:
+            self._rebuild_cooling()
+        self._watermark = now
+
+        became_due: list[str] = []
+        while self._heap and self._heap[0][0] <= now:
+            due_at, concept_id = heapq.heappop(self._heap)
+            current = self._progress.get(concept_id)
+            if current is None or current.next_due_at != due_at:
+                continue
+            if concept_id in self._cooling:
+                self._cooling.discard(concept_id)
+                became_due.append(concept_id)
+        return became_due
+
+    def cooling_ids(self, now: datetime) -> frozenset[str]:
+        """Return ids of concepts that are not due at `now`."""
+
+        self.advance(now)
+        return frozenset(self._cooling)
+
+    def is_due(self, concept_id: str, *, now: datetime) -> bool:
+        """Return True if `concept_id` is due at `now` (same rule as `is_due`)."""
+
+        self.advance(now)
+        return concept_id not in self._cooling
+
+    def get(self, concept_id: str) -> ConceptProgress | None:
+        """Return the indexed progress for `concept_id`, if any."""
+
+        return self._progress.get(concept_id)
+
+    def due_progress(self, now: datetime) -> dict[str, ConceptProgress]:
+        """Return progress entries of concepts that are due at `now`."""
+
+        self.advance(now)
+        return {
+            concept_id: item for concept_id, item in self._progress.items() if concept_id not in self._cooling
+        }
+
+    def all_progress(self) -> dict[str, ConceptProgress]:
+        """Return a shallow copy of every indexed progress entry."""
+
+        return dict(self._progress)
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Literal
+
+from app.core.metrics import PRACTICE_GENERATION_COST
+from app.infra.llm.usage import LLMUsage
+
+BudgetUnit = Literal["seconds", "tokens"]
+
+# The budget factor tapers from 1 to 0 over the last quarter of a budget,
+# so generation slows down before it stops.
+_TAPER = 0.25
+
+
+@dataclass(frozen=True)
+class BudgetUsage:
+    """Spend within the current window; `budget` and `remaining` are None when unlimited."""
+
+    spent: float
+    budget: float | None
+
+    @property
+    def remaining(self) -> float | None:
+        return None if self.budget is None else max(0.0, self.budget - self.spent)
+
+    @property
+    def factor(self) -> float:
+        if self.budget is None:
+            return 1.0
+        return min(1.0, self.remaining / (self.budget * _TAPER))
+
+
+class GenerationController:
+    """Adaptive generate-versus-reuse decision for the question bank.
+
+    Purpose:
+        Scale each concept's stored `p_new` by how busy the LLM is and how
+        much of the generation budget is left, so the bank is reused under
+        load and grown while the LLM is idle.
+
+    Rules (`p_new`):
+        - Load factor, from `load()` (running plus waiting LLM calls per
+          slot, see `LLMScheduler.load`): `idle_boost` when idle, falling
+          linearly to 1 at saturation, then `1 / load**2` while calls queue.
+        - Budget factor: the smaller of the global and the concept's factor;
+          each is 1 until the last quarter of its budget, then falls to 0.
+        - Effective `p_new = min(1, p_new * load factor * budget factor)`.
+
+    Budget:
+        - Generation cost (`LLMUsage.seconds` or `.tokens`, per `unit`) is
+          recorded per concept over a rolling `window_seconds`; a budget of
+          0 is unlimited.
+        - An exhausted budget makes `p_new` 0, but a concept with an empty
+          bank still generates (there is nothing to reuse).
+
+    Notes:
+        - Thread-safe: decisions run on the storage executor, cost is
+          recorded from the event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        unit: BudgetUnit = "seconds",
+        budget_per_window: float = 0.0,
+        concept_budget_per_window: float = 0.0,
+        window_seconds: float = 3600.0,
+        idle_boost: float = 1.5,
+        load: Callable[[], float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.unit = unit
+        self._budget = budget_per_window or None
+        self._concept_budget = concept_budget_per_window or None
+        self.window_seconds = window_seconds
+        self._idle_boost = max(1.0, idle_boost)
+        self._load = load or (lambda: 0.0)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._events: deque[tuple[float, str, float]] = deque()
+        self._spent = 0.0
+        self._spent_by_concept: dict[str, float] = {}
+
+    def _prune(self, now: float) -> None:
+        while self._events and now - self._events[0][0] >= self.window_seconds:
+            _, concept_id, amount = self._events.popleft()
+            self._spent -= amount
+            left = self._spent_by_concept[concept_id] - amount
+            if left <= 1e-9:
+                del self._spent_by_concept[concept_id]
+            else:
+                self._spent_by_concept[concept_id] = left
+        if not self._events:
+            self._spent = 0.0  # no float drift once the window empties
+
+    def record(self, concept_id: str, usage: LLMUsage) -> None:
+        """Charge one generation's LLM usage to `concept_id`."""
+
+        amount = float(usage.seconds if self.unit == "seconds" else usage.tokens)
+        if amount <= 0:
+            return
+        PRACTICE_GENERATION_COST.inc(self.unit, amount=amount)
+        with self._lock:
+            now = self._clock()
+            self._prune(now)
+            self._events.append((now, concept_id, amount))
+            self._spent += amount
+            self._spent_by_concept[concept_id] = self._spent_by_concept.get(concept_id, 0.0) + amount
+
+    def usage(self, concept_id: str | None = None) -> BudgetUsage:
+        """Spend in the window, globally or for one concept."""
+
+        with self._lock:
+            self._prune(self._clock())
+            if concept_id is None:
+                return BudgetUsage(spent=self._spent, budget=self._budget)
+            return BudgetUsage(spent=self._spent_by_concept.get(concept_id, 0.0), budget=self._concept_budget)
+
+    def allows(self, concept_id: str) -> bool:
+        """False once the global or the concept budget is exhausted."""
+
+        return self.usage().factor > 0 and self.usage(concept_id).factor > 0
+
+    def load_factor(self) -> float:
+        load = max(0.0, self._load())
+        if load <= 1.0:
+            return self._idle_boost - (self._idle_boost - 1.0) * load
+        return 1.0 / (load * load)
+
+    def p_new(self, concept_id: str, base_p_new: float) -> float:
+        """Effective probability of generating instead of reusing a bank question."""
+
+        budget_factor = min(self.usage().factor, self.usage(concept_id).factor)
+        return min(1.0, max(0.0, base_p_new * self.load_factor() * budget_factor))
+
+    def report(self) -> dict:
+        """Global and per-concept spend for the reporting endpoint (highest spenders first)."""
+
+        with self._lock:
+            self._prune(self._clock())
+            spent = self._spent
+            by_concept = sorted(self._spent_by_concept.items(), key=lambda item: item[1], reverse=True)
+
+        def entry(usage: BudgetUsage) -> dict:
+            return {"spent": usage.spent, "budget": usage.budget, "remaining": usage.remaining}
+
+        return {
+            "unit": self.unit,
+            "window_seconds": self.window_seconds,
+            "load": self._load(),
+            "load_factor": self.load_factor(),
+            "global": entry(BudgetUsage(spent=spent, budget=self._budget)),
+            "concepts": [
+                {"concept_id": concept_id, **entry(BudgetUsage(spent=amount, budget=self._concept_budget))}
+                for concept_id, amount in by_concept
+            ],
+        }
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -54,3 +56,42 @@ class QuestionReport(BaseModel):
     question_id: str
     reason: str | None = None
     created_at: datetime
+
+
+ReportJobStatus = Literal["queued", "running", "succeeded", "failed"]
+
+
+class ReportJob(BaseModel):
+    """Background handling of a reported question (re-evaluation, removal, replacement).
+
+    `removed` / `replaced` are None until that step has run. A job for a
+    question absorbs further reports while it is queued or running
+    (`reports` counts them).
+    """
+
+    id: str
+    question_id: str
+    concept_id: str
+    status: ReportJobStatus = "queued"
+    attempts: int = 0
+    reports: int = 1
+    removed: bool | None = None
+    replaced: bool | None = None
+    error: str | None = None
+    created_at: datetime
+    updated_at: datetime
+    next_attempt_at: datetime
+
+
+class RecentItem(BaseModel):
+    """One entry of the recent-history ring buffer (served or answered question).
+
+    Tags are copied from the concept when the entry is written so tag
+    continuity never has to load `concepts.yaml`.
+    """
+
+    concept_id: str
+    question_id: str | None = None
+    tags: list[str] = Field(default_factory=list)
+    event: Literal["served", "answered"]
+    at: datetime
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
+
+
+class QuestionPrefetcher:
+    """Questions generated ahead of time, and the LLM budget for doing so.
+
+    Purpose:
+        After a question is served, the practice service generates questions
+        for the concepts most likely to be picked next while the user is
+        answering, so the next `/practice/generate` does not wait on the LLM.
+
+    Behavior:
+        - `ready` maps a concept to one speculatively generated question that
+          has not been served yet (at most `max_ready`, oldest dropped; the
+          question stays in the bank either way).
+        - At most `max_generations_per_hour` speculative generations run in
+          any rolling hour (`try_spend`); 0 disables speculation.
+        - One speculation round runs at a time (`begin` / `end`); rounds
+          requested meanwhile are skipped rather than queued.
+
+    Notes:
+        - In-memory and app-scoped. Must be used from the app's event loop.
+        - Outcomes are counted in `practice_prefetch_total{result}`.
+    """
+
+    def __init__(
+        self,
+        *,
+        concepts: int = 2,
+        max_generations_per_hour: int = 30,
+        max_ready: int = 64,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.concepts = max(0, int(concepts))
+        self.max_generations_per_hour = max(0, int(max_generations_per_hour))
+        self._max_ready = max(1, int(max_ready))
+        self._clock = clock
+        self._ready: OrderedDict[str, str] = OrderedDict()
+        self._spent: deque[float] = deque()
+        self._running = False
+
+    def __len__(self) -> int:
+        return len(self._ready)
+
+    @property
+    def enabled(self) -> bool:
+        return self.concepts > 0 and self.max_generations_per_hour > 0
+
+    def has(self, concept_id: str) -> bool:
+        return concept_id in self._ready
+
+    def put(self, concept_id: str, question_id: str) -> None:
+        self._ready[concept_id] = question_id
+        self._ready.move_to_end(concept_id)
+        while len(self._ready) > self._max_ready:
+            self._ready.popitem(last=False)
+
+    def take(self, concept_id: str) -> str | None:
+        """Remove and return the unserved prefetched question for `concept_id`, if any."""
+
+        return self._ready.pop(concept_id, None)
+
+    def try_spend(self) -> bool:
+        """Reserve one speculative generation from the hourly budget."""
+
+        now = self._clock()
+        while self._spent and now - self._spent[0] >= 3600.0:
+            self._spent.popleft()
+        if len(self._spent) >= self.max_generations_per_hour:
+            return False
+        self._spent.append(now)
+        return True
+
+    def begin(self) -> bool:
+        """Start a speculation round; False if one is already running."""
+
+        if self._running:
+            return False
+        self._running = True
+        return True
+
+    def end(self) -> None:
+        self._running = False
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import re
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import uuid4
+
+from app.domain.practice.due_index import DueIndex
+from app.domain.practice.models import ConceptProgress
+
+_VERSION = re.compile(r"[0-9a-f]{12}\.[0-9]{1,18}")
+
+
+def is_view_version(value: str) -> bool:
+    """True if `value` has the `"<epoch>.<seq>"` shape of `ProgressView.version`."""
+
+    return _VERSION.fullmatch(value) is not None
+
+
+@dataclass(frozen=True)
+class ProgressViewEntry:
+    """One materialized `GET /progress` row.
+
+    Fields:
+        seq: View sequence number of the last change to this row.
+    """
+
+    concept_id: str
+    progress: ConceptProgress
+    is_due: bool
+    seq: int
+
+
+class ProgressView:
+    """Materialized per-concept progress rows with change tracking.
+
+    Purpose:
+        Serve `GET /progress` without reloading, revalidating or re-deriving
+        every row per request. Rows change only when progress is written, a
+        concept is added, or a cooldown expires.
+
+    Versioning:
+        - `version` is `"<epoch>.<seq>"`. `seq` increases on every row change;
+          `epoch` is unique per view instance, so a rebuilt view never reuses a
+          version.
+        - `changed_since(version)` returns rows whose `seq` is newer, or None
+          when the version belongs to another epoch (the caller must send
+          everything).
+
+    Notes:
+        - Rows without stored progress carry a default `ConceptProgress`.
+        - Not thread-safe on its own; owners serialize access.
+        - Versions are per process: with several server workers each one
+          has its own view, epoch and ETags (run a single worker).
+    """
+
+    def __init__(
+        self,
+        *,
+        concept_ids: Iterable[str],
+        progress_by_concept_id: dict[str, ConceptProgress],
+        now: datetime,
+    ) -> None:
+        self.epoch = uuid4().hex[:12]
+        self._seq = 0
+        self._now = now
+        self._due = DueIndex(progress_by_concept_id.values())
+        self._due.advance(now)
+        self._entries: dict[str, ProgressViewEntry] = {}
+        for concept_id in concept_ids:
+            self._refresh(concept_id)
+
+    @property
+    def version(self) -> str:
+        return f"{self.epoch}.{self._seq}"
+
+    def entries(self) -> list[ProgressViewEntry]:
+        """Return all rows in concept order."""
+
+        return list(self._entries.values())
+
+    def changed_since(self, version: str) -> list[ProgressViewEntry] | None:
+        """Return rows changed after `version` (concept order), or None if it is not from this view."""
+
+        epoch, _, seq = version.partition(".")
+        if epoch != self.epoch or not seq.isdigit() or int(seq) > self._seq:
+            return None
+        since = int(seq)
+        return [entry for entry in self._entries.values() if entry.seq > since]
+
+    def set_concepts(self, concept_ids: Iterable[str]) -> bool:
+        """Add rows for new concepts.
+
+        Returns:
+            False if a known concept disappeared (the view cannot express
+            deletions as changes and must be rebuilt), else True.
+        """
+
+        concept_ids = list(concept_ids)
+        if not set(self._entries).issubset(concept_ids):
+            return False
+        for concept_id in concept_ids:
+            if concept_id not in self._entries:
+                self._refresh(concept_id)
+        return True
+
+    def apply_progress(self, progress: ConceptProgress) -> None:
+        """Apply one stored progress entry."""
+
+        self._due.upsert(progress)
+        self._due.advance(self._now)
+        if progress.concept_id in self._entries:
+            self._refresh(progress.concept_id)
+
+    def advance(self, now: datetime) -> None:
+        """Move the view clock to `now`, flipping rows whose cooldown expired."""
+
+        if now < self._now:
+            self._now = now
+            for concept_id in list(self._entries):
+                self._refresh(concept_id)
+            return
+
+        self._now = now
+        for concept_id in self._due.advance(now):
+            if concept_id in self._entries:
+                self._refresh(concept_id)
+
+    def _refresh(self, concept_id: str) -> None:
+        progress = self._due.get(concept_id) or ConceptProgress(concept_id=concept_id)
+        is_due = self._due.is_due(concept_id, now=self._now)
+
+        current = self._entries.get(concept_id)
+        if current is not None and current.progress == progress and current.is_due == is_due:
+            return
+
+        self._seq += 1
+        self._entries[concept_id] = ProgressViewEntry(
+            concept_id=concept_id, progress=progress, is_due=is_due, seq=self._seq
+        )
+
+
+@dataclass
+class ProgressViewCache:
+    """App-scoped holder for a `ProgressView` and its serialized body.
+
+    Fields:
+        view: The live view, or None until first use.
+        concepts_signature: Store signature of `concepts.yaml` the view reflects.
+        progress_cursor: `(generation, revision)` of the progress change feed
+            the view reflects (see `ProgressRepository.changes_since`).
+        body / body_version: Serialized full response for `body_version`.
+        row_json: Per-concept `(seq, JSON fragment)` reused across versions.
+    """
+
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    view: ProgressView | None = None
+    concepts_signature: object = None
+    progress_cursor: tuple[int, int] | None = None
+    body: bytes | None = None
+    body_version: str | None = None
+    row_json: dict[str, tuple[int, bytes]] = field(default_factory=dict)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from app.core.metrics import REPORT_JOBS
+from app.domain.practice.models import ReportJob
+from app.domain.practice.scheduling import utc_now
+from app.domain.practice.service import PracticeService
+from app.infra.llm.ollama_client import OllamaUnavailable
+from app.infra.repositories.async_repositories import AsyncReportJobsRepository
+
+# Upper bound on how long an idle worker sleeps before re-checking the queue
+# (covers jobs queued by another process and missed wake-ups).
+_POLL_SECONDS = 5.0
+# Pause after an unexpected error in the worker loop (e.g. the jobs file is
+# unreadable) so a persistent fault does not spin.
+_ERROR_BACKOFF_SECONDS = 5.0
+
+logger = logging.getLogger(__name__)
+
+
+def retry_delay(attempts: int, *, base_seconds: float, max_seconds: float) -> float:
+    """Exponential backoff: `base * 2**(attempts - 1)`, capped at `max_seconds`."""
+
+    return min(max_seconds, base_seconds * 2 ** max(0, attempts - 1))
+
+
+class ReportJobWorker:
+    """Processes queued question-report jobs in the background.
+
+    Purpose:
+        Take the evaluator and replacement-generation calls of
+        `POST /questions/{id}/report` off the request path.
+
+    A job runs in two persisted steps:
+        1. review: re-evaluate the question and remove it if confirmed poor
+           (`removed` is recorded before step 2, so a retry never re-reviews
+           a removed question);
+        2. replace: generate an evaluator-approved replacement.
+
+    Error handling:
+        - `OllamaUnavailable` is retried with exponential backoff until
+          `max_attempts`, then the job is `failed`.
+        - Any other error fails the job immediately; `error` holds the reason.
+        - An error outside a job (claiming or saving it fails) is logged and
+          the worker retries after a pause; the job stays `running` until
+          the next `start` requeues it.
+
+    Concurrency:
+        `workers` asyncio tasks on the app's event loop; storage calls go
+        through the storage executor and LLM calls share the Ollama client's
+        concurrency limit. `workers=0` disables processing (jobs stay queued).
+    """
+
+    def __init__(
+        self,
+        *,
+        jobs_repo: AsyncReportJobsRepository,
+        practice: PracticeService,
+        workers: int = 1,
+        max_attempts: int = 5,
+        backoff_seconds: float = 30.0,
+        max_backoff_seconds: float = 900.0,
+        clock: Callable[[], datetime] = utc_now,
+    ) -> None:
+        self._jobs = jobs_repo
+        self._practice = practice
+        self.workers = max(0, int(workers))
+        self._max_attempts = max(1, int(max_attempts))
+        self._backoff_seconds = backoff_seconds
+        self._max_backoff_seconds = max_backoff_seconds
+        self._clock = clock
+        self._wakeup: asyncio.Event | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+
+    async def start(self) -> None:
+        """Requeue jobs interrupted by a previous shutdown and start the workers."""
+
+        await self._jobs.recover(now=self._clock())
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.create_task(self._run()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        """Cancel the workers. A job cut off mid-run is requeued by the next `start`."""
+
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self) -> None:
+        """Wake idle workers (call after enqueueing)."""
+
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._run_step()
+            except Exception:  # noqa: BLE001 - keep the worker alive
+                logger.exception("Report job worker failed; retrying in %.0fs", _ERROR_BACKOFF_SECONDS)
+                await asyncio.sleep(_ERROR_BACKOFF_SECONDS)
+
+    async def _run_step(self) -> None:
+        """Process one ready job, or wait until one may be ready."""
+
+        assert self._wakeup is not None
+        self._wakeup.clear()
+        if await self.run_once() is not None:
+            return
+
+        timeout = _POLL_SECONDS
+        next_attempt_at = await self._jobs.next_attempt_at()
+        if next_attempt_at is not None:
+            timeout = min(timeout, max(0.0, (next_attempt_at - self._clock()).total_seconds()))
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+        except TimeoutError:
+            pass
+
+    async def run_once(self) -> ReportJob | None:
+        """Claim and process one ready job; return it in its new state (None if none was ready)."""
+
+        job = await self._jobs.claim(now=self._clock())
+        if job is None:
+            return None
+
+        try:
+            job = await self._process(job)
+        except OllamaUnavailable as exc:
+            job = self._retry_or_fail(job, str(exc))
+        except Exception as exc:  # noqa: BLE001
+            job = job.model_copy(update={"status": "failed", "error": str(exc), "updated_at": self._clock()})
+
+        await self._jobs.update(job)
+        REPORT_JOBS.inc("retried" if job.status == "queued" else job.status)
+        return job
+
+    async def _process(self, job: ReportJob) -> ReportJob:
+        if job.removed is None:
+            removed = await self._practice.review_reported_question(job.question_id)
+            job = job.model_copy(update={"removed": removed, "updated_at": self._clock()})
+            if removed:
+                await self._jobs.update(job)
+
+        replaced = False
+        if job.removed:
+            try:
+                replaced = await self._practice.replace_question(job.concept_id) is not None
+            except ValueError:  # bank refilled meanwhile; nothing to replace
+                replaced = False
+
+        return job.model_copy(
+            update={"status": "succeeded", "replaced": replaced, "error": None, "updated_at": self._clock()}
+        )
+
+    def _retry_or_fail(self, job: ReportJob, error: str) -> ReportJob:
+        now = self._clock()
+        if job.attempts >= self._max_attempts:
+            return job.model_copy(update={"status": "failed", "error": error, "updated_at": now})
+
+        delay = retry_delay(job.attempts, base_seconds=self._backoff_seconds, max_seconds=self._max_backoff_seconds)
+        return job.model_copy(
+            update={
+                "status": "queued",
+                "error": error,
+                "next_attempt_at": now + timedelta(seconds=delay),
+                "updated_at": now,
+            }
+        )
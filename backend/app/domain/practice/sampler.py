@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import random
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from app.domain.concepts import Concept
+from app.domain.practice.due_index import DueIndex
+from app.domain.practice.models import ConceptProgress
+from app.domain.practice.selection import SelectionResult, compute_concept_weight
+from app.domain.tag_index import TagIndex
+
+# The recency factor `clamp(1, 2, minutes_since_last_correct / 1440)` stops
+# changing once the last correct answer is this old.
+_RECENCY_SATURATION_MINUTES = 2 * 1440.0
+
+
+class FenwickSampler:
+    """Weighted sampler over string keys backed by a Fenwick (binary indexed) tree.
+
+    Complexity:
+        - `set_weight`: O(log n) (amortized; growing the capacity is O(n)).
+        - `sample`: O(log n).
+
+    Invariants:
+        - Weights are non-negative; keys with weight 0 are never sampled.
+        - Incremental float updates drift slightly, so the tree is rebuilt from
+          the exact weights after `len(self)` updates.
+    """
+
+    def __init__(self) -> None:
+        self._keys: list[str] = []
+        self._position: dict[str, int] = {}
+        self._weights: list[float] = []
+        self._tree: list[float] = [0.0]
+        self._updates_since_rebuild = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def weight(self, key: str) -> float:
+        """Return the current weight of `key` (0.0 if unknown)."""
+
+        position = self._position.get(key)
+        return 0.0 if position is None else self._weights[position]
+
+    def total(self) -> float:
+        """Return the sum of all weights."""
+
+        return self._prefix(len(self._keys))
+
+    def set_weight(self, key: str, weight: float) -> None:
+        """Insert `key` or change its weight."""
+
+        weight = max(0.0, weight)
+        position = self._position.get(key)
+        if position is None:
+            position = len(self._keys)
+            self._position[key] = position
+            self._keys.append(key)
+            self._weights.append(0.0)
+            if len(self._keys) >= len(self._tree):
+                self._rebuild(capacity=2 * len(self._tree))
+
+        delta = weight - self._weights[position]
+        if delta == 0.0:
+            return
+        self._weights[position] = weight
+
+        self._updates_since_rebuild += 1
+        if self._updates_since_rebuild > len(self._keys):
+            self._rebuild(capacity=len(self._tree))
+            return
+
+        i = position + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def sample(self, rng: random.Random) -> tuple[str, float] | None:
+        """Draw a key with probability proportional to its weight.
+
+        Returns:
+            `(key, weight)`, or None when every weight is 0.
+        """
+
+        total = self.total()
+        if total <= 0.0:
+            return None
+
+        roll = rng.random() * total
+
+        # Descend to the largest prefix whose sum is <= roll; the next slot is
+        # the first whose cumulative weight exceeds the roll.
+        position = 0
+        remaining = roll
+        step = 1 << (len(self._tree).bit_length() - 1)
+        while step:
+            nxt = position + step
+            if nxt < len(self._tree) and self._tree[nxt] <= remaining:
+                position = nxt
+                remaining -= self._tree[nxt]
+            step >>= 1
+
+        if position >= len(self._keys) or self._weights[position] <= 0.0:
+            # Float rounding pushed us onto a zero-weight slot or past the end.
+            position = self._last_positive_at_or_before(min(position, len(self._keys) - 1))
+
+        return self._keys[position], self._weights[position]
+
+    def _last_positive_at_or_before(self, position: int) -> int:
+        for candidate in range(position, -1, -1):
+            if self._weights[candidate] > 0.0:
+                return candidate
+        for candidate in range(position + 1, len(self._keys)):
+            if self._weights[candidate] > 0.0:
+                return candidate
+        raise RuntimeError("Sampler has no positive weights")
+
+    def _prefix(self, count: int) -> float:
+        total = 0.0
+        i = count
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def _rebuild(self, *, capacity: int) -> None:
+        """Rebuild the tree from exact weights in O(n)."""
+
+        tree = [0.0] * max(capacity, len(self._keys) + 1)
+        for position, weight in enumerate(self._weights):
+            tree[position + 1] = weight
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+        self._updates_since_rebuild = 0
+
+
+class IncrementalConceptSelector:
+    """Persistent due-concept sampler that applies the `selection.py` rules.
+
+    Purpose:
+        Replace the per-request "weigh every due concept, then scan" draw in
+        `pick_due_concept` with O(log n) updates and draws.
+
+    How weights stay current:
+        - `update_progress` re-weighs one concept after a submit.
+        - `set_recent_tags` re-weighs only concepts carrying a tag that entered
+          or left the recent set.
+        - `pick` activates concepts whose cooldown expired (via `DueIndex`) and
+          re-weighs the few due concepts whose recency factor still changes
+          with time (last correct answer less than two days ago).
+
+    Invariants:
+        - After `pick(now=...)` each weight equals
+          `compute_concept_weight(...)` for due concepts and 0 otherwise, so
+          the draw distribution matches `pick_due_concept`.
+        - The draw order differs from `pick_due_concept`; results match in
+          distribution, not per RNG seed.
+    """
+
+    def __init__(
+        self,
+        *,
+        concepts: Iterable[Concept],
+        progress_by_concept_id: dict[str, ConceptProgress],
+        recent_tags: set[str],
+        now: datetime,
+    ) -> None:
+        self._concepts: dict[str, Concept] = {}
+        self._tags = TagIndex()
+        self._tag_overlap: dict[str, int] = {}
+        self._progress = DueIndex(progress_by_concept_id.values())
+        self._sampler = FenwickSampler()
+        self._recent_tags = set(recent_tags)
+        self._time_varying: set[str] = set()
+        self._now = now
+
+        self._progress.advance(now)
+        for concept in concepts:
+            self.upsert_concept(concept)
+
+    def upsert_concept(self, concept: Concept) -> None:
+        """Add a concept or replace its tags."""
+
+        self._concepts[concept.id] = concept
+        self._tags.add(concept)
+
+        overlap = len(self._recent_tags.intersection(self._tags.tags_for(concept.id)))
+        if overlap:
+            self._tag_overlap[concept.id] = overlap
+        else:
+            self._tag_overlap.pop(concept.id, None)
+        self._reweigh(concept.id)
+
+    def update_progress(self, progress: ConceptProgress) -> None:
+        """Apply a progress change (e.g. after a submit)."""
+
+        self._progress.upsert(progress)
+        self._progress.advance(self._now)
+        self._reweigh(progress.concept_id)
+
+    def set_recent_tags(self, recent_tags: set[str]) -> None:
+        """Shift the tag-continuity context, re-weighing only affected concepts."""
+
+        recent_tags = set(recent_tags)
+        changed = self._recent_tags.symmetric_difference(recent_tags)
+        if not changed:
+            return
+
+        self._recent_tags = recent_tags
+        self._tag_overlap = self._tags.tag_overlap(recent_tags)
+        for concept_id in self._tags.concepts_with_any(changed):
+            self._reweigh(concept_id)
+
+    def pick(self, *, now: datetime, rng: random.Random | None = None) -> SelectionResult | None:
+        """Pick one due concept; same distribution as `pick_due_concept`.
+
+        Returns:
+            SelectionResult if at least one concept is due, else None.
+        """
+
+        rng = rng or random.Random()
+
+        if now < self._now:
+            self._now = now
+            for concept_id in self._concepts:
+                self._reweigh(concept_id)
+        else:
+            self._now = now
+            became_due = self._progress.advance(now)
+            for concept_id in [*became_due, *self._time_varying]:
+                self._reweigh(concept_id)
+
+        drawn = self._sampler.sample(rng)
+        if drawn is None:
+            return None
+        concept_id, weight = drawn
+        return SelectionResult(concept_id=concept_id, weight=weight)
+
+    def weight(self, concept_id: str) -> float:
+        """Return the current sampling weight of a concept (0 if not due)."""
+
+        return self._sampler.weight(concept_id)
+
+    def _reweigh(self, concept_id: str) -> None:
+        concept = self._concepts.get(concept_id)
+        if concept is None:
+            return
+
+        progress = self._progress.get(concept_id)
+        self._time_varying.discard(concept_id)
+
+        if not self._progress.is_due(concept_id, now=self._now):
+            self._sampler.set_weight(concept_id, 0.0)
+            return
+
+        if progress is not None and progress.last_correct_at is not None:
+            minutes_since = (self._now - progress.last_correct_at).total_seconds() / 60.0
+            if minutes_since < _RECENCY_SATURATION_MINUTES:
+                self._time_varying.add(concept_id)
+
+        weight = compute_concept_weight(
+            concept,
+            progress,
+            recent_tags=self._recent_tags,
+            now=self._now,
+            tag_overlap=self._tag_overlap.get(concept_id, 0),
+        )
+        self._sampler.set_weight(concept_id, weight)
+
+
+@dataclass
+class ConceptSelectorCache:
+    """App-scoped holder for an `IncrementalConceptSelector`.
+
+    Fields:
+        selector: The live selector, or None until first use.
+        version: Opaque storage version (concepts + progress signatures) the
+            selector reflects; a mismatch forces a rebuild.
+    """
+
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    selector: IncrementalConceptSelector | None = None
+    version: object = None
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+def cooldown_minutes_array(mastery_streak: np.ndarray) -> np.ndarray:
+    """Vectorized `scheduling.compute_cooldown_minutes`.
+
+    Inputs:
+        mastery_streak: Integer array of (already updated) mastery streaks.
+
+    Outputs:
+        Float array of cooldown minutes, bit-for-bit equal to the scalar rule.
+    """
+
+    mastery_streak = np.asarray(mastery_streak, dtype=np.int64)
+    slow_exponent = np.minimum(mastery_streak - 1, 4).astype(np.float64)
+    fast_exponent = np.maximum(mastery_streak - 5, 0).astype(np.float64)
+    cooldown = 1440.0 * np.power(1.3, slow_exponent) * np.power(3.0, fast_exponent)
+    return np.where(mastery_streak <= 0, 0.0, cooldown)
+
+
+def update_mastery_streak_array(current: np.ndarray, score: np.ndarray) -> np.ndarray:
+    """Vectorized `scheduling.update_mastery_streak` (returns the new streaks).
+
+    Rules:
+        - score >= 85: +1
+        - current < 3 and score < 85: reset to 0
+        - score < 50 and current >= 3: -3 (floored at 0)
+        - score in [50, 85) and current >= 3: -1 (floored at 0)
+    """
+
+    current = np.maximum(0, np.asarray(current, dtype=np.int64))
+    score = np.asarray(score, dtype=np.float64)
+
+    return np.where(
+        score >= 85.0,
+        current + 1,
+        np.where(
+            current < 3,
+            0,
+            np.where(score < 50.0, np.maximum(0, current - 3), np.maximum(0, current - 1)),
+        ),
+    )
+
+
+def next_due_offset_minutes_array(score: np.ndarray, cooldown_minutes: np.ndarray) -> np.ndarray:
+    """Vectorized `scheduling.compute_next_due_at`, as minutes after `now`.
+
+    Outputs:
+        Offset in minutes; NaN where the scalar rule returns None
+        (OK answers leave `next_due_at` unchanged).
+    """
+
+    score = np.asarray(score, dtype=np.float64)
+    cooldown_minutes = np.asarray(cooldown_minutes, dtype=np.float64)
+
+    return np.where(score >= 85.0, cooldown_minutes, np.where(score < 50.0, 10.0, np.nan))
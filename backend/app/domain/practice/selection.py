@@ -34,16 +34,22 @@ def compute_concept_weight(
     *,
     recent_tags: set[str],
     now: datetime,
+    tag_overlap: int | None = None,
 ) -> float:
     """Compute selection weight for a due concept.
 
     Matches the tunable defaults in the spec.
+
+    Inputs:
+        tag_overlap: Precomputed `|concept.tags ∩ recent_tags|` (e.g. from a
+            `TagIndex`); computed from the tag sets when None.
     """
 
     weight = 1.0
 
-    concept_tags = {t for t in concept.tags if t}
-    tag_overlap = len(concept_tags.intersection(recent_tags))
+    if tag_overlap is None:
+        concept_tags = {t for t in concept.tags if t}
+        tag_overlap = len(concept_tags.intersection(recent_tags))
     weight *= 1.0 + tag_overlap * 0.5
 
     if progress is None or progress.last_correct_at is None:
@@ -68,9 +74,14 @@ def pick_due_concept(
     recent_tags: set[str],
     now: datetime,
     rng: random.Random | None = None,
+    tag_overlap_by_concept_id: dict[str, int] | None = None,
 ) -> SelectionResult | None:
     """Pick one due concept using weighted random selection.
 
+    Inputs:
+        tag_overlap_by_concept_id: Optional precomputed tag overlaps (see
+            `TagIndex.tag_overlap`). Concepts missing from it have overlap 0.
+
     Returns:
         SelectionResult if at least one concept is due, else None.
     """
@@ -84,7 +95,8 @@ def pick_due_concept(
         if not is_due(progress, now=now):
             continue
 
-        w = compute_concept_weight(concept, progress, recent_tags=recent_tags, now=now)
+        tag_overlap = None if tag_overlap_by_concept_id is None else tag_overlap_by_concept_id.get(concept.id, 0)
+        w = compute_concept_weight(concept, progress, recent_tags=recent_tags, now=now, tag_overlap=tag_overlap)
         if w > 0:
             weighted.append((concept.id, w))
 
@@ -102,3 +114,55 @@ def pick_due_concept(
 
     concept_id, w = weighted[-1]
     return SelectionResult(concept_id=concept_id, weight=w)
+
+
+def pick_due_concepts(
+    *,
+    concepts: list[Concept],
+    progress_by_concept_id: dict[str, ConceptProgress],
+    recent_tag_history: list[set[str]],
+    count: int,
+    now: datetime,
+    rng: random.Random | None = None,
+    history_size: int = 3,
+) -> list[SelectionResult]:
+    """Pick up to `count` distinct due concepts for a practice session.
+
+    Each pick uses `pick_due_concept` over the concepts not picked yet, with
+    `recent_tags` rolled forward as if the earlier picks had been served:
+    the tags of the last `history_size` items (history first, then picks)
+    drive the tag-continuity boost.
+
+    Inputs:
+        recent_tag_history: Tag sets of recently served items, oldest first.
+        count: Maximum number of concepts to return.
+
+    Returns:
+        Picks in serving order; fewer than `count` if not enough are due.
+    """
+
+    rng = rng or random.Random()
+
+    remaining = list(concepts)
+    history = [set(tags) for tags in recent_tag_history][-history_size:] if history_size > 0 else []
+    picks: list[SelectionResult] = []
+
+    while len(picks) < count:
+        recent_tags: set[str] = set().union(*history)
+        selection = pick_due_concept(
+            concepts=remaining,
+            progress_by_concept_id=progress_by_concept_id,
+            recent_tags=recent_tags,
+            now=now,
+            rng=rng,
+        )
+        if selection is None:
+            break
+
+        picks.append(selection)
+        chosen = next(concept for concept in remaining if concept.id == selection.concept_id)
+        remaining = [concept for concept in remaining if concept.id != selection.concept_id]
+        if history_size > 0:
+            history = [*history, {t for t in chosen.tags if t}][-history_size:]
+
+    return picks
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import random
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from app.domain.concepts import Concept
+from app.domain.practice.models import ConceptProgress
+from app.domain.practice.selection import SelectionResult
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+_WORD_BITS = 64
+
+# Popcount per byte, used when numpy lacks `bitwise_count` (numpy < 2.0).
+_POPCOUNT8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.int64)
+
+
+def _to_us(value: datetime) -> int:
+    """Convert an aware datetime to integer microseconds since the epoch (exact)."""
+
+    return (value - _EPOCH) // _ONE_MICROSECOND
+
+
+def popcount(bits: np.ndarray) -> np.ndarray:
+    """Return the number of set bits of each element of a uint64 array."""
+
+    bits = np.ascontiguousarray(bits, dtype=np.uint64)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(bits).astype(np.int64)
+    as_bytes = bits.view(np.uint8).reshape(*bits.shape, 8)
+    return _POPCOUNT8[as_bytes].sum(axis=-1)
+
+
+def _popcount_rows(bits: np.ndarray) -> np.ndarray:
+    """Return the number of set bits per row of a 2-D uint64 array."""
+
+    if bits.shape[1] == 0:
+        return np.zeros(bits.shape[0], dtype=np.int64)
+    return popcount(bits).sum(axis=1)
+
+
+@dataclass
+class ConceptColumns:
+    """Columnar snapshot of concepts and their progress.
+
+    Purpose:
+        Hold everything `compute_concept_weight` and `is_due` read, one NumPy
+        array per field, so weights for a whole library are a few array ops.
+
+    Columns (one row per concept, in input order):
+        ids: Concept ids.
+        tag_bits: `(n, words)` uint64 bitsets over `tag_ids`.
+        has_last_correct / last_correct_us: `last_correct_at` as epoch microseconds.
+        has_next_due / next_due_us: `next_due_at` as epoch microseconds.
+        poor: True where `last_attempt_score < 50`.
+        mastery: `mastery_streak`.
+
+    Invariants:
+        - Datetimes are stored as exact integer microseconds so due checks and
+          elapsed-time math round exactly like the scalar `datetime` code.
+        - `row_of[ids[i]] == i`.
+    """
+
+    ids: list[str]
+    row_of: dict[str, int]
+    tag_ids: dict[str, int]
+    tag_bits: np.ndarray
+    has_last_correct: np.ndarray
+    last_correct_us: np.ndarray
+    has_next_due: np.ndarray
+    next_due_us: np.ndarray
+    poor: np.ndarray
+    mastery: np.ndarray
+
+    @classmethod
+    def build(
+        cls,
+        concepts: Iterable[Concept],
+        progress_by_concept_id: dict[str, ConceptProgress],
+    ) -> ConceptColumns:
+        """Build columns from concept models and a progress mapping."""
+
+        concepts = list(concepts)
+        n = len(concepts)
+
+        tag_ids: dict[str, int] = {}
+        concept_tag_ids: list[list[int]] = []
+        for concept in concepts:
+            ids_for_concept = []
+            for tag in {t for t in concept.tags if t}:
+                ids_for_concept.append(tag_ids.setdefault(tag, len(tag_ids)))
+            concept_tag_ids.append(ids_for_concept)
+
+        words = (len(tag_ids) + _WORD_BITS - 1) // _WORD_BITS
+        tag_bits = np.zeros((n, words), dtype=np.uint64)
+        for row, ids_for_concept in enumerate(concept_tag_ids):
+            for tag_id in ids_for_concept:
+                tag_bits[row, tag_id // _WORD_BITS] |= np.uint64(1 << (tag_id % _WORD_BITS))
+
+        columns = cls(
+            ids=[concept.id for concept in concepts],
+            row_of={concept.id: row for row, concept in enumerate(concepts)},
+            tag_ids=tag_ids,
+            tag_bits=tag_bits,
+            has_last_correct=np.zeros(n, dtype=bool),
+            last_correct_us=np.zeros(n, dtype=np.int64),
+            has_next_due=np.zeros(n, dtype=bool),
+            next_due_us=np.zeros(n, dtype=np.int64),
+            poor=np.zeros(n, dtype=bool),
+            mastery=np.zeros(n, dtype=np.int64),
+        )
+        for concept in concepts:
+            progress = progress_by_concept_id.get(concept.id)
+            if progress is not None:
+                columns.set_progress(progress)
+        return columns
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def set_progress(self, progress: ConceptProgress) -> None:
+        """Overwrite the progress columns of one concept in place (O(1)).
+
+        Unknown concept ids are ignored.
+        """
+
+        row = self.row_of.get(progress.concept_id)
+        if row is None:
+            return
+
+        self.has_last_correct[row] = progress.last_correct_at is not None
+        self.last_correct_us[row] = 0 if progress.last_correct_at is None else _to_us(progress.last_correct_at)
+        self.has_next_due[row] = progress.next_due_at is not None
+        self.next_due_us[row] = 0 if progress.next_due_at is None else _to_us(progress.next_due_at)
+        self.poor[row] = progress.last_attempt_score is not None and progress.last_attempt_score < 50.0
+        self.mastery[row] = progress.mastery_streak
+
+    def recent_tag_mask(self, recent_tags: set[str]) -> np.ndarray:
+        """Return a `(words,)` bitset of the recent tags known to this library."""
+
+        mask = np.zeros(self.tag_bits.shape[1], dtype=np.uint64)
+        for tag in recent_tags:
+            tag_id = self.tag_ids.get(tag)
+            if tag_id is not None:
+                mask[tag_id // _WORD_BITS] |= np.uint64(1 << (tag_id % _WORD_BITS))
+        return mask
+
+
+def due_mask(columns: ConceptColumns, *, now: datetime) -> np.ndarray:
+    """Vectorized `is_due` for every row."""
+
+    return ~columns.has_next_due | (columns.next_due_us <= _to_us(now))
+
+
+def compute_weights(columns: ConceptColumns, *, recent_tags: set[str], now: datetime) -> np.ndarray:
+    """Vectorized `compute_concept_weight` for every row (due or not).
+
+    The multiplications happen in the same order as the scalar function, so
+    results are bit-for-bit identical.
+    """
+
+    tag_overlap = _popcount_rows(columns.tag_bits & columns.recent_tag_mask(recent_tags))
+    elapsed_us = _to_us(now) - columns.last_correct_us
+    minutes_since = (elapsed_us / 1_000_000) / 60.0
+
+    return weight_array(
+        tag_overlap=tag_overlap,
+        has_last_correct=columns.has_last_correct,
+        minutes_since_last_correct=minutes_since,
+        poor=columns.poor,
+        mastery=columns.mastery,
+    )
+
+
+def weight_array(
+    *,
+    tag_overlap: np.ndarray,
+    has_last_correct: np.ndarray,
+    minutes_since_last_correct: np.ndarray,
+    poor: np.ndarray,
+    mastery: np.ndarray,
+) -> np.ndarray:
+    """Apply the `compute_concept_weight` multipliers to broadcastable arrays.
+
+    Inputs:
+        tag_overlap: `|concept tags ∩ recent tags|`.
+        has_last_correct: False where `last_correct_at` is missing.
+        minutes_since_last_correct: Ignored where `has_last_correct` is False.
+        poor: True where the last attempt scored < 50.
+        mastery: `mastery_streak`.
+    """
+
+    shape = np.broadcast(tag_overlap, has_last_correct, minutes_since_last_correct, poor, mastery).shape
+
+    # In-place updates keep the scalar multiplication order (1.0 * x and
+    # x * 1.0 are exact) while avoiding one temporary per factor.
+    weights = np.empty(shape, dtype=np.float64)
+    np.multiply(tag_overlap, 0.5, out=weights)
+    weights += 1.0
+
+    recency = np.empty(shape, dtype=np.float64)
+    np.divide(minutes_since_last_correct, 1440.0, out=recency)
+    np.clip(recency, 1.0, 2.0, out=recency)
+    np.copyto(recency, 1.5, where=~np.asarray(has_last_correct, dtype=bool))
+    weights *= recency
+
+    np.multiply(weights, 2.0, out=weights, where=np.asarray(poor, dtype=bool))
+    weights *= 1.0 / (1.0 + np.asarray(mastery) * 0.25)
+
+    return np.maximum(weights, 0.0, out=weights)
+
+
+def pick_due_concept_vectorized(
+    columns: ConceptColumns,
+    *,
+    recent_tags: set[str],
+    now: datetime,
+    rng: random.Random | None = None,
+) -> SelectionResult | None:
+    """Batched equivalent of `selection.pick_due_concept`.
+
+    Consumes one `rng.random()` call and returns the same concept as the
+    scalar implementation for the same inputs and RNG state.
+
+    Returns:
+        SelectionResult if at least one concept is due, else None.
+    """
+
+    rng = rng or random.Random()
+
+    weights = compute_weights(columns, recent_tags=recent_tags, now=now)
+    eligible = np.flatnonzero(due_mask(columns, now=now) & (weights > 0))
+    if eligible.size == 0:
+        return None
+
+    eligible_weights = weights[eligible]
+    # Builtin sum keeps the total identical to the scalar code's `sum(...)`.
+    total = sum(eligible_weights.tolist())
+    roll = rng.random() * total
+
+    cumulative = np.cumsum(eligible_weights)
+    position = int(np.searchsorted(cumulative, roll, side="left"))
+    position = min(position, eligible.size - 1)
+
+    row = int(eligible[position])
+    return SelectionResult(concept_id=columns.ids[row], weight=float(weights[row]))
@@ -1,19 +1,34 @@
 from __future__ import annotations
 
 import random
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Literal
 
+from app.core.metrics import PRACTICE_GENERATION_DECISIONS, PRACTICE_PREFETCH
 from app.domain.concepts import Concept
-from app.domain.practice.models import ConceptProgress, PracticeAttempt, PracticeQuestion
+from app.domain.practice.generation_control import GenerationController
+from app.domain.practice.models import ConceptProgress, PracticeAttempt, PracticeQuestion, RecentItem
+from app.domain.practice.prefetch import QuestionPrefetcher
 from app.domain.practice.prompts import evaluator_prompt, generation_prompt, grading_prompt
-from app.domain.practice.scheduling import compute_cooldown_minutes, compute_next_due_at, update_mastery_streak
-from app.domain.practice.selection import pick_due_concept
-from app.infra.llm.ollama_client import OllamaClient, OllamaUnavailable
-from app.infra.repositories.attempts_repository import AttemptsRepository
-from app.infra.repositories.concepts_repository import ConceptsRepository
-from app.infra.repositories.progress_repository import ProgressRepository
-from app.infra.repositories.question_bank_repository import QuestionBankRepository
+from app.domain.practice.sampler import ConceptSelectorCache, IncrementalConceptSelector
+from app.domain.practice.scheduling import (
+    compute_cooldown_minutes,
+    compute_next_due_at,
+    update_mastery_streak,
+    utc_now,
+)
+from app.domain.practice.selection import SelectionResult, pick_due_concept, pick_due_concepts
+from app.infra.llm.ollama_client import LLMPriority, OllamaClient, OllamaUnavailable
+from app.infra.llm.usage import track_usage
+from app.infra.repositories.async_repositories import (
+    AsyncAttemptsRepository,
+    AsyncConceptsRepository,
+    AsyncProgressRepository,
+    AsyncQuestionBankRepository,
+    AsyncRecentHistoryRepository,
+)
 
 
 class NoConceptsDue(RuntimeError):
@@ -26,6 +41,14 @@ class GenerateResult:
     question: PracticeQuestion
 
 
+@dataclass(frozen=True)
+class PlannedQuestion:
+    """A concept picked for a session, with a bank question or None if one must be generated."""
+
+    concept: Concept
+    question: PracticeQuestion | None
+
+
 @dataclass(frozen=True)
 class SubmitResult:
     attempt: PracticeAttempt
@@ -41,33 +64,52 @@ class PracticeService:
         - grading an answer
         - updating progress and persisting attempts
 
-    The service is designed to be called from HTTP endpoints.
+    The service is designed to be called from HTTP endpoints. It holds no
+    per-request state, so one instance is built per app (see the app
+    container) and shared by all requests; each public call reads the clock
+    once, or uses the `now` it is given.
+
+    Concurrency:
+        Public methods are async. LLM calls are awaited on the event loop;
+        storage work runs on the repositories' `StorageExecutor`. Steps that
+        must stay together on one thread (selection under the selector lock,
+        the read-modify-write of a submit) run there as a single blocking
+        call against the wrapped sync repositories.
     """
 
     def __init__(
         self,
         *,
-        concepts_repo: ConceptsRepository,
-        progress_repo: ProgressRepository,
-        bank_repo: QuestionBankRepository,
-        attempts_repo: AttemptsRepository,
+        concepts_repo: AsyncConceptsRepository,
+        progress_repo: AsyncProgressRepository,
+        bank_repo: AsyncQuestionBankRepository,
+        attempts_repo: AsyncAttemptsRepository,
         ollama: OllamaClient,
         generation_model: str,
         evaluator_model: str,
-        now: datetime,
+        clock: Callable[[], datetime] = utc_now,
         rng: random.Random | None = None,
+        selector_cache: ConceptSelectorCache | None = None,
+        history_repo: AsyncRecentHistoryRepository | None = None,
+        prefetcher: QuestionPrefetcher | None = None,
+        generation_control: GenerationController | None = None,
     ) -> None:
-        self._concepts_repo = concepts_repo
-        self._progress_repo = progress_repo
-        self._bank_repo = bank_repo
-        self._attempts_repo = attempts_repo
+        self._io = concepts_repo.executor
+        self._concepts_repo = concepts_repo.sync
+        self._progress_repo = progress_repo.sync
+        self._bank_repo = bank_repo.sync
+        self._attempts_repo = attempts_repo.sync
         self._ollama = ollama
         self._generation_model = generation_model
         self._evaluator_model = evaluator_model
-        self._now = now
+        self._clock = clock
         self._rng = rng or random.Random()
+        self._selector_cache = selector_cache
+        self._history_repo = None if history_repo is None else history_repo.sync
+        self._prefetcher = prefetcher
+        self._generation_control = generation_control
 
-    def generate_one(self, *, recent_tags: set[str]) -> GenerateResult:
+    async def generate_one(self, *, recent_tags: set[str], now: datetime | None = None) -> GenerateResult:
         """Generate or pick a single practice question.
 
         Raises:
@@ -75,62 +117,381 @@ class PracticeService:
             OllamaUnavailable if AI is down.
         """
 
-        concepts = self._concepts_repo.list_concepts()
-        progress_by = self._progress_repo.get_all()
-
-        selection = pick_due_concept(
-            concepts=concepts,
-            progress_by_concept_id=progress_by,
-            recent_tags=recent_tags,
-            now=self._now,
-            rng=self._rng,
-        )
+        now = now or self._clock()
+        selection = await self._io.run(self._pick_concept, recent_tags=recent_tags, now=now)
 
         if selection is None:
             raise NoConceptsDue("No concepts are due")
 
-        concept = self._concepts_repo.get_concept(selection.concept_id)
+        concept = await self._io.run(self._concepts_repo.get_concept, selection.concept_id)
         if concept is None:
             raise RuntimeError("Selected concept missing")
 
-        p_new, questions = self._bank_repo.get_bank(concept.id)
+        question = await self._take_prefetched(concept.id)
+        if question is None:
+            question = await self._io.run(self._draw_from_bank, concept.id)
+        if question is None:
+            PRACTICE_PREFETCH.inc("miss")
+            question = await self.generate_question(concept, now=now)
+
+        await self._io.run(self._record_history, [(concept, question.id)], event="served", now=now)
+
+        return GenerateResult(concept=concept, question=question)
+
+    async def _take_prefetched(self, concept_id: str) -> PracticeQuestion | None:
+        """Serve the concept's speculatively generated question, if one is waiting."""
+
+        question_id = None if self._prefetcher is None else self._prefetcher.take(concept_id)
+        if question_id is None:
+            return None
+        question = await self._io.run(self._bank_repo.get_question, question_id)
+        if question is not None:  # None: removed by a report meanwhile
+            PRACTICE_PREFETCH.inc("hit")
+        return question
+
+    async def prefetch_next(self, *, served_concept_id: str, now: datetime | None = None) -> int:
+        """Generate questions ahead of time for the concepts likely to be served next.
+
+        Inputs:
+            served_concept_id: Concept just served; the user is answering it,
+                so it is not predicted.
+
+        Outputs:
+            Number of questions generated.
+
+        Notes:
+            - Prediction runs `pick_due_concepts` (i.e. `pick_due_concept`
+              with recent tags rolled forward) on the recent-history buffer,
+              which already contains the served question.
+            - A predicted concept is skipped if it already has an unserved
+              prefetched question, a full bank (its draw never generates) or
+              no generation budget left.
+            - Generation runs at `BACKGROUND` LLM priority and stops when the
+              prefetcher's hourly budget is spent. LLM errors are counted and
+              swallowed: nobody is waiting on this work.
+        """
+
+        prefetcher = self._prefetcher
+        if prefetcher is None or not prefetcher.enabled or not prefetcher.begin():
+            return 0
+
+        try:
+            now = now or self._clock()
+            predicted = await self._io.run(
+                self._predict_next, served_concept_id=served_concept_id, count=prefetcher.concepts, now=now
+            )
+            generated = 0
+            for concept, bank_size in predicted:
+                if prefetcher.has(concept.id) or bank_size >= 10:
+                    continue
+                if self._generation_control is not None and not self._generation_control.allows(concept.id):
+                    continue
+                if not prefetcher.try_spend():
+                    PRACTICE_PREFETCH.inc("budget_exhausted")
+                    break
+                try:
+                    question = await self.generate_question(concept, now=now, priority=LLMPriority.BACKGROUND)
+                except (OllamaUnavailable, ValueError):
+                    PRACTICE_PREFETCH.inc("failed")
+                    continue
+                prefetcher.put(concept.id, question.id)
+                PRACTICE_PREFETCH.inc("generated")
+                generated += 1
+            return generated
+        finally:
+            prefetcher.end()
+
+    def _predict_next(self, *, served_concept_id: str, count: int, now: datetime) -> list[tuple[Concept, int]]:
+        """Likely next concepts with their bank sizes (storage thread)."""
+
+        cooling = self._progress_repo.cooling_ids(now=now)
+        candidates = [
+            concept
+            for concept in self._concepts_repo.list_concepts()
+            if concept.id not in cooling and concept.id != served_concept_id
+        ]
+        history = [] if self._history_repo is None else self._history_repo.recent_tag_history(limit=3)
+
+        selections = pick_due_concepts(
+            concepts=candidates,
+            progress_by_concept_id=self._progress_repo.get_many(concept.id for concept in candidates),
+            recent_tag_history=history,
+            count=count,
+            now=now,
+            rng=self._rng,
+        )
+        concepts_by_id = {concept.id: concept for concept in candidates}
+        return [
+            (concepts_by_id[selection.concept_id], len(self._bank_repo.get_bank(selection.concept_id)[1]))
+            for selection in selections
+        ]
+
+    async def plan_session(
+        self, *, recent_tag_history: list[set[str]], count: int, now: datetime | None = None
+    ) -> list[PlannedQuestion]:
+        """Pick up to `count` distinct due concepts and their questions in one pass.
+
+        Inputs:
+            recent_tag_history: Tag sets of recently served items, oldest first.
+            count: Maximum number of planned questions.
+
+        Outputs:
+            Planned questions in serving order. Where the bank rules decide to
+            generate, `question` is None and the caller is expected to call
+            `generate_question` (typically in the background).
+
+        Raises:
+            NoConceptsDue if no concepts are due.
+
+        Notes:
+            - Makes no LLM calls; runs as one call on the storage executor.
+            - Only items with a `question` are recorded as served; the caller
+              records generated ones with `record_served`.
+        """
+
+        return await self._io.run(
+            self._plan_session, recent_tag_history=recent_tag_history, count=count, now=now or self._clock()
+        )
+
+    def _plan_session(
+        self, *, recent_tag_history: list[set[str]], count: int, now: datetime
+    ) -> list[PlannedQuestion]:
+        cooling = self._progress_repo.cooling_ids(now=now)
+        due_concepts = [concept for concept in self._concepts_repo.list_concepts() if concept.id not in cooling]
+        progress_by = self._progress_repo.get_many(concept.id for concept in due_concepts)
+
+        selections = pick_due_concepts(
+            concepts=due_concepts,
+            progress_by_concept_id=progress_by,
+            recent_tag_history=recent_tag_history,
+            count=count,
+            now=now,
+            rng=self._rng,
+        )
+        if not selections:
+            raise NoConceptsDue("No concepts are due")
+
+        concepts_by_id = {concept.id: concept for concept in due_concepts}
+        planned = [
+            PlannedQuestion(
+                concept=concepts_by_id[selection.concept_id],
+                question=self._draw_from_bank(selection.concept_id),
+            )
+            for selection in selections
+        ]
+
+        # Only bank questions are handed out now; pending items are recorded by
+        # `record_served` once their question exists.
+        self._record_history(
+            [(item.concept, item.question.id) for item in planned if item.question is not None],
+            event="served",
+            now=now,
+        )
+        return planned
+
+    async def record_served(self, concept: Concept, question: PracticeQuestion, *, now: datetime | None = None) -> None:
+        """Record a question handed out outside `generate_one` / `plan_session` (e.g. a filled session slot)."""
+
+        await self._io.run(self._record_history, [(concept, question.id)], event="served", now=now or self._clock())
+
+    def _record_history(
+        self, items: list[tuple[Concept, str | None]], *, event: Literal["served", "answered"], now: datetime
+    ) -> None:
+        """Append `(concept, question_id)` pairs to the recent-history buffer, if configured."""
+
+        if self._history_repo is None:
+            return
+
+        self._history_repo.record(
+            RecentItem(concept_id=concept.id, question_id=question_id, tags=list(concept.tags), event=event, at=now)
+            for concept, question_id in items
+        )
+
+    def _draw_from_bank(self, concept_id: str) -> PracticeQuestion | None:
+        """Apply the bank rules: return a drawn question, or None to generate.
+
+        Notes:
+            With a generation controller, the stored `p_new` is scaled by LLM
+            load and the remaining generation budget (see
+            `GenerationController.p_new`).
+            Each draw counts one decision: `generate`, `reuse`, or `forced`
+            (an empty bank generating over budget).
+        """
+
+        p_new, questions = self._bank_repo.get_bank(concept_id)
+        control = self._generation_control
 
-        should_generate = False
         if len(questions) == 0:
-            should_generate = True
+            decision = "forced" if control is not None and not control.allows(concept_id) else "generate"
         elif len(questions) >= 10:
-            should_generate = False
+            decision = "reuse"
         else:
-            should_generate = self._rng.random() < p_new
+            if control is not None:
+                p_new = control.p_new(concept_id, p_new)
+            decision = "generate" if self._rng.random() < p_new else "reuse"
 
-        if not should_generate:
-            question = self._rng.choice(questions)
-            return GenerateResult(concept=concept, question=question)
+        PRACTICE_GENERATION_DECISIONS.inc(decision)
+        if decision != "reuse":
+            return None
+        return self._rng.choice(questions)
 
-        candidate = self._ollama.generate_json(model=self._generation_model, prompt=generation_prompt(concept=concept))
+    async def generate_question(
+        self, concept: Concept, *, now: datetime | None = None, priority: LLMPriority = LLMPriority.INTERACTIVE
+    ) -> PracticeQuestion:
+        """Generate an evaluator-approved question for `concept` and save it to the bank.
 
-        # Evaluate candidate (regenerate on failure, capped).
-        for _ in range(3):
-            verdict = self._ollama.generate_json(
-                model=self._evaluator_model, prompt=evaluator_prompt(concept=concept, candidate=candidate)
-            )
-            if bool(verdict.get("pass")):
-                break
-            candidate = self._ollama.generate_json(model=self._generation_model, prompt=generation_prompt(concept=concept))
-        else:
-            raise OllamaUnavailable("Evaluator rejected generated question repeatedly")
+        Inputs:
+            priority: LLM scheduling class; `BACKGROUND` for work nobody is
+                waiting on (session prefill, report replacements).
+
+        Notes:
+            The LLM usage of all attempts (also failed ones) is charged to
+            the concept's generation budget, if a controller is configured.
+
+        Raises:
+            OllamaUnavailable if AI is down or the evaluator keeps rejecting.
+            ValueError if the bank is already full.
+        """
+
+        now = now or self._clock()
+        with track_usage() as usage:
+            try:
+                candidate = await self._generate_approved(concept, priority=priority)
+            finally:
+                if self._generation_control is not None:
+                    self._generation_control.record(concept.id, usage)
 
-        question = self._bank_repo.upsert_question(
+        return await self._io.run(
+            self._bank_repo.upsert_question,
             concept_id=concept.id,
             question_text=str(candidate.get("question_text", "")).strip(),
             model_answer=str(candidate.get("model_answer", "")).strip(),
             rubric=str(candidate.get("rubric", "")).strip(),
-            now=self._now,
+            now=now,
         )
 
-        return GenerateResult(concept=concept, question=question)
+    async def _generate_approved(self, concept: Concept, *, priority: LLMPriority) -> dict:
+        """Generate candidates until the evaluator passes one (capped)."""
+
+        candidate = await self._ollama.generate_json(
+            model=self._generation_model, prompt=generation_prompt(concept=concept), priority=priority
+        )
+
+        # Evaluate candidate (regenerate on failure, capped).
+        for _ in range(3):
+            verdict = await self._ollama.generate_json(
+                model=self._evaluator_model,
+                prompt=evaluator_prompt(concept=concept, candidate=candidate),
+                priority=priority,
+            )
+            if bool(verdict.get("pass")):
+                return candidate
+            candidate = await self._ollama.generate_json(
+                model=self._generation_model, prompt=generation_prompt(concept=concept), priority=priority
+            )
+
+        raise OllamaUnavailable("Evaluator rejected generated question repeatedly")
+
+    async def review_reported_question(self, question_id: str) -> bool:
+        """Re-evaluate a reported question; remove it if the evaluator confirms it is poor.
+
+        Outputs:
+            True if the question was removed; False if it passed or no longer
+            exists (nothing left to review).
+
+        Raises:
+            OllamaUnavailable if AI is down.
+        """
+
+        question = await self._io.run(self._bank_repo.get_question, question_id)
+        if question is None:
+            return False
+        concept = await self._io.run(self._concepts_repo.get_concept, question.concept_id)
+        if concept is None:
+            return False
+
+        candidate = {
+            "question_text": question.question_text,
+            "model_answer": question.model_answer,
+            "rubric": question.rubric,
+        }
+        verdict = await self._ollama.generate_json(
+            model=self._evaluator_model,
+            prompt=evaluator_prompt(concept=concept, candidate=candidate),
+            priority=LLMPriority.BACKGROUND,
+        )
+        if bool(verdict.get("pass")):
+            return False
+
+        return await self._io.run(self._bank_repo.remove_question, question_id)
+
+    async def replace_question(self, concept_id: str) -> PracticeQuestion | None:
+        """Generate a replacement question for `concept_id` (None if the concept is gone).
+
+        Raises:
+            As `generate_question`.
+        """
+
+        concept = await self._io.run(self._concepts_repo.get_concept, concept_id)
+        if concept is None:
+            return None
+        return await self.generate_question(concept, priority=LLMPriority.BACKGROUND)
+
+    def _pick_concept(self, *, recent_tags: set[str], now: datetime) -> SelectionResult | None:
+        """Pick a due concept, via the shared incremental selector when available."""
+
+        if self._selector_cache is None:
+            # The due index lets us drop cooling concepts before weighting, so
+            # not-yet-due concepts never reach `pick_due_concept`. Order is kept,
+            # which keeps selections identical for a given RNG.
+            cooling = self._progress_repo.cooling_ids(now=now)
+            due_concepts = [concept for concept in self._concepts_repo.list_concepts() if concept.id not in cooling]
+            progress_by = self._progress_repo.get_many(concept.id for concept in due_concepts)
+
+            return pick_due_concept(
+                concepts=due_concepts,
+                progress_by_concept_id=progress_by,
+                recent_tags=recent_tags,
+                now=now,
+                rng=self._rng,
+                tag_overlap_by_concept_id=self._concepts_repo.tag_overlap(recent_tags),
+            )
+
+        cache = self._selector_cache
+        with cache.lock:
+            version = (self._concepts_repo.signature(), self._progress_repo.signature())
+            if cache.selector is None or cache.version != version:
+                cache.selector = IncrementalConceptSelector(
+                    concepts=self._concepts_repo.list_concepts(),
+                    progress_by_concept_id=self._progress_repo.get_all(),
+                    recent_tags=recent_tags,
+                    now=now,
+                )
+                cache.version = version
+
+            cache.selector.set_recent_tags(recent_tags)
+            return cache.selector.pick(now=now, rng=self._rng)
+
+    def _apply_progress_to_selector(self, progress: ConceptProgress, *, previous_signature: object) -> None:
+        """Push a progress write into the shared selector.
+
+        The selector is only patched if it reflected the file as it was right
+        before this write; otherwise it is left stale and rebuilt on next use.
+        """
 
-    def submit(self, *, concept_id: str, question_id: str, user_answer: str) -> SubmitResult:
+        cache = self._selector_cache
+        if cache is None:
+            return
+
+        with cache.lock:
+            concepts_signature = self._concepts_repo.signature()
+            if cache.selector is not None and cache.version == (concepts_signature, previous_signature):
+                cache.selector.update_progress(progress.model_copy())
+                cache.version = (concepts_signature, self._progress_repo.signature())
+
+    async def submit(
+        self, *, concept_id: str, question_id: str, user_answer: str, now: datetime | None = None
+    ) -> SubmitResult:
         """Grade an answer and update progress.
 
         Raises:
@@ -138,29 +499,47 @@ class PracticeService:
             ValueError if question is unknown.
         """
 
-        concept = self._concepts_repo.get_concept(concept_id)
+        now = now or self._clock()
+        concept = await self._io.run(self._concepts_repo.get_concept, concept_id)
         if concept is None:
             raise ValueError("Concept not found")
 
-        question = self._bank_repo.get_question(question_id)
+        question = await self._io.run(self._bank_repo.get_question, question_id)
         if question is None:
             raise ValueError("Question not found")
 
-        result = self._ollama.generate_json(
+        result = await self._ollama.generate_json(
             model=self._generation_model,
             prompt=grading_prompt(concept=concept, question=question, user_answer=user_answer),
+            priority=LLMPriority.GRADING,
         )
 
         score = float(result.get("score", 0.0))
         feedback = str(result.get("feedback", "")).strip()
 
+        return await self._io.run(
+            self._record_grade,
+            concept=concept,
+            question_id=question_id,
+            user_answer=user_answer,
+            score=score,
+            feedback=feedback,
+            now=now,
+        )
+
+    def _record_grade(
+        self, *, concept: Concept, question_id: str, user_answer: str, score: float, feedback: str, now: datetime
+    ) -> SubmitResult:
+        """Persist a graded attempt and the resulting progress (storage thread)."""
+
+        concept_id = concept.id
         attempt = self._attempts_repo.append_attempt(
             concept_id=concept_id,
             question_id=question_id,
             user_answer=user_answer,
             score=score,
             feedback=feedback,
-            now=self._now,
+            now=now,
         )
 
         progress = self._progress_repo.get(concept_id) or ConceptProgress(concept_id=concept_id)
@@ -170,13 +549,16 @@ class PracticeService:
         progress.mastery_streak = mastery_update.mastery_streak
 
         if score >= 85.0:
-            progress.last_correct_at = self._now
+            progress.last_correct_at = now
 
         cooldown_minutes = compute_cooldown_minutes(progress.mastery_streak)
-        next_due = compute_next_due_at(now=self._now, score=score, cooldown_minutes=cooldown_minutes)
+        next_due = compute_next_due_at(now=now, score=score, cooldown_minutes=cooldown_minutes)
         if next_due is not None:
             progress.next_due_at = next_due
 
+        previous_signature = self._progress_repo.signature()
         self._progress_repo.upsert(progress)
+        self._apply_progress_to_selector(progress, previous_signature=previous_signature)
+        self._record_history([(concept, question_id)], event="answered", now=now)
 
         return SubmitResult(attempt=attempt, progress=progress)
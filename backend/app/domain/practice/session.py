@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Literal
+from uuid import uuid4
+
+from app.domain.practice.models import PracticeQuestion
+
+SlotStatus = Literal["ready", "pending", "failed"]
+
+
+@dataclass(frozen=True)
+class SessionSlot:
+    """One planned question in a practice session.
+
+    Fields:
+        concept_id: Concept the slot practices.
+        status: `ready` (question attached), `pending` (being generated) or
+            `failed` (generation gave up; the client should skip the slot).
+        question: The question once `ready`.
+        error: Failure reason when `failed`.
+    """
+
+    concept_id: str
+    status: SlotStatus
+    question: PracticeQuestion | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class SessionPlan:
+    """An ordered list of planned questions returned by one planning call."""
+
+    id: str
+    created_at: datetime
+    slots: tuple[SessionSlot, ...] = field(default_factory=tuple)
+
+
+class SessionPlanStore:
+    """Bounded in-memory store of session plans.
+
+    Purpose:
+        Let the planning endpoint return immediately and have background
+        generation fill `pending` slots that clients poll for.
+
+    Notes:
+        - Plans are ephemeral; they are lost on restart.
+        - Oldest plans are evicted once `max_plans` is exceeded.
+        - Thread-safe; plans are immutable snapshots replaced on update.
+    """
+
+    def __init__(self, *, max_plans: int = 256) -> None:
+        self._max_plans = max(1, int(max_plans))
+        self._plans: OrderedDict[str, SessionPlan] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, slots: list[SessionSlot], *, now: datetime) -> SessionPlan:
+        """Store a new plan and return it."""
+
+        plan = SessionPlan(id=str(uuid4()), created_at=now, slots=tuple(slots))
+        with self._lock:
+            self._plans[plan.id] = plan
+            while len(self._plans) > self._max_plans:
+                self._plans.popitem(last=False)
+        return plan
+
+    def get(self, plan_id: str) -> SessionPlan | None:
+        """Return the current snapshot of a plan, or None if unknown/evicted."""
+
+        with self._lock:
+            return self._plans.get(plan_id)
+
+    def update_slot(self, plan_id: str, position: int, slot: SessionSlot) -> None:
+        """Replace one slot of a plan (no-op if the plan was evicted)."""
+
+        with self._lock:
+            plan = self._plans.get(plan_id)
+            if plan is None or not 0 <= position < len(plan.slots):
+                return
+            slots = list(plan.slots)
+            slots[position] = slot
+            self._plans[plan_id] = replace(plan, slots=tuple(slots))
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from app.domain.concepts import Concept
+
+
+class TagIndex:
+    """Inverted index from tag to concept ids.
+
+    Purpose:
+        Answer "which concepts share these tags, and how many?" by touching
+        only the concepts that carry one of the tags, instead of building a tag
+        set for every concept in the library.
+
+    Structure:
+        - Tags are interned to small integer ids (`_tag_ids` / `_tag_names`).
+        - `_concepts_by_tag[tag_id]` holds the ids of concepts with that tag.
+        - `_tags_by_concept[concept_id]` holds the concept's distinct tag ids.
+
+    Invariants:
+        - Empty tags are ignored, matching `compute_concept_weight`.
+        - Interned ids are never reused while the index lives.
+    """
+
+    def __init__(self, concepts: Iterable[Concept] = ()) -> None:
+        self._tag_ids: dict[str, int] = {}
+        self._tag_names: list[str] = []
+        self._concepts_by_tag: list[set[str]] = []
+        self._tags_by_concept: dict[str, tuple[int, ...]] = {}
+        self.reset(concepts)
+
+    def reset(self, concepts: Iterable[Concept]) -> None:
+        """Replace the index contents with `concepts`."""
+
+        self._tag_ids = {}
+        self._tag_names = []
+        self._concepts_by_tag = []
+        self._tags_by_concept = {}
+        for concept in concepts:
+            self.add(concept)
+
+    def _intern(self, tag: str) -> int:
+        tag_id = self._tag_ids.get(tag)
+        if tag_id is None:
+            tag_id = len(self._tag_names)
+            self._tag_ids[tag] = tag_id
+            self._tag_names.append(tag)
+            self._concepts_by_tag.append(set())
+        return tag_id
+
+    def add(self, concept: Concept) -> None:
+        """Index a concept, replacing any previous entry with the same id."""
+
+        self.remove(concept.id)
+        tag_ids = tuple(sorted({self._intern(tag) for tag in concept.tags if tag}))
+        self._tags_by_concept[concept.id] = tag_ids
+        for tag_id in tag_ids:
+            self._concepts_by_tag[tag_id].add(concept.id)
+
+    def remove(self, concept_id: str) -> None:
+        """Drop a concept from the index (no-op if unknown)."""
+
+        for tag_id in self._tags_by_concept.pop(concept_id, ()):
+            self._concepts_by_tag[tag_id].discard(concept_id)
+
+    def __len__(self) -> int:
+        return len(self._tags_by_concept)
+
+    def __contains__(self, concept_id: object) -> bool:
+        return concept_id in self._tags_by_concept
+
+    def concept_ids(self) -> list[str]:
+        """Return indexed concept ids (file order after `reset`, then insertion order)."""
+
+        return list(self._tags_by_concept)
+
+    def tags_for(self, concept_id: str) -> list[str]:
+        """Return the distinct non-empty tags of a concept ([] if unknown)."""
+
+        return [self._tag_names[tag_id] for tag_id in self._tags_by_concept.get(concept_id, ())]
+
+    def concepts_with_any(self, tags: Iterable[str]) -> set[str]:
+        """Return ids of concepts carrying at least one of `tags`."""
+
+        out: set[str] = set()
+        for tag in tags:
+            tag_id = self._tag_ids.get(tag)
+            if tag_id is not None:
+                out.update(self._concepts_by_tag[tag_id])
+        return out
+
+    def tag_overlap(self, tags: Iterable[str]) -> dict[str, int]:
+        """Return `|concept tags ∩ tags|` for every concept with a non-zero overlap.
+
+        Concepts missing from the result have an overlap of 0.
+        """
+
+        counts: dict[str, int] = {}
+        for tag in set(tags):
+            tag_id = self._tag_ids.get(tag)
+            if tag_id is None:
+                continue
+            for concept_id in self._concepts_by_tag[tag_id]:
+                counts[concept_id] = counts.get(concept_id, 0) + 1
+        return counts
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class TimeRange:
+    """Half-open time range `[since, until)`; either bound may be open.
+
+    Notes:
+        With no bounds every value matches, including None. With a bound,
+        None never matches (the record has no time to compare).
+    """
+
+    since: datetime | None = None
+    until: datetime | None = None
+
+    @property
+    def unbounded(self) -> bool:
+        return self.since is None and self.until is None
+
+    def __contains__(self, value: datetime | None) -> bool:
+        if self.unbounded:
+            return True
+        if value is None:
+            return False
+        if self.since is not None and value < self.since:
+            return False
+        return self.until is None or value < self.until
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable, Sequence
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+import httpx
+
+from app.core.metrics import (
+    LLM_BACKEND_EJECTIONS,
+    LLM_BACKEND_HEALTHY,
+    LLM_BACKEND_OUTSTANDING,
+    LLM_BACKEND_REQUESTS,
+)
+from app.infra.llm.errors import OllamaUnavailable
+
+# A backend that has the model loaded is preferred while it has at most this
+# many more outstanding requests than the least loaded backend: loading a
+# model costs seconds, one queued request usually less.
+_AFFINITY_SLACK = 1
+
+
+def normalize_model(name: str) -> str:
+    """Ollama's canonical model name (`llama3` -> `llama3:latest`)."""
+
+    name = name.strip()
+    return name if ":" in name else f"{name}:latest"
+
+
+@dataclass(frozen=True)
+class OllamaBackendConfig:
+    """One Ollama server.
+
+    Fields:
+        url: Base URL, e.g. `http://gpu-1:11434`.
+        models: Models this server may be sent. Empty means "not
+            configured": the inventory is taken from `/api/tags` by the
+            health check, and any model is routed here until then.
+    """
+
+    url: str
+    models: frozenset[str] = frozenset()
+
+
+def parse_backends(spec: str) -> list[OllamaBackendConfig]:
+    """Parse `url[=model|model...]` entries separated by commas.
+
+    Example: `"http://gpu-1:11434=qwen2.5:14b|llama3.1:8b,http://gpu-2:11434"`.
+
+    Raises:
+        ValueError: on an entry without a URL or a duplicate URL.
+    """
+
+    backends: list[OllamaBackendConfig] = []
+    for entry in spec.split(","):
+        if not entry.strip():
+            continue
+        url, _, models = entry.partition("=")
+        url = url.strip().rstrip("/")
+        if not url or any(b.url == url for b in backends):
+            raise ValueError(f"Invalid Ollama backend entry: {entry!r}")
+        names = frozenset(normalize_model(m) for m in models.split("|") if m.strip())
+        backends.append(OllamaBackendConfig(url=url, models=names))
+    return backends
+
+
+class OllamaBackend:
+    """Routing state of one backend (owned by `BackendPool`)."""
+
+    def __init__(self, config: OllamaBackendConfig) -> None:
+        self.url = config.url
+        self.configured = bool(config.models)
+        self.models: frozenset[str] | None = config.models or None  # None: not known yet
+        self.outstanding = 0
+        self.healthy = True
+        self.failures = 0
+        self.warm: dict[str, float] = {}  # model -> last successful call (monotonic)
+
+    def serves(self, model: str) -> bool:
+        return self.models is None or normalize_model(model) in self.models
+
+    def __repr__(self) -> str:
+        return f"OllamaBackend({self.url!r}, outstanding={self.outstanding}, healthy={self.healthy})"
+
+
+class BackendPool:
+    """Routes LLM calls across Ollama backends.
+
+    Purpose:
+        Spread generation over several Ollama servers while keeping each
+        model on the servers where it is already loaded.
+
+    Routing (`lease`):
+        - Only backends whose inventory contains the model are candidates;
+          among them, only healthy ones (if all are ejected, all candidates
+          are tried rather than failing every call).
+        - Least outstanding requests wins. Backends at `max_concurrency`
+          rank last; a backend that served the model within `warm_seconds`
+          wins ties and may carry one extra request (model affinity).
+
+    Health:
+        - `eject_after_failures` consecutive transport errors or 5xx
+          responses eject a backend.
+        - The health check (`check_all`, every `health_interval_seconds`
+          once `start`ed) probes `GET /api/tags`: a failing backend is
+          ejected, a responding one is re-added, and backends without a
+          configured inventory learn their models.
+
+    Notes:
+        - State is only touched from the event loop; no locks.
+        - Metrics per backend URL: `llm_backend_requests_total`,
+          `llm_backend_outstanding`, `llm_backend_healthy`,
+          `llm_backend_ejections_total`.
+    """
+
+    def __init__(
+        self,
+        backends: Sequence[OllamaBackendConfig],
+        *,
+        max_concurrency: int = 2,
+        eject_after_failures: int = 2,
+        warm_seconds: float = 300.0,
+        health_interval_seconds: float = 10.0,
+        health_timeout_seconds: float = 5.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not backends:
+            raise ValueError("At least one Ollama backend is required")
+        self.backends = [OllamaBackend(config) for config in backends]
+        self.max_concurrency = max(1, int(max_concurrency))
+        self._eject_after = max(1, int(eject_after_failures))
+        self._warm_seconds = warm_seconds
+        self._health_interval = health_interval_seconds
+        self._health_timeout = health_timeout_seconds
+        self._transport = transport
+        self._clock = clock
+        self._task: asyncio.Task[None] | None = None
+        for backend in self.backends:
+            LLM_BACKEND_HEALTHY.set(1, backend.url)
+
+    @property
+    def capacity(self) -> int:
+        """Concurrent calls all backends together are sized for."""
+
+        return self.max_concurrency * len(self.backends)
+
+    def pick(self, model: str) -> OllamaBackend:
+        """Choose the backend for the next `model` call (see class docstring).
+
+        Raises:
+            OllamaUnavailable: if no backend serves `model`.
+        """
+
+        candidates = [b for b in self.backends if b.serves(model)]
+        if not candidates:
+            raise OllamaUnavailable(f"No Ollama backend serves model {model!r}")
+        candidates = [b for b in candidates if b.healthy] or candidates
+
+        now = self._clock()
+        model = normalize_model(model)
+
+        def rank(backend: OllamaBackend) -> tuple[bool, int, bool]:
+            warm = now - backend.warm.get(model, float("-inf")) <= self._warm_seconds
+            full = backend.outstanding >= self.max_concurrency
+            return (full, backend.outstanding - (_AFFINITY_SLACK if warm else 0), not warm)
+
+        return min(candidates, key=rank)
+
+    @asynccontextmanager
+    async def lease(self, model: str) -> AsyncIterator[OllamaBackend]:
+        """Pick a backend for `model` and count the call as outstanding on it."""
+
+        backend = self.pick(model)
+        backend.outstanding += 1
+        LLM_BACKEND_OUTSTANDING.inc(backend.url)
+        try:
+            yield backend
+        finally:
+            backend.outstanding -= 1
+            LLM_BACKEND_OUTSTANDING.dec(backend.url)
+
+    def record_response(self, backend: OllamaBackend, model: str, status_code: int) -> None:
+        """Account for a call that got an HTTP response."""
+
+        LLM_BACKEND_REQUESTS.inc(backend.url, "ok" if status_code < 400 else "error")
+        if status_code >= 500:
+            self._record_failure(backend)
+            return
+        self._mark_up(backend)
+        if status_code < 400:
+            backend.warm[normalize_model(model)] = self._clock()
+
+    def record_error(self, backend: OllamaBackend) -> None:
+        """Account for a call that failed without a response (connect error, timeout)."""
+
+        LLM_BACKEND_REQUESTS.inc(backend.url, "error")
+        self._record_failure(backend)
+
+    def _record_failure(self, backend: OllamaBackend) -> None:
+        backend.failures += 1
+        if backend.failures >= self._eject_after:
+            self._eject(backend)
+
+    def _eject(self, backend: OllamaBackend) -> None:
+        if backend.healthy:
+            backend.healthy = False
+            backend.warm.clear()
+            LLM_BACKEND_EJECTIONS.inc(backend.url)
+            LLM_BACKEND_HEALTHY.set(0, backend.url)
+
+    def _mark_up(self, backend: OllamaBackend) -> None:
+        backend.failures = 0
+        if not backend.healthy:
+            backend.healthy = True
+            LLM_BACKEND_HEALTHY.set(1, backend.url)
+
+    async def check(self, backend: OllamaBackend) -> bool:
+        """Probe one backend; eject or re-add it. Returns whether it is up."""
+
+        try:
+            async with httpx.AsyncClient(timeout=self._health_timeout, transport=self._transport) as client:
+                response = await client.get(f"{backend.url}/api/tags")
+            response.raise_for_status()
+            models = response.json().get("models", [])
+        except Exception:  # noqa: BLE001
+            self._eject(backend)
+            return False
+
+        if not backend.configured:
+            backend.models = frozenset(normalize_model(m["name"]) for m in models if m.get("name"))
+        self._mark_up(backend)
+        return True
+
+    async def check_all(self) -> None:
+        """Probe every backend concurrently."""
+
+        await asyncio.gather(*(self.check(backend) for backend in self.backends))
+
+    async def start(self) -> None:
+        """Start the periodic health check (disabled when the interval is 0)."""
+
+        if self._health_interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._health_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _health_loop(self) -> None:
+        while True:
+            await self.check_all()
+            await asyncio.sleep(self._health_interval)
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Literal
+
+from app.infra.llm.errors import OllamaUnavailable
+
+CassetteMode = Literal["record", "replay"]
+
+# Ollama response fields worth keeping; `context` (the token array) is large
+# and never read.
+_KEPT_FIELDS = ("response", "total_duration", "prompt_eval_count", "eval_count")
+
+
+def prompt_hash(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:32]
+
+
+@dataclass(frozen=True)
+class CassetteEntry:
+    """One recorded Ollama response.
+
+    Fields:
+        model, prompt_hash: Lookup key (the prompt itself is not stored).
+        status: HTTP status of the response.
+        body: The kept JSON fields for a success, the response text for an
+            error status.
+        seconds: Request time as measured by the client (queue wait excluded).
+    """
+
+    model: str
+    prompt_hash: str
+    status: int
+    body: dict[str, Any] | str
+    seconds: float
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {"m": self.model, "p": self.prompt_hash, "s": self.status, "b": self.body, "t": round(self.seconds, 6)},
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+
+    @classmethod
+    def from_json(cls, line: str) -> CassetteEntry:
+        raw = json.loads(line)
+        return cls(model=raw["m"], prompt_hash=raw["p"], status=int(raw["s"]), body=raw["b"], seconds=float(raw["t"]))
+
+
+def _open(path: Path, mode: str) -> IO[str]:
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return path.open(mode, encoding="utf-8")
+
+
+class OllamaCassette:
+    """Recorded Ollama responses, for profiling without model nondeterminism.
+
+    Purpose:
+        Capture real traffic once (`record`) and serve it back (`replay`) so
+        end-to-end benchmarks of the practice and report flows are
+        repeatable and need no GPU.
+
+    Format:
+        NDJSON, one `CassetteEntry` per line with short keys; gzip-compressed
+        when the path ends in `.gz`. Recording appends, so several capture
+        runs can share a cassette.
+
+    Replay:
+        - Entries for the same `(model, prompt hash)` are served in recorded
+          order and then cycled; an unknown key raises `OllamaUnavailable`
+          (a cassette miss is an error, not a silent live call).
+        - Each response is delayed by its recorded time times
+          `latency_scale` (0 = no delay).
+
+    Notes:
+        - Transport errors are not recorded; error statuses are.
+        - Recording writes and flushes one line per call (thread-safe).
+    """
+
+    def __init__(self, path: str | Path, *, mode: CassetteMode, latency_scale: float = 1.0) -> None:
+        self.path = Path(path)
+        self.mode = mode
+        self.latency_scale = max(0.0, latency_scale)
+        self.recorded = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, str], list[CassetteEntry]] = {}
+        self._cursor: dict[tuple[str, str], int] = {}
+        self._file: IO[str] | None = None
+
+        if mode == "replay":
+            if not self.path.exists():
+                raise FileNotFoundError(f"Cassette not found: {self.path}")
+            with _open(self.path, "r") as handle:
+                for line in handle:
+                    if line.strip():
+                        entry = CassetteEntry.from_json(line)
+                        self._entries.setdefault((entry.model, entry.prompt_hash), []).append(entry)
+
+    def __len__(self) -> int:
+        """Entries loaded for replay."""
+
+        return sum(len(entries) for entries in self._entries.values())
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def record(self, *, model: str, prompt: str, status: int, body: dict[str, Any] | str, seconds: float) -> None:
+        """Append one response (record mode)."""
+
+        if isinstance(body, dict):
+            body = {key: body[key] for key in _KEPT_FIELDS if key in body}
+        entry = CassetteEntry(model=model, prompt_hash=prompt_hash(prompt), status=status, body=body, seconds=seconds)
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = _open(self.path, "a")
+            self._file.write(entry.to_json() + "\n")
+            self._file.flush()
+            self.recorded += 1
+
+    def lookup(self, *, model: str, prompt: str) -> CassetteEntry:
+        """Next recorded response for this model and prompt.
+
+        Raises:
+            OllamaUnavailable: if the cassette has no response for them.
+        """
+
+        key = (model, prompt_hash(prompt))
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                self.misses += 1
+                raise OllamaUnavailable(f"Cassette has no response for model {model!r}, prompt {key[1]}")
+            cursor = self._cursor.get(key, 0)
+            self._cursor[key] = cursor + 1
+            return entries[cursor % len(entries)]
+
+    async def play(self, *, model: str, prompt: str) -> CassetteEntry:
+        """`lookup` and wait out the (scaled) recorded latency."""
+
+        entry = self.lookup(model=model, prompt=prompt)
+        if self.latency_scale > 0:
+            await asyncio.sleep(entry.seconds * self.latency_scale)
+        return entry
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
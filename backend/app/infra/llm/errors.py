@@ -0,0 +1,13 @@
+from __future__ import annotations
+
+
+class OllamaUnavailable(RuntimeError):
+    """Raised when Ollama cannot be reached or returns an error."""
+
+
+class LLMOverloaded(OllamaUnavailable):
+    """Raised when the LLM queue is full and the call was not admitted.
+
+    Subclasses `OllamaUnavailable`, so callers that only handle "AI is down"
+    keep working; HTTP routes map it to 429 instead of 503.
+    """
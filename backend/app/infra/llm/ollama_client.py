@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 import json
+import time
 from dataclasses import dataclass
 
 import httpx
 
-
-class OllamaUnavailable(RuntimeError):
-    """Raised when Ollama cannot be reached or returns an error."""
+from app.core.metrics import LLM_REQUEST_DURATION
+from app.core.profiling import record_phase
+from app.infra.llm.backends import BackendPool, OllamaBackendConfig
+from app.infra.llm.cassette import OllamaCassette
+from app.infra.llm.errors import LLMOverloaded, OllamaUnavailable  # noqa: F401 (re-exported)
+from app.infra.llm.scheduler import LLMPriority, LLMScheduler
+from app.infra.llm.usage import record_usage
 
 
 @dataclass(frozen=True)
@@ -23,28 +28,109 @@ class OllamaClient:
         Provide a single place for calling Ollama and handling timeouts/errors.
 
     Notes:
-        We use the Ollama `/api/generate` endpoint with JSON schema instructions.
+        - We use the Ollama `/api/generate` endpoint with JSON schema instructions.
+        - Calls are async and go through an `LLMScheduler`: bounded
+          concurrency (overall and per model), priority classes and a
+          bounded queue. Waiting callers hold no thread.
+        - Completed calls report their cost (Ollama's duration and token
+          counts) to the active `track_usage` block, if any.
+        - Each call is sent to one backend of a `BackendPool` (least
+          outstanding requests, model affinity, health ejection). `base_url`
+          is shorthand for a pool of one.
+        - Without an explicit scheduler, one sized for the pool
+          (`max_concurrency` per backend) with default queue settings is used.
+        - With a cassette, responses are recorded to it, or (replay mode)
+          served from it instead of calling a backend. Scheduling, metrics
+          and usage reporting stay the same, so replayed runs profile the
+          same code paths.
+        - In a profiled request, slot wait and call time are added to the
+          `llm_queue` and `llm` profile phases.
     """
 
-    def __init__(self, *, base_url: str, timeout_seconds: float = 30.0) -> None:
-        self._base_url = base_url.rstrip("/")
+    def __init__(
+        self,
+        *,
+        base_url: str | None = None,
+        pool: BackendPool | None = None,
+        timeout_seconds: float = 30.0,
+        max_concurrency: int = 2,
+        scheduler: LLMScheduler | None = None,
+        cassette: OllamaCassette | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        if pool is None:
+            if base_url is None:
+                raise ValueError("OllamaClient needs base_url or pool")
+            pool = BackendPool(
+                [OllamaBackendConfig(url=base_url.rstrip("/"))], max_concurrency=max_concurrency, transport=transport
+            )
+        self.pool = pool
         self._timeout = timeout_seconds
+        self.scheduler = scheduler or LLMScheduler(max_concurrency=pool.capacity)
+        self.cassette = cassette
+        self._transport = transport
 
-    def generate_json(self, *, model: str, prompt: str) -> dict:
+    async def generate_json(
+        self, *, model: str, prompt: str, priority: LLMPriority = LLMPriority.INTERACTIVE
+    ) -> dict:
         """Generate a JSON object from the model.
 
         Inputs:
             model: Ollama model name.
             prompt: Prompt text.
+            priority: Scheduling class (grading > interactive > background).
 
         Outputs:
             Parsed JSON object.
 
         Raises:
-            OllamaUnavailable: if Ollama is unreachable or returns non-JSON.
+            OllamaUnavailable: if Ollama is unreachable or returns non-JSON,
+                no backend serves `model`, no slot freed up within the
+                scheduler's queue timeout, or a replay cassette has no
+                response for the prompt.
+            LLMOverloaded: if the scheduler queue is full.
         """
 
-        url = f"{self._base_url}/api/generate"
+        queued = time.perf_counter()
+        async with self.scheduler.slot(model, priority):
+            started = time.perf_counter()
+            record_phase("llm_queue", started - queued)
+            try:
+                if self.cassette is not None and self.cassette.replaying:
+                    entry = await self.cassette.play(model=model, prompt=prompt)
+                    status_code, body, elapsed = entry.status, entry.body, entry.seconds
+                    LLM_REQUEST_DURATION.observe(elapsed, model, "error" if status_code >= 400 else "ok")
+                else:
+                    status_code, body, elapsed = await self._post(model=model, prompt=prompt)
+                    if self.cassette is not None:
+                        self.cassette.record(model=model, prompt=prompt, status=status_code, body=body, seconds=elapsed)
+            finally:
+                record_phase("llm", time.perf_counter() - started)
+
+        if status_code >= 400 or not isinstance(body, dict):
+            raise OllamaUnavailable(f"Ollama error {status_code}: {body}")
+
+        text = body.get("response", "")
+        record_usage(
+            seconds=body["total_duration"] / 1e9 if body.get("total_duration") else elapsed,
+            tokens=int(body.get("prompt_eval_count") or 0) + int(body.get("eval_count") or 0),
+        )
+
+        try:
+            return json.loads(text)
+        except Exception as exc:  # noqa: BLE001
+            raise OllamaUnavailable(f"Model returned non-JSON: {text[:200]}") from exc
+
+    async def _post(self, *, model: str, prompt: str) -> tuple[int, dict | str, float]:
+        """Call `/api/generate` on a backend from the pool.
+
+        Outputs:
+            `(status, body, seconds)`: the parsed JSON body for a success,
+            the response text for an error status.
+
+        Raises:
+            OllamaUnavailable: on transport errors, or if no backend serves `model`.
+        """
 
         payload = {
             "model": model,
@@ -52,19 +138,19 @@ class OllamaClient:
             "stream": False,
         }
 
-        try:
-            with httpx.Client(timeout=self._timeout) as client:
-                response = client.post(url, json=payload)
-        except Exception as exc:  # noqa: BLE001
-            raise OllamaUnavailable(str(exc)) from exc
+        async with self.pool.lease(model) as backend:
+            start = time.perf_counter()
+            try:
+                async with httpx.AsyncClient(timeout=self._timeout, transport=self._transport) as client:
+                    response = await client.post(f"{backend.url}/api/generate", json=payload)
+            except Exception as exc:  # noqa: BLE001
+                LLM_REQUEST_DURATION.observe(time.perf_counter() - start, model, "error")
+                self.pool.record_error(backend)
+                raise OllamaUnavailable(f"{backend.url}: {exc}") from exc
+            elapsed = time.perf_counter() - start
+            LLM_REQUEST_DURATION.observe(elapsed, model, "error" if response.status_code >= 400 else "ok")
+            self.pool.record_response(backend, model, response.status_code)
 
         if response.status_code >= 400:
-            raise OllamaUnavailable(f"Ollama error {response.status_code}: {response.text}")
-
-        data = response.json()
-        text = data.get("response", "")
-
-        try:
-            return json.loads(text)
-        except Exception as exc:  # noqa: BLE001
-            raise OllamaUnavailable(f"Model returned non-JSON: {text[:200]}") from exc
+            return response.status_code, response.text, elapsed
+        return response.status_code, response.json(), elapsed
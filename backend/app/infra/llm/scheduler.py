@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from bisect import insort
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from enum import IntEnum
+
+from app.core.metrics import LLM_QUEUE_DEPTH, LLM_QUEUE_WAIT, LLM_REJECTED
+from app.infra.llm.errors import LLMOverloaded, OllamaUnavailable
+
+
+class LLMPriority(IntEnum):
+    """Scheduling class of an LLM call; lower values are served first."""
+
+    GRADING = 0
+    INTERACTIVE = 1
+    BACKGROUND = 2
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+@dataclass(eq=False)
+class _Waiter:
+    priority: LLMPriority
+    seq: int
+    model: str
+    future: asyncio.Future[None]
+    enqueued_at: float
+
+    @property
+    def order(self) -> tuple[int, int]:
+        return (self.priority, self.seq)
+
+
+@dataclass
+class _LoopState:
+    running_total: int = 0
+    running: dict[str, int] = field(default_factory=dict)
+    waiters: list[_Waiter] = field(default_factory=list)  # sorted by (priority, seq)
+    seq: int = 0
+
+
+def parse_model_concurrency(spec: str) -> dict[str, int]:
+    """Parse `model=limit` pairs, e.g. `"qwen2.5:14b=1,llama3.1:8b=2"`.
+
+    Raises:
+        ValueError: on a malformed pair or a limit below 1.
+    """
+
+    limits: dict[str, int] = {}
+    for pair in spec.split(","):
+        if not pair.strip():
+            continue
+        model, sep, limit = pair.rpartition("=")
+        if not sep or not model.strip() or int(limit) < 1:
+            raise ValueError(f"Invalid model concurrency entry: {pair!r}")
+        limits[model.strip()] = int(limit)
+    return limits
+
+
+class LLMScheduler:
+    """Admission control and priority queueing in front of the LLM.
+
+    Purpose:
+        Serve interactive grading before interactive generation before
+        background work when Ollama is saturated, and refuse work quickly
+        instead of letting the queue grow without bound.
+
+    Rules:
+        - A call runs when fewer than `max_concurrency` calls run in total
+          and fewer than its model's limit run for that model
+          (`model_concurrency`, default `max_concurrency`).
+        - Otherwise it waits; freed slots go to the first waiter in
+          (priority, arrival) order whose model has room. Slots are handed
+          over directly, so new arrivals never overtake waiters.
+        - At most `max_queue_depth` calls wait. When full, a new call sheds
+          the newest waiter of a strictly lower priority (which gets
+          `LLMOverloaded`); if there is none, the new call gets
+          `LLMOverloaded`.
+        - A call that waits longer than `queue_timeout_seconds` gets
+          `OllamaUnavailable`.
+
+    Notes:
+        - asyncio state is bound to one event loop; the scheduler is
+          app-scoped and may outlive a loop (tests), so state is recreated
+          per loop.
+        - Queue wait per model and priority is recorded in
+          `llm_queue_wait_seconds`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 2,
+        model_concurrency: Mapping[str, int] | None = None,
+        max_queue_depth: int = 32,
+        queue_timeout_seconds: float = 120.0,
+    ) -> None:
+        self.max_concurrency = max(1, int(max_concurrency))
+        self._model_limits = dict(model_concurrency or {})
+        self.max_queue_depth = max(0, int(max_queue_depth))
+        self._queue_timeout = queue_timeout_seconds
+        self._state_value: _LoopState | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def limit_for(self, model: str) -> int:
+        return min(self.max_concurrency, self._model_limits.get(model, self.max_concurrency))
+
+    def load(self) -> float:
+        """Running plus waiting calls per slot: 0 idle, 1 saturated, >1 queueing.
+
+        Notes:
+            Safe to call from other threads (a racy but consistent-enough
+            snapshot of two counters).
+        """
+
+        state = self._state_value
+        if state is None:
+            return 0.0
+        return (state.running_total + len(state.waiters)) / self.max_concurrency
+
+    def _state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
+        if self._state_value is None or self._loop is not loop:
+            self._state_value = _LoopState()
+            self._loop = loop
+        return self._state_value
+
+    def _has_room(self, state: _LoopState, model: str) -> bool:
+        return state.running_total < self.max_concurrency and state.running.get(model, 0) < self.limit_for(model)
+
+    def _occupy(self, state: _LoopState, model: str, priority: LLMPriority, waited: float) -> None:
+        state.running_total += 1
+        state.running[model] = state.running.get(model, 0) + 1
+        LLM_QUEUE_WAIT.observe(waited, model, priority.label)
+
+    def _release(self, state: _LoopState, model: str) -> None:
+        state.running_total -= 1
+        state.running[model] -= 1
+
+        index = 0
+        while index < len(state.waiters) and state.running_total < self.max_concurrency:
+            waiter = state.waiters[index]
+            if not self._has_room(state, waiter.model):
+                index += 1
+                continue
+            del state.waiters[index]
+            LLM_QUEUE_DEPTH.dec(waiter.priority.label)
+            self._occupy(state, waiter.model, waiter.priority, time.perf_counter() - waiter.enqueued_at)
+            waiter.future.set_result(None)
+
+    def _admit(self, state: _LoopState, priority: LLMPriority) -> None:
+        """Make room in a full queue by shedding lower-priority work, or reject."""
+
+        if len(state.waiters) < self.max_queue_depth:
+            return
+        victim = state.waiters[-1] if state.waiters else None
+        if victim is None or victim.priority <= priority:
+            LLM_REJECTED.inc(priority.label, "queue_full")
+            raise LLMOverloaded("LLM queue is full")
+        state.waiters.pop()
+        LLM_QUEUE_DEPTH.dec(victim.priority.label)
+        LLM_REJECTED.inc(victim.priority.label, "shed")
+        victim.future.set_exception(LLMOverloaded("Shed for higher-priority LLM work"))
+
+    @asynccontextmanager
+    async def slot(self, model: str, priority: LLMPriority = LLMPriority.INTERACTIVE) -> AsyncIterator[None]:
+        """Hold one LLM slot for `model` for the duration of the block.
+
+        Raises:
+            LLMOverloaded: if the queue is full (or this call was shed).
+            OllamaUnavailable: if no slot freed up within the queue timeout.
+        """
+
+        state = self._state()
+        # Freed slots are handed to waiters eagerly, so any room left now is
+        # room no waiter can use (they are blocked on their model's limit).
+        if self._has_room(state, model):
+            self._occupy(state, model, priority, 0.0)
+        else:
+            await self._wait(state, model, priority)
+        try:
+            yield
+        finally:
+            self._release(state, model)
+
+    async def _wait(self, state: _LoopState, model: str, priority: LLMPriority) -> None:
+        self._admit(state, priority)
+        state.seq += 1
+        waiter = _Waiter(priority, state.seq, model, asyncio.get_running_loop().create_future(), time.perf_counter())
+        insort(state.waiters, waiter, key=lambda w: w.order)
+        LLM_QUEUE_DEPTH.inc(priority.label)
+
+        try:
+            async with asyncio.timeout(self._queue_timeout):
+                await waiter.future
+        except (TimeoutError, asyncio.CancelledError) as exc:
+            if waiter.future.done() and not waiter.future.cancelled() and waiter.future.exception() is None:
+                self._release(state, model)  # granted just as we gave up
+            elif waiter in state.waiters:
+                state.waiters.remove(waiter)
+                LLM_QUEUE_DEPTH.dec(priority.label)
+            if isinstance(exc, TimeoutError):
+                LLM_REJECTED.inc(priority.label, "timeout")
+                raise OllamaUnavailable("Timed out waiting for an LLM slot") from exc
+            raise
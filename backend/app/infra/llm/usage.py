@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+
+@dataclass
+class LLMUsage:
+    """LLM cost of a unit of work, as reported by Ollama.
+
+    Fields:
+        calls: Completed calls.
+        seconds: Ollama `total_duration` (model load + prompt + generation),
+            or the measured request time when Ollama does not report it.
+            Queue wait in the scheduler is not included.
+        tokens: `prompt_eval_count + eval_count`.
+    """
+
+    calls: int = 0
+    seconds: float = 0.0
+    tokens: int = 0
+
+
+_current: ContextVar[LLMUsage | None] = ContextVar("llm_usage", default=None)
+
+
+@contextmanager
+def track_usage() -> Iterator[LLMUsage]:
+    """Collect the usage of every LLM call made in this context (task) into one `LLMUsage`."""
+
+    usage = LLMUsage()
+    token = _current.set(usage)
+    try:
+        yield usage
+    finally:
+        _current.reset(token)
+
+
+def record_usage(*, seconds: float, tokens: int) -> None:
+    """Add one call to the active `track_usage` block, if any (called by the client)."""
+
+    usage = _current.get()
+    if usage is not None:
+        usage.calls += 1
+        usage.seconds += seconds
+        usage.tokens += tokens
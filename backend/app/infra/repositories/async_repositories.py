@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Sequence
+from datetime import datetime
+from typing import Generic, ParamSpec, TypeVar
+
+from app.domain.concept_catalog import CatalogKey, ConceptPage
+from app.domain.concepts import Concept, ConceptCreate
+from app.domain.practice.due_histogram import DueForecast
+from app.domain.practice.models import (
+    ConceptProgress,
+    PracticeAttempt,
+    PracticeQuestion,
+    QuestionReport,
+    RecentItem,
+    ReportJob,
+)
+from app.infra.repositories.attempts_repository import AttemptsRepository
+from app.infra.repositories.concepts_repository import BulkCreateResult, ConceptDedupKey, ConceptsRepository
+from app.infra.repositories.progress_repository import ProgressRepository
+from app.infra.repositories.question_bank_repository import QuestionBankRepository
+from app.infra.repositories.question_reports_repository import QuestionReportsRepository
+from app.infra.repositories.recent_history_repository import RecentHistoryRepository
+from app.infra.repositories.report_jobs_repository import ReportJobsRepository
+from app.infra.storage.executor import StorageExecutor
+from app.infra.storage.yaml_store import StoreVersion
+
+R = TypeVar("R")
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class AsyncRepository(Generic[R]):
+    """Awaitable facade over a sync repository.
+
+    Purpose:
+        Let async routes and services use the YAML repositories without
+        blocking the event loop. Every call runs the sync method on the
+        shared `StorageExecutor`.
+
+    Fields:
+        sync: The wrapped repository, for code that already runs on a storage
+            thread (see `executor`).
+        executor: The storage executor calls are dispatched to.
+
+    Notes:
+        Semantics (locking, caching, atomic writes) are those of the wrapped
+        repository; the facade adds no state.
+    """
+
+    def __init__(self, repo: R, executor: StorageExecutor) -> None:
+        self.sync = repo
+        self.executor = executor
+
+    async def _run(self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+        return await self.executor.run(fn, *args, **kwargs)
+
+
+class AsyncConceptsRepository(AsyncRepository[ConceptsRepository]):
+    async def signature(self) -> tuple[int, int, int] | None:
+        return await self._run(self.sync.signature)
+
+    async def version(self) -> StoreVersion:
+        return await self._run(self.sync.version)
+
+    async def list_concepts(self) -> list[Concept]:
+        return await self._run(self.sync.list_concepts)
+
+    async def get_concept(self, concept_id: str) -> Concept | None:
+        return await self._run(self.sync.get_concept, concept_id)
+
+    async def page(
+        self,
+        *,
+        limit: int,
+        after: CatalogKey | None = None,
+        tag: str | None = None,
+        title_prefix: str | None = None,
+    ) -> ConceptPage:
+        return await self._run(self.sync.page, limit=limit, after=after, tag=tag, title_prefix=title_prefix)
+
+    async def count(self) -> int:
+        return await self._run(self.sync.count)
+
+    async def create_concept(self, concept: ConceptCreate) -> Concept:
+        return await self._run(self.sync.create_concept, concept)
+
+    async def create_concepts(
+        self, payloads: Sequence[ConceptCreate], *, dedup: ConceptDedupKey | None = None
+    ) -> BulkCreateResult:
+        return await self._run(self.sync.create_concepts, payloads, dedup=dedup)
+
+
+class AsyncProgressRepository(AsyncRepository[ProgressRepository]):
+    async def version(self) -> StoreVersion:
+        return await self._run(self.sync.version)
+
+    async def get(self, concept_id: str) -> ConceptProgress | None:
+        return await self._run(self.sync.get, concept_id)
+
+    async def due_forecast(
+        self, *, now: datetime, windows: int, window_minutes: int = 1440
+    ) -> tuple[DueForecast, int]:
+        return await self._run(self.sync.due_forecast, now=now, windows=windows, window_minutes=window_minutes)
+
+
+class AsyncQuestionBankRepository(AsyncRepository[QuestionBankRepository]):
+    async def get_bank(self, concept_id: str) -> tuple[float, list[PracticeQuestion]]:
+        return await self._run(self.sync.get_bank, concept_id)
+
+    async def get_question(self, question_id: str) -> PracticeQuestion | None:
+        return await self._run(self.sync.get_question, question_id)
+
+    async def upsert_question(
+        self,
+        *,
+        concept_id: str,
+        question_text: str,
+        model_answer: str,
+        rubric: str,
+        now: datetime | None = None,
+    ) -> PracticeQuestion:
+        return await self._run(
+            self.sync.upsert_question,
+            concept_id=concept_id,
+            question_text=question_text,
+            model_answer=model_answer,
+            rubric=rubric,
+            now=now,
+        )
+
+    async def remove_question(self, question_id: str) -> bool:
+        return await self._run(self.sync.remove_question, question_id)
+
+
+class AsyncAttemptsRepository(AsyncRepository[AttemptsRepository]):
+    async def list_recent(self, *, limit: int = 3) -> list[PracticeAttempt]:
+        return await self._run(self.sync.list_recent, limit=limit)
+
+
+class AsyncQuestionReportsRepository(AsyncRepository[QuestionReportsRepository]):
+    async def append_report(
+        self, *, question_id: str, reason: str | None = None, now: datetime | None = None
+    ) -> QuestionReport:
+        return await self._run(self.sync.append_report, question_id=question_id, reason=reason, now=now)
+
+
+class AsyncRecentHistoryRepository(AsyncRepository[RecentHistoryRepository]):
+    async def recent_tag_history(self, *, limit: int = 3) -> list[set[str]]:
+        return await self._run(self.sync.recent_tag_history, limit=limit)
+
+    async def recent_tags(self, *, limit: int = 3) -> set[str]:
+        return await self._run(self.sync.recent_tags, limit=limit)
+
+    async def record(self, items: Iterable[RecentItem]) -> None:
+        await self._run(self.sync.record, list(items))
+
+
+class AsyncReportJobsRepository(AsyncRepository[ReportJobsRepository]):
+    async def enqueue(
+        self, *, question_id: str, concept_id: str, now: datetime | None = None
+    ) -> tuple[ReportJob, bool]:
+        return await self._run(self.sync.enqueue, question_id=question_id, concept_id=concept_id, now=now)
+
+    async def get(self, job_id: str) -> ReportJob | None:
+        return await self._run(self.sync.get, job_id)
+
+    async def claim(self, *, now: datetime | None = None) -> ReportJob | None:
+        return await self._run(self.sync.claim, now=now)
+
+    async def update(self, job: ReportJob) -> None:
+        await self._run(self.sync.update, job)
+
+    async def next_attempt_at(self) -> datetime | None:
+        return await self._run(self.sync.next_attempt_at)
+
+    async def recover(self, *, now: datetime | None = None) -> int:
+        return await self._run(self.sync.recover, now=now)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Collection, Iterator
 from datetime import datetime, timezone
 from uuid import uuid4
 
 from app.domain.practice.models import PracticeAttempt
+from app.domain.time_range import TimeRange
 from app.infra.storage.yaml_store import YamlStore
 
 
@@ -44,6 +46,28 @@ class AttemptsRepository:
 
         return models[-limit:]
 
+    def iter_attempts(
+        self, *, concept_ids: Collection[str] | None = None, time_range: TimeRange = TimeRange()
+    ) -> Iterator[PracticeAttempt]:
+        """Stream attempts in storage (chronological) order.
+
+        Inputs:
+            concept_ids: Only attempts for these concepts (None = all).
+            time_range: Only attempts whose `created_at` falls in the range.
+
+        Notes:
+            Reads the file item by item (`YamlStore.iter_items`); memory use
+            does not grow with the number of attempts. Rows of other concepts
+            are skipped before validation.
+        """
+
+        for item in self._store.iter_items(self._FILENAME, "attempts"):
+            if concept_ids is not None and item.get("concept_id") not in concept_ids:
+                continue
+            attempt = PracticeAttempt.model_validate(item)
+            if attempt.created_at in time_range:
+                yield attempt
+
     def append_attempt(
         self,
         *,
@@ -1,10 +1,70 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import threading
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Literal
 from uuid import uuid4
 
+from app.domain.concept_catalog import CatalogKey, ConceptCatalog, ConceptPage
 from app.domain.concepts import Concept, ConceptCreate
-from app.infra.storage.yaml_store import YamlStore
+from app.domain.tag_index import TagIndex
+from app.infra.storage.yaml_store import StoreVersion, YamlStore
+
+
+@dataclass
+class ConceptsIndexCache:
+    """App-scoped state shared by `ConceptsRepository` instances.
+
+    Fields:
+        tags: Tag inverted index mirroring `concepts.yaml`.
+        catalog: Validated concepts in listing order, mirroring `concepts.yaml`.
+        signature: Store signature of `concepts.yaml` the index reflects.
+        loaded: False until the index has been built once.
+    """
+
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    tags: TagIndex = field(default_factory=TagIndex)
+    catalog: ConceptCatalog = field(default_factory=ConceptCatalog)
+    signature: tuple[int, int, int] | None = None
+    loaded: bool = False
+
+
+# Field used to detect duplicates on bulk import.
+ConceptDedupKey = Literal["title", "source_url"]
+
+
+@dataclass(frozen=True)
+class BulkCreateResult:
+    """Outcome of `ConceptsRepository.create_concepts`.
+
+    Fields:
+        created: `(position, concept)` for every persisted payload.
+        duplicates: `(position, existing concept id)` for skipped payloads.
+    """
+
+    created: list[tuple[int, Concept]]
+    duplicates: list[tuple[int, str]]
+
+
+def _dedup_value(concept: Concept | ConceptCreate, key: ConceptDedupKey) -> str | None:
+    if key == "title":
+        return concept.title.strip().casefold()
+    url = (concept.source_url or "").strip()
+    return url or None
+
+
+def _new_concept(payload: ConceptCreate, now: datetime) -> Concept:
+    return Concept(
+        id=str(uuid4()),
+        title=payload.title.strip(),
+        description=payload.description,
+        tags=[tag.strip() for tag in payload.tags if tag.strip()],
+        source_url=payload.source_url,
+        created_at=now,
+        updated_at=now,
+    )
 
 
 class ConceptsRepository:
@@ -16,27 +76,140 @@ class ConceptsRepository:
     Notes:
         - This repository does not implement multi-user yet.
         - IDs are UUID4 strings.
+        - A `TagIndex` and a `ConceptCatalog` are kept alongside the file;
+          `create_concept` updates them and they are rebuilt when the file
+          changes underneath them. Reads are served from them.
     """
 
     _FILENAME = "concepts.yaml"
 
-    def __init__(self, store: YamlStore) -> None:
+    def __init__(self, store: YamlStore, *, index_cache: ConceptsIndexCache | None = None) -> None:
         self._store = store
+        self._cache = index_cache or ConceptsIndexCache()
 
-    def list_concepts(self) -> list[Concept]:
-        """Return all concepts."""
+    def signature(self) -> tuple[int, int, int] | None:
+        """Return the storage change signature of `concepts.yaml`."""
 
+        return self._store.signature(self._FILENAME)
+
+    def version(self) -> StoreVersion:
+        """Return the monotonic store version of `concepts.yaml` (no file read)."""
+
+        return self._store.version(self._FILENAME)
+
+    def _load_all(self) -> list[Concept]:
         payload = self._store.read(self._FILENAME, default={"version": 1, "concepts": []})
         concepts = payload.get("concepts", [])
         return [Concept.model_validate(item) for item in concepts]
 
+    def _tag_index(self) -> TagIndex:
+        """Return the tag index, rebuilding the indexes if the file changed.
+
+        Callers must hold `self._cache.lock`.
+        """
+
+        signature = self.signature()
+        if not self._cache.loaded or self._cache.signature != signature:
+            concepts = self._load_all()
+            self._cache.tags.reset(concepts)
+            self._cache.catalog.reset(concepts)
+            self._cache.signature = signature
+            self._cache.loaded = True
+        return self._cache.tags
+
+    def _catalog(self) -> ConceptCatalog:
+        """Return the catalog (same freshness rules as `_tag_index`)."""
+
+        self._tag_index()
+        return self._cache.catalog
+
+    def list_concepts(self) -> list[Concept]:
+        """Return all concepts in file order."""
+
+        with self._cache.lock:
+            return [concept.model_copy(deep=True) for concept in self._catalog().in_file_order()]
+
     def get_concept(self, concept_id: str) -> Concept | None:
         """Return a concept by ID, or None if missing."""
 
-        for concept in self.list_concepts():
-            if concept.id == concept_id:
-                return concept
-        return None
+        with self._cache.lock:
+            concept = self._catalog().get(concept_id)
+        return None if concept is None else concept.model_copy(deep=True)
+
+    def page(
+        self,
+        *,
+        limit: int,
+        after: CatalogKey | None = None,
+        tag: str | None = None,
+        title_prefix: str | None = None,
+    ) -> ConceptPage:
+        """Return one page of concepts ordered by `(created_at, id)`.
+
+        Inputs:
+            limit: Maximum number of items.
+            after: Key of the last item of the previous page.
+            tag: Only concepts carrying this tag (via the tag index).
+            title_prefix: Only concepts whose title starts with this (case-insensitive).
+
+        Notes:
+            Cost depends on `limit` and on the number of filter matches, not on
+            the library size.
+        """
+
+        with self._cache.lock:
+            tags = self._tag_index()
+            catalog = self._cache.catalog
+
+            only: set[str] | None = None
+            if tag is not None:
+                only = tags.concepts_with_any([tag])
+            if title_prefix is not None:
+                matches = catalog.ids_with_title_prefix(title_prefix)
+                only = matches if only is None else only & matches
+
+            result = catalog.page(limit=limit, after=after, only=only)
+        return ConceptPage(items=[concept.model_copy(deep=True) for concept in result.items], next_key=result.next_key)
+
+    def count(self) -> int:
+        """Return the number of concepts (served from the tag index)."""
+
+        with self._cache.lock:
+            return len(self._tag_index())
+
+    def concept_ids(self) -> list[str]:
+        """Return all concept ids in file order (served from the tag index)."""
+
+        with self._cache.lock:
+            return self._tag_index().concept_ids()
+
+    def tags_for(self, concept_id: str) -> list[str]:
+        """Return the tags of a concept from the tag index ([] if unknown).
+
+        Avoids parsing `concepts.yaml` unless the file changed.
+        """
+
+        with self._cache.lock:
+            return self._tag_index().tags_for(concept_id)
+
+    def recent_tags_for(self, concept_ids: Iterable[str]) -> set[str]:
+        """Return the union of tags of the given concepts (unknown ids are skipped)."""
+
+        out: set[str] = set()
+        with self._cache.lock:
+            index = self._tag_index()
+            for concept_id in concept_ids:
+                out.update(index.tags_for(concept_id))
+        return out
+
+    def tag_overlap(self, tags: set[str]) -> dict[str, int]:
+        """Return tag overlap counts for concepts sharing at least one of `tags`.
+
+        Concepts missing from the result have an overlap of 0.
+        """
+
+        with self._cache.lock:
+            return self._tag_index().tag_overlap(tags)
 
     def create_concept(self, concept: ConceptCreate) -> Concept:
         """Create and persist a new concept.
@@ -48,23 +221,84 @@ class ConceptsRepository:
             Newly created persisted concept.
         """
 
+        new_concept = _new_concept(concept, datetime.now(timezone.utc))
+
+        with self._cache.lock:
+            index = self._tag_index()
+
+            payload = self._store.read(self._FILENAME, default={"version": 1, "concepts": []})
+            payload.setdefault("version", 1)
+            payload.setdefault("concepts", [])
+            payload["concepts"].append(new_concept.model_dump(mode="json"))
+
+            self._store.write_atomic(self._FILENAME, payload)
+
+            index.add(new_concept)
+            self._cache.catalog.add(new_concept)
+            self._cache.signature = self.signature()
+
+        return new_concept.model_copy(deep=True)
+
+    def create_concepts(
+        self, payloads: Sequence[ConceptCreate], *, dedup: ConceptDedupKey | None = None
+    ) -> BulkCreateResult:
+        """Create many concepts with a single read and a single write.
+
+        Inputs:
+            payloads: Validated creation payloads, in import order.
+            dedup: Skip payloads whose normalized `title` (case-insensitive)
+                or `source_url` matches an existing concept or an earlier
+                payload. Payloads without a `source_url` are never duplicates
+                under `source_url`.
+
+        Outputs:
+            Created concepts and skipped duplicates, keyed by payload position.
+
+        Notes:
+            - `created_at` increases by 1µs per created concept, so listings
+              keep the import order.
+            - Nothing is written when every payload is a duplicate.
+        """
+
+        created: list[tuple[int, Concept]] = []
+        duplicates: list[tuple[int, str]] = []
         now = datetime.now(timezone.utc)
 
-        new_concept = Concept(
-            id=str(uuid4()),
-            title=concept.title.strip(),
-            description=concept.description,
-            tags=[tag.strip() for tag in concept.tags if tag.strip()],
-            source_url=concept.source_url,
-            created_at=now,
-            updated_at=now,
-        )
+        with self._cache.lock:
+            index = self._tag_index()
+            catalog = self._cache.catalog
 
-        payload = self._store.read(self._FILENAME, default={"version": 1, "concepts": []})
-        payload.setdefault("version", 1)
-        payload.setdefault("concepts", [])
-        payload["concepts"].append(new_concept.model_dump(mode="json"))
+            seen: dict[str, str] = {}
+            if dedup is not None:
+                for existing in catalog.in_file_order():
+                    value = _dedup_value(existing, dedup)
+                    if value is not None:
+                        seen.setdefault(value, existing.id)
 
-        self._store.write_atomic(self._FILENAME, payload)
+            for position, payload in enumerate(payloads):
+                value = None if dedup is None else _dedup_value(payload, dedup)
+                if value is not None and value in seen:
+                    duplicates.append((position, seen[value]))
+                    continue
+                concept = _new_concept(payload, now + timedelta(microseconds=len(created)))
+                created.append((position, concept))
+                if value is not None:
+                    seen[value] = concept.id
 
-        return new_concept
+            if created:
+                stored = self._store.read(self._FILENAME, default={"version": 1, "concepts": []})
+                stored.setdefault("version", 1)
+                stored.setdefault("concepts", [])
+                stored["concepts"].extend(concept.model_dump(mode="json") for _, concept in created)
+
+                self._store.write_atomic(self._FILENAME, stored)
+
+                for _, concept in created:
+                    index.add(concept)
+                catalog.extend(concept for _, concept in created)
+                self._cache.signature = self.signature()
+
+        return BulkCreateResult(
+            created=[(position, concept.model_copy(deep=True)) for position, concept in created],
+            duplicates=duplicates,
+        )
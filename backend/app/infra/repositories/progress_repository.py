@@ -1,9 +1,58 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from collections.abc import Collection, Iterable, Iterator
+from dataclasses import dataclass, field
 from datetime import datetime
 
+from app.domain.practice.due_histogram import DueForecast, DueHistogram
+from app.domain.practice.due_index import DueIndex
 from app.domain.practice.models import ConceptProgress
-from app.infra.storage.yaml_store import YamlStore
+from app.domain.time_range import TimeRange
+from app.infra.storage.yaml_store import StoreVersion, YamlStore
+
+
+@dataclass
+class ProgressIndexCache:
+    """App-scoped state shared by `ProgressRepository` instances.
+
+    Repositories are cheap per-request objects; the due index they maintain
+    must outlive them, so it is kept here and injected by the dependency layer.
+
+    Fields:
+        index: Due index mirroring `progress.yaml`.
+        histogram: Due-time histogram mirroring `progress.yaml`.
+        signature: Store signature of `progress.yaml` the index reflects.
+        loaded: False until the index has been built once.
+        generation: Bumped whenever the index is rebuilt from disk.
+        revision / revisions: Change feed within a generation; `upsert` bumps
+            `revision` and moves the concept to the end of `revisions`.
+    """
+
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    index: DueIndex = field(default_factory=DueIndex)
+    histogram: DueHistogram = field(default_factory=DueHistogram)
+    signature: tuple[int, int, int] | None = None
+    loaded: bool = False
+    generation: int = 0
+    revision: int = 0
+    revisions: OrderedDict[str, int] = field(default_factory=OrderedDict)
+
+
+@dataclass(frozen=True)
+class ProgressChanges:
+    """Result of `ProgressRepository.changes_since`.
+
+    Fields:
+        generation / revision: Cursor to pass to the next call.
+        changed: Progress written after the given cursor, or None if the index
+            was rebuilt since (the caller must reload everything).
+    """
+
+    generation: int
+    revision: int
+    changed: dict[str, ConceptProgress] | None
 
 
 class ProgressRepository:
@@ -11,14 +60,31 @@ class ProgressRepository:
 
     Storage:
         YAML file `progress.yaml`.
+
+    Notes:
+        - Reads are served from a `DueIndex` that `upsert` keeps up to date.
+        - `upsert` also moves the concept between `DueHistogram` buckets when
+          `next_due_at` changes, so forecasts never scan the file.
+        - The index is rebuilt from disk when the file changes underneath it.
     """
 
     _FILENAME = "progress.yaml"
 
-    def __init__(self, store: YamlStore) -> None:
+    def __init__(self, store: YamlStore, *, index_cache: ProgressIndexCache | None = None) -> None:
         self._store = store
+        self._cache = index_cache or ProgressIndexCache()
 
-    def get_all(self) -> dict[str, ConceptProgress]:
+    def signature(self) -> tuple[int, int, int] | None:
+        """Return the storage change signature of `progress.yaml`."""
+
+        return self._store.signature(self._FILENAME)
+
+    def version(self) -> StoreVersion:
+        """Return the monotonic store version of `progress.yaml` (no file read)."""
+
+        return self._store.version(self._FILENAME)
+
+    def _load_all(self) -> dict[str, ConceptProgress]:
         payload = self._store.read(self._FILENAME, default={"version": 1, "progress": []})
         items = payload.get("progress", [])
         out: dict[str, ConceptProgress] = {}
@@ -27,28 +93,138 @@ class ProgressRepository:
             out[model.concept_id] = model
         return out
 
+    def _index(self) -> DueIndex:
+        """Return the due index, rebuilding it if the file changed.
+
+        Callers must hold `self._cache.lock`.
+        """
+
+        signature = self._store.signature(self._FILENAME)
+        if not self._cache.loaded or self._cache.signature != signature:
+            progress = self._load_all().values()
+            self._cache.index.reset(progress)
+            self._cache.histogram.reset(progress)
+            self._cache.generation += 1
+            self._cache.revisions.clear()
+            self._cache.signature = signature
+            self._cache.loaded = True
+        return self._cache.index
+
+    def iter_progress(
+        self, *, concept_ids: Collection[str] | None = None, time_range: TimeRange = TimeRange()
+    ) -> Iterator[ConceptProgress]:
+        """Stream stored progress from `progress.yaml` in file order.
+
+        Inputs:
+            concept_ids: Only these concepts (None = all).
+            time_range: Only entries whose `next_due_at` falls in the range.
+
+        Notes:
+            Reads the file item by item rather than the due index, so exports
+            reflect what is on disk and memory does not grow with its size.
+        """
+
+        for item in self._store.iter_items(self._FILENAME, "progress"):
+            if concept_ids is not None and item.get("concept_id") not in concept_ids:
+                continue
+            progress = ConceptProgress.model_validate(item)
+            if progress.next_due_at in time_range:
+                yield progress
+
+    def get_all(self) -> dict[str, ConceptProgress]:
+        with self._cache.lock:
+            return {key: value.model_copy() for key, value in self._index().all_progress().items()}
+
     def get(self, concept_id: str) -> ConceptProgress | None:
-        return self.get_all().get(concept_id)
+        with self._cache.lock:
+            progress = self._index().get(concept_id)
+        return None if progress is None else progress.model_copy()
+
+    def get_many(self, concept_ids: Iterable[str]) -> dict[str, ConceptProgress]:
+        """Return stored progress for the given concept ids (missing ids are skipped)."""
+
+        out: dict[str, ConceptProgress] = {}
+        with self._cache.lock:
+            index = self._index()
+            for concept_id in concept_ids:
+                progress = index.get(concept_id)
+                if progress is not None:
+                    out[concept_id] = progress.model_copy()
+        return out
+
+    def cooling_ids(self, *, now: datetime) -> frozenset[str]:
+        """Return ids of concepts that are not due at `now`.
+
+        Concepts missing from the result are due (including concepts with no
+        stored progress), matching `selection.is_due`.
+        """
+
+        with self._cache.lock:
+            return self._index().cooling_ids(now)
+
+    def changes_since(self, *, generation: int, revision: int) -> ProgressChanges:
+        """Return progress written since the cursor `(generation, revision)`.
+
+        Cost is O(changes): the feed is ordered by revision.
+        """
+
+        with self._cache.lock:
+            index = self._index()
+            cache = self._cache
+            if generation != cache.generation:
+                return ProgressChanges(generation=cache.generation, revision=cache.revision, changed=None)
+
+            changed: dict[str, ConceptProgress] = {}
+            for concept_id in reversed(cache.revisions):
+                if cache.revisions[concept_id] <= revision:
+                    break
+                progress = index.get(concept_id)
+                if progress is not None:
+                    changed[concept_id] = progress.model_copy()
+            return ProgressChanges(generation=cache.generation, revision=cache.revision, changed=changed)
+
+    def due_forecast(self, *, now: datetime, windows: int, window_minutes: int = 1440) -> tuple[DueForecast, int]:
+        """Return the due forecast and the number of stored progress entries.
+
+        Concepts without stored progress are not counted; callers add them to
+        `due_now` (they are always due).
+        """
+
+        with self._cache.lock:
+            self._index()
+            histogram = self._cache.histogram
+            return histogram.forecast(now=now, windows=windows, window_minutes=window_minutes), len(histogram)
 
     def upsert(self, progress: ConceptProgress) -> None:
-        payload = self._store.read(self._FILENAME, default={"version": 1, "progress": []})
-        payload.setdefault("version", 1)
-        payload.setdefault("progress", [])
+        with self._cache.lock:
+            index = self._index()
+
+            payload = self._store.read(self._FILENAME, default={"version": 1, "progress": []})
+            payload.setdefault("version", 1)
+            payload.setdefault("progress", [])
+
+            updated: list[dict] = []
+            replaced = False
+            for item in payload["progress"]:
+                if item.get("concept_id") == progress.concept_id:
+                    updated.append(progress.model_dump(mode="json"))
+                    replaced = True
+                else:
+                    updated.append(item)
 
-        updated: list[dict] = []
-        replaced = False
-        for item in payload["progress"]:
-            if item.get("concept_id") == progress.concept_id:
+            if not replaced:
                 updated.append(progress.model_dump(mode="json"))
-                replaced = True
-            else:
-                updated.append(item)
 
-        if not replaced:
-            updated.append(progress.model_dump(mode="json"))
+            payload["progress"] = updated
+            self._store.write_atomic(self._FILENAME, payload)
 
-        payload["progress"] = updated
-        self._store.write_atomic(self._FILENAME, payload)
+            stored = progress.model_copy()
+            index.upsert(stored)
+            self._cache.histogram.upsert(stored)
+            self._cache.revision += 1
+            self._cache.revisions[progress.concept_id] = self._cache.revision
+            self._cache.revisions.move_to_end(progress.concept_id)
+            self._cache.signature = self._store.signature(self._FILENAME)
 
     def set_last_correct_at(self, concept_id: str, when: datetime) -> None:
         progress = self.get(concept_id) or ConceptProgress(concept_id=concept_id)
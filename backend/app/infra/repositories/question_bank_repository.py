@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Collection, Iterator
 from datetime import datetime, timezone
 from uuid import uuid4
 
 from app.domain.practice.models import PracticeQuestion
+from app.domain.time_range import TimeRange
 from app.infra.storage.yaml_store import YamlStore
 
 
@@ -47,6 +49,29 @@ class QuestionBankRepository:
                 return p_new, questions
         return 0.5, []
 
+    def iter_banks(
+        self, *, concept_ids: Collection[str] | None = None, time_range: TimeRange = TimeRange()
+    ) -> Iterator[tuple[str, float, list[PracticeQuestion]]]:
+        """Stream `(concept_id, p_new, questions)` per bank in file order.
+
+        Inputs:
+            concept_ids: Only banks of these concepts (None = all).
+            time_range: Only questions whose `created_at` falls in the range;
+                banks left without questions are skipped when it is bounded.
+
+        Notes:
+            One bank is materialized at a time (`YamlStore.iter_items`).
+        """
+
+        for bank in self._store.iter_items(self._FILENAME, "banks"):
+            concept_id = bank.get("concept_id")
+            if concept_ids is not None and concept_id not in concept_ids:
+                continue
+            questions = [PracticeQuestion.model_validate(q) for q in bank.get("questions", [])]
+            questions = [q for q in questions if q.created_at in time_range]
+            if questions or time_range.unbounded:
+                yield concept_id, float(bank.get("p_new", 0.5)), questions
+
     def save_bank(self, concept_id: str, *, p_new: float, questions: list[PracticeQuestion]) -> None:
         payload = self._read_payload()
         payload.setdefault("version", 1)
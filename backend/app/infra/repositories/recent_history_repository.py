@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from app.domain.practice.models import RecentItem
+from app.infra.storage.yaml_store import YamlStore
+
+
+class RecentHistoryRepository:
+    """Ring buffer of the last N served or answered questions.
+
+    Storage:
+        YAML file `recent_history.yaml` holding at most `capacity` items,
+        oldest first.
+
+    Notes:
+        - Each item carries its concept's tags, so recent-tag lookups read only
+          this small file (O(capacity)).
+        - A question appears at most once: recording it again (e.g. answered
+          after served) moves it to the newest position.
+    """
+
+    _FILENAME = "recent_history.yaml"
+
+    def __init__(self, store: YamlStore, *, capacity: int = 10) -> None:
+        self._store = store
+        self._capacity = max(1, int(capacity))
+
+    def _load(self) -> list[RecentItem]:
+        payload = self._store.read(self._FILENAME, default={"version": 1, "items": []})
+        return [RecentItem.model_validate(item) for item in payload.get("items", [])]
+
+    def list_recent(self, *, limit: int = 3) -> list[RecentItem]:
+        """Return up to `limit` most recent items, oldest first."""
+
+        limit = max(0, int(limit))
+        if limit == 0:
+            return []
+        return self._load()[-limit:]
+
+    def recent_tag_history(self, *, limit: int = 3) -> list[set[str]]:
+        """Return the tag sets of the last `limit` items, oldest first."""
+
+        return [set(item.tags) for item in self.list_recent(limit=limit)]
+
+    def recent_tags(self, *, limit: int = 3) -> set[str]:
+        """Return the union of tags of the last `limit` items."""
+
+        return set().union(*self.recent_tag_history(limit=limit))
+
+    def record(self, items: Iterable[RecentItem]) -> None:
+        """Append items (in order) and trim the buffer to `capacity` in one write."""
+
+        items = list(items)
+        if not items:
+            return
+
+        buffer = self._load()
+        for item in items:
+            if item.question_id is not None:
+                buffer = [existing for existing in buffer if existing.question_id != item.question_id]
+            buffer.append(item)
+
+        self._store.write_atomic(
+            self._FILENAME,
+            {"version": 1, "items": [item.model_dump(mode="json") for item in buffer[-self._capacity :]]},
+        )
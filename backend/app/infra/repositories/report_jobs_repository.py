@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from app.domain.practice.models import ReportJob
+from app.infra.storage.yaml_store import YamlStore
+
+_ACTIVE = ("queued", "running")
+
+
+class ReportJobsRepository:
+    """Durable queue of question-report jobs.
+
+    Storage:
+        YAML file `report_jobs.yaml`, jobs in enqueue order.
+
+    Notes:
+        - Every state change is written atomically before it is acted on, so
+          jobs survive restarts; `recover` requeues jobs that were `running`
+          when the process stopped.
+        - Read-modify-write calls are serialized by an instance lock; the
+          repository is app-scoped, so workers on different storage threads
+          never claim the same job.
+        - Only the newest `keep_finished` succeeded/failed jobs are kept.
+    """
+
+    _FILENAME = "report_jobs.yaml"
+
+    def __init__(self, store: YamlStore, *, keep_finished: int = 500) -> None:
+        self._store = store
+        self._keep_finished = max(0, int(keep_finished))
+        self._lock = threading.Lock()
+
+    def _load(self) -> list[ReportJob]:
+        payload = self._store.read(self._FILENAME, default={"version": 1, "jobs": []})
+        return [ReportJob.model_validate(item) for item in payload.get("jobs", [])]
+
+    def _save(self, jobs: list[ReportJob]) -> None:
+        finished = [job for job in jobs if job.status not in _ACTIVE]
+        if len(finished) > self._keep_finished:
+            dropped = {job.id for job in finished[: len(finished) - self._keep_finished]}
+            jobs = [job for job in jobs if job.id not in dropped]
+        self._store.write_atomic(
+            self._FILENAME, {"version": 1, "jobs": [job.model_dump(mode="json") for job in jobs]}
+        )
+
+    def enqueue(self, *, question_id: str, concept_id: str, now: datetime | None = None) -> tuple[ReportJob, bool]:
+        """Queue a job for `question_id`, or fold the report into its active job.
+
+        Outputs:
+            `(job, created)`; `created` is False when an active job existed.
+        """
+
+        now = now or datetime.now(timezone.utc)
+        with self._lock:
+            jobs = self._load()
+            for index, job in enumerate(jobs):
+                if job.question_id == question_id and job.status in _ACTIVE:
+                    jobs[index] = job = job.model_copy(update={"reports": job.reports + 1, "updated_at": now})
+                    self._save(jobs)
+                    return job, False
+
+            job = ReportJob(
+                id=str(uuid4()),
+                question_id=question_id,
+                concept_id=concept_id,
+                created_at=now,
+                updated_at=now,
+                next_attempt_at=now,
+            )
+            jobs.append(job)
+            self._save(jobs)
+            return job, True
+
+    def get(self, job_id: str) -> ReportJob | None:
+        for job in self._load():
+            if job.id == job_id:
+                return job
+        return None
+
+    def claim(self, *, now: datetime | None = None) -> ReportJob | None:
+        """Mark the oldest queued job whose retry time has come as `running` and return it."""
+
+        now = now or datetime.now(timezone.utc)
+        with self._lock:
+            jobs = self._load()
+            ready = [
+                (job.next_attempt_at, index)
+                for index, job in enumerate(jobs)
+                if job.status == "queued" and job.next_attempt_at <= now
+            ]
+            if not ready:
+                return None
+            _, index = min(ready)
+            jobs[index] = job = jobs[index].model_copy(
+                update={"status": "running", "attempts": jobs[index].attempts + 1, "updated_at": now}
+            )
+            self._save(jobs)
+            return job
+
+    def update(self, job: ReportJob) -> None:
+        """Replace the stored job with the same id."""
+
+        with self._lock:
+            jobs = self._load()
+            for index, stored in enumerate(jobs):
+                if stored.id == job.id:
+                    # Keep reports that were folded in while the job ran.
+                    jobs[index] = job.model_copy(update={"reports": max(job.reports, stored.reports)})
+                    self._save(jobs)
+                    return
+
+    def next_attempt_at(self) -> datetime | None:
+        """Return the earliest retry time among queued jobs, if any."""
+
+        return min((job.next_attempt_at for job in self._load() if job.status == "queued"), default=None)
+
+    def recover(self, *, now: datetime | None = None) -> int:
+        """Requeue jobs left `running` by a previous process; return how many."""
+
+        now = now or datetime.now(timezone.utc)
+        with self._lock:
+            jobs = self._load()
+            stale = [index for index, job in enumerate(jobs) if job.status == "running"]
+            for index in stale:
+                jobs[index] = jobs[index].model_copy(
+                    update={"status": "queued", "next_attempt_at": now, "updated_at": now}
+                )
+            if stale:
+                self._save(jobs)
+            return len(stale)
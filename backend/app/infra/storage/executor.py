@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import ParamSpec, TypeVar
+
+from app.core.profiling import current_profile
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class StorageExecutor:
+    """Dedicated thread pool for blocking storage work.
+
+    Purpose:
+        Keep file I/O (YAML reads/writes, `stat` calls) and the short CPU work
+        done under repository locks off the event loop, without sharing the
+        framework's default threadpool with anything else.
+
+    Notes:
+        - `workers` bounds concurrent storage operations, not concurrent
+          requests: a request waiting on the LLM holds no storage thread.
+        - Repositories keep their own locking; the executor adds none.
+    """
+
+    def __init__(self, *, workers: int = 4) -> None:
+        self.workers = max(1, int(workers))
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="storage")
+
+    async def run(self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+        """Run `fn(*args, **kwargs)` on a storage thread and await the result.
+
+        Notes:
+            In a profiled request (`app.core.profiling`) the call is profiled
+            on its thread and its wall time is added to the `storage` phase.
+        """
+
+        loop = asyncio.get_running_loop()
+        call = functools.partial(fn, *args, **kwargs)
+        session = current_profile()
+        if session is None:
+            return await loop.run_in_executor(self._pool, call)
+        start = time.perf_counter()
+        try:
+            return await loop.run_in_executor(self._pool, session.call, call)
+        finally:
+            session.record_phase("storage", time.perf_counter() - start)
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
@@ -2,10 +2,65 @@ from __future__ import annotations
 
 import os
 import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
+from uuid import uuid4
 
 import yaml
+from yaml.composer import Composer
+from yaml.constructor import SafeConstructor
+from yaml.events import MappingEndEvent, MappingStartEvent, SequenceEndEvent, SequenceStartEvent, StreamEndEvent
+from yaml.resolver import Resolver
+
+from app.core.metrics import STORAGE_OPERATION_DURATION
+
+# libyaml bindings are several times faster; fall back to the pure-Python
+# implementation when PyYAML was built without them.
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+try:
+    from yaml.cyaml import CParser
+except ImportError:  # pragma: no cover - exercised only without libyaml
+    _ItemLoader = yaml.SafeLoader
+else:
+
+    class _ItemLoader(CParser, Composer, SafeConstructor, Resolver):
+        """libyaml event parser with the pure-Python composer, so nodes can be built one at a time."""
+
+        def __init__(self, stream) -> None:
+            CParser.__init__(self, stream)
+            Composer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+
+@dataclass(frozen=True)
+class StoreVersion:
+    """Monotonic version of one data file as seen by a `YamlStore`.
+
+    Fields:
+        epoch: Unique per store instance; counters are only comparable within
+            an epoch.
+        counter: Increases every time the file is observed to have changed
+            (0 until the file first exists).
+        modified_at: File modification time, or None if the file is missing.
+    """
+
+    epoch: str
+    counter: int
+    modified_at: datetime | None
+
+    @property
+    def tag(self) -> str:
+        """Opaque token for ETags, e.g. `"3f2a9c1d-7"`."""
+
+        return f"{self.epoch}-{self.counter}"
 
 
 class YamlStore:
@@ -21,12 +76,62 @@ class YamlStore:
 
     def __init__(self, data_dir: str | Path) -> None:
         self._data_dir = Path(data_dir)
+        self._epoch = uuid4().hex[:8]
+        self._versions: dict[str, tuple[tuple[int, int, int] | None, int]] = {}
+        self._versions_lock = threading.Lock()
 
     def path_for(self, filename: str) -> Path:
         """Return the absolute path to a data file under the data dir."""
 
         return self._data_dir / filename
 
+    def signature(self, filename: str) -> tuple[int, int, int] | None:
+        """Return a cheap change signature for a data file.
+
+        Inputs:
+            filename: YAML filename under the data directory.
+
+        Outputs:
+            `(inode, mtime_ns, size)` of the file, or None if it doesn't exist.
+
+        Notes:
+            - Atomic writes replace the file, so every write changes the inode.
+            - Used by in-memory indexes to detect writes they didn't observe
+              (other processes, manual edits) without re-reading the file.
+        """
+
+        try:
+            stat = self.path_for(filename).stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def version(self, filename: str) -> StoreVersion:
+        """Return the monotonic version of a data file.
+
+        Notes:
+            - One `stat` call; the file is not read.
+            - The counter is bumped whenever the file's `signature` differs from
+              the last one observed, so writes from other processes and manual
+              edits are picked up as well as `write_atomic`.
+        """
+
+        try:
+            stat = self.path_for(filename).stat()
+        except FileNotFoundError:
+            signature, modified_at = None, None
+        else:
+            signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            modified_at = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+
+        with self._versions_lock:
+            seen, counter = self._versions.get(filename, (None, 0))
+            if signature != seen:
+                counter += 1
+                self._versions[filename] = (signature, counter)
+
+        return StoreVersion(epoch=self._epoch, counter=counter, modified_at=modified_at)
+
     def read(self, filename: str, default: Any) -> Any:
         """Read YAML file and return parsed content.
 
@@ -42,8 +147,55 @@ class YamlStore:
         if not path.exists():
             return default
 
+        start = time.perf_counter()
+        with path.open("r", encoding="utf-8") as file:
+            data = yaml.load(file, Loader=_Loader)
+        STORAGE_OPERATION_DURATION.observe(time.perf_counter() - start, "read", filename)
+        return data or default
+
+    def iter_items(self, filename: str, key: str) -> Iterator[Any]:
+        """Yield the items of the top-level sequence `key`, one at a time.
+
+        Inputs:
+            filename: YAML filename under the data directory.
+            key: Top-level mapping key holding a sequence (e.g. `attempts`).
+
+        Outputs:
+            Parsed items in file order; nothing if the file or key is missing.
+
+        Notes:
+            - Only one item is materialized at a time, so memory stays
+              constant regardless of file size.
+            - The file handle stays open while iterating; an atomic write in
+              the meantime replaces the path, and iteration keeps reading the
+              previous version consistently.
+        """
+
+        path = self.path_for(filename)
+        if not path.exists():
+            return
+
         with path.open("r", encoding="utf-8") as file:
-            return yaml.safe_load(file) or default
+            loader = _ItemLoader(file)
+            try:
+                loader.get_event()  # stream start
+                if loader.check_event(StreamEndEvent):  # empty file
+                    return
+                loader.get_event()  # document start
+                if not loader.check_event(MappingStartEvent):
+                    return
+                loader.get_event()
+                while not loader.check_event(MappingEndEvent):
+                    name = loader.construct_document(loader.compose_node(None, None))
+                    if name != key or not loader.check_event(SequenceStartEvent):
+                        loader.compose_node(None, None)  # skip the value
+                        continue
+                    loader.get_event()
+                    while not loader.check_event(SequenceEndEvent):
+                        yield loader.construct_document(loader.compose_node(None, None))
+                    return
+            finally:
+                loader.dispose()
 
     def write_atomic(self, filename: str, data: Any) -> None:
         """Write YAML file atomically.
@@ -59,6 +211,7 @@ class YamlStore:
             Creates directories as needed and writes files to disk.
         """
 
+        start = time.perf_counter()
         self._data_dir.mkdir(parents=True, exist_ok=True)
 
         destination = self.path_for(filename)
@@ -70,7 +223,8 @@ class YamlStore:
             dir=str(destination.parent),
             delete=False,
         ) as tmp:
-            yaml.safe_dump(data, tmp, sort_keys=False, allow_unicode=True)
+            yaml.dump(data, tmp, Dumper=_Dumper, sort_keys=False, allow_unicode=True)
             tmp_path = Path(tmp.name)
 
         os.replace(tmp_path, destination)
+        STORAGE_OPERATION_DURATION.observe(time.perf_counter() - start, "write", filename)
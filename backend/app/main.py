@@ -1,29 +1,61 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.api.deps.container import build_container
+from app.api.instrumentation import MetricsMiddleware
+from app.api.profiling import ProfilingMiddleware
+from app.api.responses import FastJSONResponse
 from app.api.routes.concepts import router as concepts_router
+from app.api.routes.export import router as export_router
 from app.api.routes.health import router as health_router
+from app.api.routes.metrics import router as metrics_router
 from app.api.routes.progress import router as progress_router
 from app.api.routes.practice import router as practice_router
+from app.api.routes.profiles import router as profiles_router
 from app.api.routes.questions import router as questions_router
-from app.core.settings import get_settings
+from app.core.settings import Settings, get_settings
+from app.infra.llm.ollama_client import OllamaClient
 
 
-def create_app() -> FastAPI:
+def create_app(settings: Settings | None = None, *, ollama: OllamaClient | None = None) -> FastAPI:
     """Create and configure the FastAPI application.
 
+    Inputs:
+        settings: Optional settings (defaults to the process-wide settings).
+        ollama: Optional LLM client override (tests pass a fake).
+
     Returns:
         Configured FastAPI instance.
 
     Notes:
-        We use an application factory to keep startup behavior testable.
+        - We use an application factory to keep startup behavior testable.
+        - The app container (store, repositories, LLM client, practice
+          service) is built in the lifespan and stored on `app.state`;
+          requests only look it up. Clients must run the lifespan (e.g.
+          `with TestClient(app) as client`).
+        - Profiling middleware and `/debug/profiles` exist only when
+          `PROFILING_TOKEN` is set.
     """
 
-    settings = get_settings()
+    settings = settings or get_settings()
 
-    app = FastAPI(title=settings.app_name)
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        container = build_container(settings, ollama=ollama)
+        await container.start()
+        app.state.container = container
+        try:
+            yield
+        finally:
+            del app.state.container
+            await container.close()
+
+    app = FastAPI(title=settings.app_name, default_response_class=FastJSONResponse, lifespan=lifespan)
 
     allow_origins = [origin.strip() for origin in settings.cors_allow_origins.split(",") if origin.strip()]
 
@@ -35,11 +67,23 @@ def create_app() -> FastAPI:
         allow_headers=["*"]
     )
 
+    if settings.profiling_token:
+        app.add_middleware(
+            ProfilingMiddleware, token=settings.profiling_token, top_functions=settings.profiling_top_functions
+        )
+    if settings.metrics_enabled:
+        app.add_middleware(MetricsMiddleware)
+
     app.include_router(health_router)
+    if settings.metrics_enabled:
+        app.include_router(metrics_router)
     app.include_router(concepts_router)
     app.include_router(progress_router)
     app.include_router(practice_router)
     app.include_router(questions_router)
+    app.include_router(export_router)
+    if settings.profiling_token:
+        app.include_router(profiles_router)
 
     return app
 
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Ensure `import app.*` works when running from any CWD.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.api.instrumentation import MetricsMiddleware  # noqa: E402
+from app.core.metrics import Histogram  # noqa: E402
+
+
+class _Route:
+    path = "/bench/{item_id}"
+
+
+async def _bare_app(scope, receive, send) -> None:
+    scope["route"] = _Route
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def _noop_send(message) -> None:
+    return None
+
+
+async def _noop_receive():
+    return {"type": "http.request", "body": b""}
+
+
+def _asgi_cost(app, calls: int) -> float:
+    async def run() -> float:
+        start = time.perf_counter()
+        for _ in range(calls):
+            await app({"type": "http", "method": "GET", "path": "/bench/1"}, _noop_receive, _noop_send)
+        return (time.perf_counter() - start) / calls
+
+    return asyncio.run(run())
+
+
+def _observe_cost(calls: int) -> float:
+    histogram = Histogram("bench_seconds", "bench", ("route",))
+    start = time.perf_counter()
+    for i in range(calls):
+        histogram.observe((i % 1000) / 1000, "/bench")
+    return (time.perf_counter() - start) / calls
+
+
+def _http_cost(enabled: bool, requests: int) -> float:
+    from app.core.settings import Settings
+    from app.main import create_app
+
+    with TestClient(create_app(Settings(metrics_enabled=enabled))) as client:
+        client.get("/health")
+        start = time.process_time()
+        for _ in range(requests):
+            client.get("/health")
+        return (time.process_time() - start) / requests
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-request overhead of the metrics middleware.")
+    parser.add_argument("--calls", type=int, default=100_000)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    os.environ["DATA_DIR"] = tempfile.mkdtemp()
+
+    bare = _asgi_cost(_bare_app, args.calls)
+    wrapped = _asgi_cost(MetricsMiddleware(_bare_app), args.calls)
+    observe = _observe_cost(args.calls)
+    http_off = _http_cost(False, args.requests)
+    http_on = _http_cost(True, args.requests)
+
+    print(f"{'measurement':<44} {'µs':>10}")
+    print(f"{'Histogram.observe':<44} {observe * 1e6:>10.2f}")
+    print(f"{'ASGI call, bare app':<44} {bare * 1e6:>10.2f}")
+    print(f"{'ASGI call, with MetricsMiddleware':<44} {wrapped * 1e6:>10.2f}")
+    print(f"{'  middleware overhead':<44} {(wrapped - bare) * 1e6:>10.2f}")
+    print(f"{'GET /health via TestClient, metrics off (CPU)':<44} {http_off * 1e6:>10.2f}")
+    print(f"{'GET /health via TestClient, metrics on (CPU)':<44} {http_on * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Ensure `import app.*` works when running from any CWD.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.core.settings import Settings  # noqa: E402
+from app.main import create_app  # noqa: E402
+
+_CONCEPTS = [
+    {"title": "Big-O notation", "description": "Asymptotic upper bound of a function's growth.", "tags": ["algorithms"]},
+    {"title": "Binary search", "description": "Halving a sorted range to find a key.", "tags": ["algorithms"]},
+    {"title": "Hash table", "description": "Key-value map with O(1) expected lookups.", "tags": ["data-structures"]},
+    {"title": "TCP handshake", "description": "SYN, SYN-ACK, ACK connection setup.", "tags": ["networking"]},
+    {"title": "Database index", "description": "Auxiliary structure that speeds up lookups.", "tags": ["databases"]},
+]
+_ANSWER = "I think it is about making lookups faster."
+
+
+def _percentiles(samples: list[float]) -> str:
+    if not samples:
+        return f"{'-':>9} {'-':>9} {'-':>9}"
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    return f"{statistics.median(ordered) * 1e3:>9.1f} {p95 * 1e3:>9.1f} {ordered[-1] * 1e3:>9.1f}"
+
+
+def run(args: argparse.Namespace) -> None:
+    settings = Settings(
+        data_dir=tempfile.mkdtemp(),
+        ollama_cassette_mode=args.mode,
+        ollama_cassette_path=str(Path(args.cassette).resolve()),
+        ollama_cassette_latency_scale=args.latency_scale,
+        practice_random_seed=args.seed,
+        prefetch_concepts=0,  # background speculation would make the LLM call sequence timing-dependent
+        metrics_enabled=False,
+    )
+    timings: dict[str, list[float]] = {"generate": [], "submit": [], "report job": []}
+    errors: dict[str, int] = {}
+
+    def timed(step: str, call):
+        start = time.perf_counter()
+        response = call()
+        if response.status_code >= 400:
+            errors[step] = errors.get(step, 0) + 1
+        else:
+            timings[step].append(time.perf_counter() - start)
+        return response
+
+    with TestClient(create_app(settings)) as client:
+        for concept in _CONCEPTS:
+            client.post("/concepts", json=concept)
+
+        for round_number in range(args.rounds):
+            generated = timed("generate", lambda: client.post("/practice/generate"))
+            if generated.status_code >= 400:
+                continue
+            body = generated.json()
+            timed(
+                "submit",
+                lambda: client.post(
+                    "/practice/submit",
+                    json={"concept_id": body["concept_id"], "question_id": body["question"]["id"], "user_answer": _ANSWER},
+                ),
+            )
+
+            if args.report_every and round_number % args.report_every == args.report_every - 1:
+                start = time.perf_counter()
+                job = client.post(f"/questions/{body['question']['id']}/report", json={"reason": "benchmark"}).json()
+                deadline = start + args.report_timeout
+                while (state := client.get(f"/questions/report-jobs/{job['job_id']}").json())["status"] in (
+                    "queued",
+                    "running",
+                ) and time.perf_counter() < deadline:
+                    time.sleep(0.005)
+                if state["status"] == "succeeded":
+                    timings["report job"].append(time.perf_counter() - start)
+                else:
+                    errors["report job"] = errors.get("report job", 0) + 1
+
+        cassette = client.app.state.container.llm_cassette
+
+    print(f"mode={args.mode} rounds={args.rounds} latency_scale={args.latency_scale} seed={args.seed}")
+    print(f"{'step':<12} {'n':>5} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9} {'errors':>7}")
+    for step, samples in timings.items():
+        print(f"{step:<12} {len(samples):>5} {_percentiles(samples)} {errors.get(step, 0):>7}")
+    if cassette is not None:
+        print(f"cassette: {len(cassette)} replayable, {cassette.recorded} recorded, {cassette.misses} misses")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Repeatable end-to-end benchmark of practice generate/submit and the report flow. "
+            "Record a cassette once against a live Ollama (OLLAMA_* settings), then replay it."
+        )
+    )
+    parser.add_argument("cassette", help="Cassette path (.ndjson or .ndjson.gz)")
+    parser.add_argument("--mode", choices=("record", "replay"), default="replay")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--report-every", type=int, default=5, help="Report every Nth served question (0: never)")
+    parser.add_argument("--report-timeout", type=float, default=60.0, help="Seconds to wait for a report job")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="Replay delay multiplier (0: instant)")
+    parser.add_argument("--seed", type=int, default=7)
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Ensure `import app.*` works when running from any CWD.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import json  # noqa: E402
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from pydantic import BaseModel, TypeAdapter  # noqa: E402
+
+from app.domain.concepts import Concept  # noqa: E402
+from app.domain.practice.models import ConceptProgress  # noqa: E402
+from app.domain.practice.selection import is_due  # noqa: E402
+from app.infra.storage.yaml_store import YamlStore  # noqa: E402
+
+
+class _LegacyProgressItem(BaseModel):
+    concept_id: str
+    progress: ConceptProgress
+    is_due: bool
+
+
+class _LegacyProgressListResponse(BaseModel):
+    items: list[_LegacyProgressItem]
+
+
+def _write_library(store: YamlStore, size: int, seed: int) -> None:
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    concepts = []
+    progress = []
+    for i in range(size):
+        created = now - timedelta(minutes=size - i)
+        concepts.append(
+            Concept(
+                id=f"c{i}",
+                title=f"Concept {i}",
+                description="Synthetic concept used for benchmarking.",
+                tags=[f"tag{rng.randrange(50)}" for _ in range(2)],
+                created_at=created,
+                updated_at=created,
+            ).model_dump(mode="json")
+        )
+        if rng.random() < 0.8:
+            progress.append(
+                ConceptProgress(
+                    concept_id=f"c{i}",
+                    mastery_streak=rng.randint(0, 8),
+                    last_correct_at=now - timedelta(minutes=rng.randint(0, 10_000)),
+                    next_due_at=now + timedelta(minutes=rng.randint(-5_000, 5_000)),
+                    last_attempt_score=rng.uniform(0, 100),
+                ).model_dump(mode="json")
+            )
+    store.write_atomic("concepts.yaml", {"version": 1, "concepts": concepts})
+    store.write_atomic("progress.yaml", {"version": 1, "progress": progress})
+
+
+def _legacy_app(store: YamlStore) -> FastAPI:
+    """The pre-cache request path: read + validate per request, `response_model` re-validation, stdlib JSON."""
+
+    legacy = FastAPI()
+
+    def load_concepts() -> list[Concept]:
+        payload = store.read("concepts.yaml", default={"concepts": []})
+        return [Concept.model_validate(item) for item in payload.get("concepts", [])]
+
+    @legacy.get("/concepts", response_model=list[Concept])
+    def list_concepts() -> list[Concept]:
+        return load_concepts()
+
+    @legacy.get("/progress", response_model=_LegacyProgressListResponse)
+    def list_progress() -> _LegacyProgressListResponse:
+        now = datetime.now(timezone.utc)
+        payload = store.read("progress.yaml", default={"progress": []})
+        progress_by = {
+            model.concept_id: model
+            for model in (ConceptProgress.model_validate(item) for item in payload.get("progress", []))
+        }
+        items = []
+        for concept in load_concepts():
+            progress = progress_by.get(concept.id) or ConceptProgress(concept_id=concept.id)
+            items.append(_LegacyProgressItem(concept_id=concept.id, progress=progress, is_due=is_due(progress, now=now)))
+        return _LegacyProgressListResponse(items=items)
+
+    return legacy
+
+
+def _cpu_per_request(client: TestClient, path: str, requests: int, headers: dict[str, str] | None = None) -> float:
+    client.get(path, headers=headers)  # warm caches
+    start = time.process_time()
+    for _ in range(requests):
+        response = client.get(path, headers=headers)
+        assert response.status_code in (200, 304), response.status_code
+    return (time.process_time() - start) / requests
+
+
+def _serialization_cost(concepts: list[Concept], repeats: int) -> tuple[float, float]:
+    """CPU seconds to turn already-validated models into a body: FastAPI default vs pre-serialized."""
+
+    adapter = TypeAdapter(list[Concept])
+
+    def fastapi_default() -> bytes:
+        # `response_model` validation of the dumped value, then jsonable_encoder + stdlib json.
+        validated = adapter.validate_python([concept.model_dump() for concept in concepts])
+        return json.dumps(jsonable_encoder(validated)).encode("utf-8")
+
+    def pre_serialized() -> bytes:
+        return adapter.dump_json(concepts)
+
+    timings = []
+    for fn in (fastapi_default, pre_serialized):
+        start = time.process_time()
+        for _ in range(repeats):
+            fn()
+        timings.append((time.process_time() - start) / repeats)
+    assert json.loads(fastapi_default()) == json.loads(pre_serialized())
+    return timings[0], timings[1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-request CPU of GET /concepts and GET /progress, before vs after.")
+    parser.add_argument("--concepts", type=int, default=2_000)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        store = YamlStore(data_dir)
+        _write_library(store, args.concepts, args.seed)
+
+        os.environ["DATA_DIR"] = data_dir
+        from app.main import create_app
+
+        legacy = TestClient(_legacy_app(store))
+        with TestClient(create_app()) as current:
+            etag = current.get("/progress").headers["ETag"]
+            loaded = [Concept.model_validate(item) for item in store.read("concepts.yaml", default={})["concepts"]]
+            rows = [
+                ("GET /concepts", _cpu_per_request(legacy, "/concepts", args.requests),
+                 _cpu_per_request(current, "/concepts", args.requests)),
+                ("GET /concepts?limit=50&fields=id,title", None,
+                 _cpu_per_request(current, "/concepts?limit=50&fields=id,title", args.requests)),
+                ("GET /progress", _cpu_per_request(legacy, "/progress", args.requests),
+                 _cpu_per_request(current, "/progress", args.requests)),
+                ("GET /progress (If-None-Match)", None,
+                 _cpu_per_request(current, "/progress", args.requests, headers={"If-None-Match": etag})),
+                ("serialize concepts (no I/O)", *_serialization_cost(loaded, args.requests)),
+            ]
+
+    print(f"{args.concepts:,} concepts, mean CPU ms per request after warm-up")
+    print(f"{'endpoint':<42} {'before':>10} {'after':>10} {'speedup':>9}")
+    for name, before, after in rows:
+        before_text = "-" if before is None else f"{before * 1000:.2f}"
+        speedup = "-" if before is None else f"{before / after:.1f}x"
+        print(f"{name:<42} {before_text:>10} {after * 1000:>10.2f} {speedup:>9}")
+    print()
+    print("`before` re-reads and validates YAML per request, re-validates against `response_model`")
+    print("and encodes with the stdlib; `after` is the current app (cached models, pre-serialized bytes).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Ensure `import app.*` works when running from any CWD.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.domain.concepts import Concept  # noqa: E402
+from app.domain.practice.models import ConceptProgress  # noqa: E402
+from app.domain.practice.selection import pick_due_concept  # noqa: E402
+from app.domain.practice.selection_vectorized import ConceptColumns, pick_due_concept_vectorized  # noqa: E402
+
+
+def _synthetic_library(size: int, seed: int) -> tuple[list[Concept], dict[str, ConceptProgress]]:
+    rng = random.Random(seed)
+    now = datetime(2026, 1, 20, 12, 0, 0, tzinfo=timezone.utc)
+    tags = [f"tag{i}" for i in range(200)]
+
+    concepts: list[Concept] = []
+    progress: dict[str, ConceptProgress] = {}
+    for i in range(size):
+        concept_id = f"c{i}"
+        concepts.append(
+            Concept(id=concept_id, title=concept_id, tags=rng.sample(tags, 3), created_at=now, updated_at=now)
+        )
+        if rng.random() < 0.1:
+            continue
+        progress[concept_id] = ConceptProgress(
+            concept_id=concept_id,
+            mastery_streak=rng.randint(0, 8),
+            last_correct_at=now - timedelta(minutes=rng.randint(0, 10_000)),
+            next_due_at=now + timedelta(minutes=rng.randint(-5_000, 5_000)),
+            last_attempt_score=rng.uniform(0, 100),
+        )
+    return concepts, progress
+
+
+def _best_of(repeats: int, fn) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark scalar vs vectorized concept selection.")
+    parser.add_argument("--concepts", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    concepts, progress = _synthetic_library(args.concepts, args.seed)
+    now = datetime(2026, 1, 20, 12, 0, 0, tzinfo=timezone.utc)
+    recent_tags = {"tag1", "tag2", "tag3"}
+
+    build_seconds = _best_of(1, lambda: ConceptColumns.build(concepts, progress))
+    columns = ConceptColumns.build(concepts, progress)
+
+    for seed in range(20):
+        scalar = pick_due_concept(
+            concepts=concepts,
+            progress_by_concept_id=progress,
+            recent_tags=recent_tags,
+            now=now,
+            rng=random.Random(seed),
+        )
+        vectorized = pick_due_concept_vectorized(columns, recent_tags=recent_tags, now=now, rng=random.Random(seed))
+        if scalar != vectorized:
+            raise SystemExit(f"Mismatch for seed {seed}: {scalar} != {vectorized}")
+
+    scalar_seconds = _best_of(
+        args.repeats,
+        lambda: pick_due_concept(
+            concepts=concepts,
+            progress_by_concept_id=progress,
+            recent_tags=recent_tags,
+            now=now,
+            rng=random.Random(1),
+        ),
+    )
+    vectorized_seconds = _best_of(
+        args.repeats,
+        lambda: pick_due_concept_vectorized(columns, recent_tags=recent_tags, now=now, rng=random.Random(1)),
+    )
+
+    print(f"concepts:            {args.concepts}")
+    print(f"column build (once): {build_seconds * 1000:.1f} ms")
+    print(f"scalar pick:         {scalar_seconds * 1000:.1f} ms")
+    print(f"vectorized pick:     {vectorized_seconds * 1000:.1f} ms")
+    print(f"speedup:             {scalar_seconds / vectorized_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+import argparse
+import csv
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+# Ensure `import app.*` works when running from any CWD.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.domain.practice.scheduling_vectorized import (  # noqa: E402
+    cooldown_minutes_array,
+    next_due_offset_minutes_array,
+    update_mastery_streak_array,
+)
+from app.domain.practice.selection_vectorized import popcount, weight_array  # noqa: E402
+
+MINUTES_PER_DAY = 1440.0
+ANSWER_MODELS = ("fixed", "mastery", "forgetting")
+
+
+@dataclass(frozen=True)
+class SimulationConfig:
+    """Knobs for one simulation run (see `--help` for meanings)."""
+
+    learners: int
+    concepts: int
+    days: int
+    session_size: int
+    minutes_per_question: float
+    tags: int
+    tags_per_concept: int
+    history_size: int
+    answer_model: str
+    p_correct: float
+    p_ok: float
+    stability_days: float
+    stability_growth: float
+    seed: int
+
+
+@dataclass
+class DailyMetrics:
+    """Per-day aggregates; per-learner arrays are shaped (days, learners)."""
+
+    reviews: np.ndarray
+    due_at_start: np.ndarray
+    correct_answers: np.ndarray
+    mastery_sum: np.ndarray
+
+
+def _answer_scores(
+    config: SimulationConfig,
+    rng: np.random.Generator,
+    *,
+    mastery: np.ndarray,
+    minutes_since_review: np.ndarray,
+) -> np.ndarray:
+    """Draw synthetic scores (0-100) for one answer per row.
+
+    Answer models:
+        fixed: P(correct) = p_correct regardless of history.
+        mastery: P(correct) rises with mastery:
+            1 - (1 - p_correct) * 0.7 ** mastery.
+        forgetting: P(correct) = exp(-days_since_review / stability) with
+            stability = stability_days * stability_growth ** mastery;
+            never-reviewed concepts use p_correct.
+    Misses are OK with probability p_ok, otherwise poor.
+    """
+
+    if config.answer_model == "fixed":
+        p_correct = np.full(mastery.shape, config.p_correct)
+    elif config.answer_model == "mastery":
+        p_correct = 1.0 - (1.0 - config.p_correct) * np.power(0.7, mastery)
+    else:
+        stability = config.stability_days * np.power(config.stability_growth, mastery)
+        recall = np.exp(-(minutes_since_review / MINUTES_PER_DAY) / stability)
+        p_correct = np.where(np.isnan(minutes_since_review), config.p_correct, recall)
+
+    outcome = rng.random(mastery.shape)
+    band = rng.random(mastery.shape)
+    correct = outcome < p_correct
+    ok = ~correct & (rng.random(mastery.shape) < config.p_ok)
+
+    return np.where(correct, 85.0 + 15.0 * band, np.where(ok, 50.0 + 35.0 * band, 50.0 * band))
+
+
+def _simulate_chunk(
+    config: SimulationConfig,
+    rng: np.random.Generator,
+    *,
+    learners: int,
+    tag_bits: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Simulate `learners` independent learners for `config.days` days.
+
+    Returns:
+        (reviews[days, learners], due_at_start[days, learners],
+         correct_answers[days], mastery_sum[days], final mastery grid)
+    """
+
+    shape = (learners, config.concepts)
+    mastery = np.zeros(shape, dtype=np.int64)
+    next_due = np.full(shape, np.nan)
+    last_correct = np.full(shape, np.nan)
+    last_review = np.full(shape, np.nan)
+    poor = np.zeros(shape, dtype=bool)
+    history = np.zeros((learners, max(config.history_size, 1)), dtype=np.uint64)
+
+    reviews_by_day = np.zeros((config.days, learners), dtype=np.int32)
+    due_by_day = np.zeros((config.days, learners), dtype=np.int32)
+    correct_by_day = np.zeros(config.days, dtype=np.int64)
+    mastery_sum_by_day = np.zeros(config.days, dtype=np.int64)
+
+    session_minutes = config.session_size * config.minutes_per_question
+
+    for day in range(config.days):
+        session_start = day * MINUTES_PER_DAY
+        due_by_day[day] = (np.isnan(next_due) | (next_due <= session_start)).sum(axis=1)
+
+        # Only learners with something due before the session ends do any work.
+        active_rows = np.flatnonzero((np.isnan(next_due) | (next_due <= session_start + session_minutes)).any(axis=1))
+        if active_rows.size:
+            sub = (
+                mastery[active_rows],
+                next_due[active_rows],
+                last_correct[active_rows],
+                last_review[active_rows],
+                poor[active_rows],
+                history[active_rows],
+            )
+            reviews, correct = _run_session(config, rng, sub, tag_bits=tag_bits, session_start=session_start)
+            (
+                mastery[active_rows],
+                next_due[active_rows],
+                last_correct[active_rows],
+                last_review[active_rows],
+                poor[active_rows],
+                history[active_rows],
+            ) = sub
+            reviews_by_day[day, active_rows] = reviews
+            correct_by_day[day] = correct
+
+        mastery_sum_by_day[day] = mastery.sum()
+
+    return reviews_by_day, due_by_day, correct_by_day, mastery_sum_by_day, mastery
+
+
+def _run_session(
+    config: SimulationConfig,
+    rng: np.random.Generator,
+    state: tuple[np.ndarray, ...],
+    *,
+    tag_bits: np.ndarray,
+    session_start: float,
+) -> tuple[np.ndarray, int]:
+    """Run one daily session for the given learners, updating `state` in place.
+
+    Returns:
+        (reviews per learner, number of correct answers)
+    """
+
+    mastery, next_due, last_correct, last_review, poor, history = state
+    learners = mastery.shape[0]
+    rows = np.arange(learners)
+    reviews = np.zeros(learners, dtype=np.int32)
+    correct_answers = 0
+
+    for step in range(config.session_size):
+        now = session_start + step * config.minutes_per_question
+        due = np.isnan(next_due) | (next_due <= now)
+
+        if config.history_size > 0:
+            recent_mask = np.bitwise_or.reduce(history, axis=1)
+        else:
+            recent_mask = np.zeros(learners, dtype=np.uint64)
+
+        weights = weight_array(
+            tag_overlap=popcount(tag_bits[None, :] & recent_mask[:, None]),
+            has_last_correct=~np.isnan(last_correct),
+            minutes_since_last_correct=now - last_correct,
+            poor=poor,
+            mastery=mastery,
+        )
+        weights = np.where(due, weights, 0.0)
+
+        # Same draw as `pick_due_concept`: first concept whose running total
+        # reaches `random() * total`.
+        cumulative = np.cumsum(weights, axis=1)
+        total = cumulative[:, -1]
+        active = total > 0.0
+        if not active.any():
+            break
+
+        roll = rng.random(learners) * total
+        picked = np.minimum((cumulative < roll[:, None]).sum(axis=1), config.concepts - 1)
+
+        learner = rows[active]
+        concept = picked[active]
+
+        scores = _answer_scores(
+            config,
+            rng,
+            mastery=mastery[learner, concept],
+            minutes_since_review=now - last_review[learner, concept],
+        )
+
+        new_mastery = update_mastery_streak_array(mastery[learner, concept], scores)
+        offset = next_due_offset_minutes_array(scores, cooldown_minutes_array(new_mastery))
+        is_correct = scores >= 85.0
+
+        mastery[learner, concept] = new_mastery
+        poor[learner, concept] = scores < 50.0
+        last_review[learner, concept] = now
+        last_correct[learner, concept] = np.where(is_correct, now, last_correct[learner, concept])
+        next_due[learner, concept] = np.where(np.isnan(offset), next_due[learner, concept], now + offset)
+
+        if config.history_size > 0:
+            history[learner, :-1] = history[learner, 1:]
+            history[learner, -1] = tag_bits[concept]
+
+        reviews[learner] += 1
+        correct_answers += int(is_correct.sum())
+
+    return reviews, correct_answers
+
+
+def simulate(config: SimulationConfig, *, chunk_size: int = 512) -> tuple[DailyMetrics, np.ndarray]:
+    """Run the simulation.
+
+    Each learner owns the same synthetic library. Every day starts one session
+    of up to `session_size` questions; each question picks a due concept with
+    the real selection weights (including tag continuity over the last
+    `history_size` picks), draws a score from the answer model and applies the
+    real mastery / cooldown rules (NumPy equivalents verified against
+    `scheduling.py` / `selection.py` in the test suite).
+
+    Learners are independent, so they are simulated in chunks of `chunk_size`
+    that advance in lock-step; chunking keeps the working set cache-sized.
+
+    Returns:
+        Per-day metrics and the final mastery grid (learners, concepts).
+    """
+
+    rng = np.random.default_rng(config.seed)
+
+    tag_bits = np.zeros(config.concepts, dtype=np.uint64)
+    for _ in range(config.tags_per_concept):
+        tag_bits |= np.left_shift(np.uint64(1), rng.integers(0, config.tags, config.concepts).astype(np.uint64))
+
+    reviews_parts, due_parts, mastery_parts = [], [], []
+    correct = np.zeros(config.days, dtype=np.int64)
+    mastery_sum = np.zeros(config.days, dtype=np.int64)
+
+    for chunk_start in range(0, config.learners, chunk_size):
+        learners = min(chunk_size, config.learners - chunk_start)
+        reviews, due, chunk_correct, chunk_mastery_sum, final_mastery = _simulate_chunk(
+            config, rng, learners=learners, tag_bits=tag_bits
+        )
+        reviews_parts.append(reviews)
+        due_parts.append(due)
+        mastery_parts.append(final_mastery)
+        correct += chunk_correct
+        mastery_sum += chunk_mastery_sum
+
+    metrics = DailyMetrics(
+        reviews=np.concatenate(reviews_parts, axis=1),
+        due_at_start=np.concatenate(due_parts, axis=1),
+        correct_answers=correct,
+        mastery_sum=mastery_sum,
+    )
+    return metrics, np.concatenate(mastery_parts, axis=0)
+
+
+def _parse_args() -> tuple[SimulationConfig, int, int, Path | None]:
+    parser = argparse.ArgumentParser(
+        description="Simulate the spaced-repetition rules over synthetic learners (vectorized)."
+    )
+    parser.add_argument("--learners", type=int, default=5_000)
+    parser.add_argument("--concepts", type=int, default=50, help="Concepts per learner")
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--session-size", type=int, default=10, help="Max questions per learner per day")
+    parser.add_argument("--minutes-per-question", type=float, default=2.0)
+    parser.add_argument("--tags", type=int, default=16, help="Distinct tags in the library (<= 64)")
+    parser.add_argument("--tags-per-concept", type=int, default=2)
+    parser.add_argument("--history-size", type=int, default=3, help="Tag continuity window (0 disables)")
+    parser.add_argument("--answer-model", choices=ANSWER_MODELS, default="forgetting")
+    parser.add_argument("--p-correct", type=float, default=0.7)
+    parser.add_argument("--p-ok", type=float, default=0.5, help="P(OK) given not correct")
+    parser.add_argument("--stability-days", type=float, default=2.0)
+    parser.add_argument("--stability-growth", type=float, default=2.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=512, help="Learners simulated together")
+    parser.add_argument("--report-every", type=int, default=30, help="Print every N days")
+    parser.add_argument("--csv", type=Path, default=None, help="Write per-day metrics to this CSV file")
+    args = parser.parse_args()
+
+    if not 1 <= args.tags <= 64:
+        parser.error("--tags must be between 1 and 64")
+
+    config = SimulationConfig(
+        learners=args.learners,
+        concepts=args.concepts,
+        days=args.days,
+        session_size=args.session_size,
+        minutes_per_question=args.minutes_per_question,
+        tags=args.tags,
+        tags_per_concept=args.tags_per_concept,
+        history_size=args.history_size,
+        answer_model=args.answer_model,
+        p_correct=args.p_correct,
+        p_ok=args.p_ok,
+        stability_days=args.stability_days,
+        stability_growth=args.stability_growth,
+        seed=args.seed,
+    )
+    return config, args.chunk_size, args.report_every, args.csv
+
+
+def main() -> None:
+    config, chunk_size, report_every, csv_path = _parse_args()
+
+    started = time.perf_counter()
+    metrics, mastery = simulate(config, chunk_size=chunk_size)
+    elapsed = time.perf_counter() - started
+
+    learner_days = config.learners * config.days
+    print(
+        f"simulated {learner_days:,} learner-days ({config.learners} learners x {config.days} days, "
+        f"{config.concepts} concepts, model={config.answer_model}) in {elapsed:.1f}s"
+    )
+    print()
+    print(f"{'day':>5} {'reviews/learner':>16} {'reviews p95':>12} {'due@start':>10} {'due p95':>8} {'correct':>8} {'mastery':>8}")
+    reviews_total = metrics.reviews.sum(axis=1)
+    reviews_p95 = np.percentile(metrics.reviews, 95, axis=1)
+    due_mean = metrics.due_at_start.mean(axis=1)
+    due_p95 = np.percentile(metrics.due_at_start, 95, axis=1)
+    correct_rate = metrics.correct_answers / np.maximum(1, reviews_total)
+    mean_mastery = metrics.mastery_sum / (config.learners * config.concepts)
+
+    for day in range(config.days):
+        if day % max(1, report_every) and day != config.days - 1:
+            continue
+        print(
+            f"{day:>5} {reviews_total[day] / config.learners:>16.2f} {reviews_p95[day]:>12.0f} "
+            f"{due_mean[day]:>10.2f} {due_p95[day]:>8.0f} {correct_rate[day]:>8.1%} {mean_mastery[day]:>8.2f}"
+        )
+
+    print()
+    print("final mastery distribution:")
+    levels, counts = np.unique(np.minimum(mastery, 10), return_counts=True)
+    for level, count in zip(levels, counts):
+        label = f"{level}+" if level == 10 else str(level)
+        print(f"  {label:>3}: {count / mastery.size:6.1%}")
+
+    if csv_path is not None:
+        with csv_path.open("w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(
+                ["day", "reviews_total", "reviews_p95", "due_at_start_mean", "due_at_start_p95", "correct_rate", "mean_mastery"]
+            )
+            for day in range(config.days):
+                writer.writerow(
+                    [
+                        day,
+                        int(reviews_total[day]),
+                        float(reviews_p95[day]),
+                        float(due_mean[day]),
+                        float(due_p95[day]),
+                        float(correct_rate[day]),
+                        float(mean_mastery[day]),
+                    ]
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -29,8 +29,9 @@ async def main() -> None:
 
     app = create_app()
 
+    # ASGITransport does not run the lifespan, which builds the app container.
     transport = httpx.ASGITransport(app=app)
-    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+    async with app.router.lifespan_context(app), httpx.AsyncClient(transport=transport, base_url="http://test") as client:
         r = await client.get("/health")
         _print_response("GET /health", r)
         if r.status_code != 200:
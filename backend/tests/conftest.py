@@ -1,6 +1,12 @@
 from __future__ import annotations
 
 import sys
+from collections import Counter
+from collections.abc import Callable
+
+import pytest
+
+from app.infra.llm.usage import record_usage
 
 
 def pytest_configure() -> None:
@@ -8,3 +14,50 @@ def pytest_configure() -> None:
     backend_root = "/Users/home/omat/maria_2/backend"
     if backend_root not in sys.path:
         sys.path.insert(0, backend_root)
+
+
+class FakeOllama:
+    """Configurable stand-in for `OllamaClient.generate_json`.
+
+    Answers by prompt kind:
+        - evaluator prompts: `{"pass": evaluator_pass(prompt)}` (default True)
+        - grader prompts: `{"score": score, "feedback": "good"}`
+        - anything else (generation): `Question <n>?`, numbered per generation
+
+    Knobs:
+        error: Raised by every call while set (e.g. `OllamaUnavailable`).
+        errors: `{text: exception}`; raised for prompts containing `text`.
+        seconds_per_call: Reported through `record_usage`, like the real client.
+
+    `calls` counts calls per kind (`generator`, `evaluator`, `grader`).
+    """
+
+    def __init__(self) -> None:
+        self.calls: Counter[str] = Counter()
+        self.score = 95
+        self.evaluator_pass: Callable[[str], bool] = lambda prompt: True
+        self.error: Exception | None = None
+        self.errors: dict[str, Exception] = {}
+        self.seconds_per_call = 0.0
+
+    async def generate_json(self, *, model: str, prompt: str, **_: object) -> dict:
+        if self.error is not None:
+            raise self.error
+        for text, exc in self.errors.items():
+            if text in prompt:
+                raise exc
+
+        kind = "evaluator" if "evaluator" in prompt else "grader" if "grader" in prompt else "generator"
+        self.calls[kind] += 1
+        if self.seconds_per_call:
+            record_usage(seconds=self.seconds_per_call, tokens=100)
+        if kind == "evaluator":
+            return {"pass": self.evaluator_pass(prompt)}
+        if kind == "grader":
+            return {"score": self.score, "feedback": "good"}
+        return {"question_text": f"Question {self.calls['generator']}?", "model_answer": "A", "rubric": "R"}
+
+
+@pytest.fixture
+def fake_ollama() -> FakeOllama:
+    return FakeOllama()
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+
+from app.domain.concepts import ConceptCreate
+from app.infra.llm.ollama_client import OllamaClient, OllamaUnavailable
+from app.infra.repositories.async_repositories import AsyncConceptsRepository
+from app.infra.repositories.concepts_repository import ConceptsRepository
+from app.infra.storage.executor import StorageExecutor
+from app.infra.storage.yaml_store import YamlStore
+
+
+def test_storage_executor_runs_on_dedicated_threads():
+    executor = StorageExecutor(workers=2)
+    try:
+        name = asyncio.run(executor.run(lambda: threading.current_thread().name))
+    finally:
+        executor.shutdown()
+
+    assert name.startswith("storage")
+
+
+def test_async_repository_round_trip(tmp_path):
+    executor = StorageExecutor(workers=1)
+    repo = AsyncConceptsRepository(ConceptsRepository(YamlStore(str(tmp_path))), executor)
+
+    async def scenario():
+        created = await repo.create_concept(ConceptCreate(title="Async", tags=["io"]))
+        return created, await repo.get_concept(created.id), await repo.count()
+
+    try:
+        created, loaded, count = asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+    assert loaded == created
+    assert count == 1
+
+
+def test_ollama_client_bounds_concurrent_calls():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"response": json.dumps({"ok": True})})
+
+    client = OllamaClient(base_url="http://ollama", max_concurrency=2, transport=httpx.MockTransport(handler))
+
+    async def scenario():
+        return await asyncio.gather(*(client.generate_json(model="m", prompt="p") for _ in range(6)))
+
+    results = asyncio.run(scenario())
+
+    assert results == [{"ok": True}] * 6
+    assert peak == 2
+
+
+def test_ollama_client_maps_http_errors():
+    client = OllamaClient(
+        base_url="http://ollama", transport=httpx.MockTransport(lambda request: httpx.Response(500, text="boom"))
+    )
+
+    with pytest.raises(OllamaUnavailable):
+        asyncio.run(client.generate_json(model="m", prompt="p"))
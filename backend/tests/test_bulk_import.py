@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from app.api.streaming import iter_json_array, iter_ndjson
+from app.domain.concepts import ConceptCreate
+from app.infra.repositories.concepts_repository import ConceptsRepository
+from app.infra.storage.yaml_store import YamlStore
+
+
+async def _chunks(body: bytes, size: int):
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+def _collect(iterator) -> list[bytes]:
+    async def run():
+        return [item async for item in iterator]
+
+    return asyncio.run(run())
+
+
+def test_json_array_split_is_independent_of_chunking():
+    items = [{"title": 'quote " and \\ slash, [bracket]', "tags": ["a", "b"]}, {"title": "x", "nested": {"k": [1, 2]}}, 7]
+    body = json.dumps(items).encode("utf-8")
+
+    for size in (1, 2, 3, 7, len(body)):
+        elements = _collect(iter_json_array(_chunks(body, size)))
+        assert [json.loads(element) for element in elements] == items
+
+
+@pytest.mark.parametrize("body", [b'{"title": "x"}', b'[{"title": "x"}', b'[1] trailing'])
+def test_json_array_rejects_malformed_bodies(body):
+    with pytest.raises(ValueError):
+        _collect(iter_json_array(_chunks(body, 4)))
+
+
+def test_ndjson_skips_blank_lines_and_keeps_last_line():
+    body = b'{"title": "a"}\n\n  \n{"title": "b"}'
+
+    assert [json.loads(line) for line in _collect(iter_ndjson(_chunks(body, 5)))] == [{"title": "a"}, {"title": "b"}]
+
+
+def test_create_concepts_single_write_with_dedup(tmp_path):
+    repo = ConceptsRepository(YamlStore(str(tmp_path)))
+    existing = repo.create_concept(ConceptCreate(title="Photosynthesis", source_url="https://a"))
+
+    result = repo.create_concepts(
+        [
+            ConceptCreate(title="photosynthesis "),
+            ConceptCreate(title="Osmosis"),
+            ConceptCreate(title="OSMOSIS"),
+            ConceptCreate(title="Diffusion"),
+        ],
+        dedup="title",
+    )
+
+    assert [(position, concept.title) for position, concept in result.created] == [(1, "Osmosis"), (3, "Diffusion")]
+    assert result.duplicates == [(0, existing.id), (2, result.created[0][1].id)]
+    assert [concept.title for concept in repo.page(limit=10).items] == ["Photosynthesis", "Osmosis", "Diffusion"]
+    assert [concept.title for concept in ConceptsRepository(YamlStore(str(tmp_path))).list_concepts()] == [
+        "Photosynthesis",
+        "Osmosis",
+        "Diffusion",
+    ]
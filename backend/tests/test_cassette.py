@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.settings import Settings
+from app.infra.llm.cassette import OllamaCassette
+from app.infra.llm.ollama_client import OllamaClient, OllamaUnavailable
+from app.main import create_app
+
+
+def _ollama_transport() -> httpx.MockTransport:
+    calls = [0]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        prompt = json.loads(request.content)["prompt"]
+        calls[0] += 1
+        if "evaluator" in prompt:
+            answer = {"pass": True}
+        elif "grader" in prompt:
+            answer = {"score": 60 + calls[0], "feedback": f"feedback {calls[0]}"}
+        else:
+            answer = {"question_text": f"Question {calls[0]}?", "model_answer": "A", "rubric": "R"}
+        return httpx.Response(
+            200,
+            json={"response": json.dumps(answer), "context": list(range(50)), "total_duration": 2_000_000_000},
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def test_record_then_replay_in_order_with_misses(tmp_path):
+    path = tmp_path / "cassette.ndjson.gz"
+    recording = OllamaCassette(path, mode="record")
+    client = OllamaClient(base_url="http://fake", transport=_ollama_transport(), cassette=recording)
+
+    async def record():
+        return [await client.generate_json(model="m", prompt=prompt) for prompt in ("q", "q", "other")]
+
+    recorded = asyncio.run(record())
+    recording.close()
+    assert recording.recorded == 3
+
+    replaying = OllamaCassette(path, mode="replay", latency_scale=0)
+    assert len(replaying) == 3
+    assert "context" not in replaying.lookup(model="m", prompt="other").body
+
+    replay = OllamaClient(base_url="http://unreachable.invalid", cassette=replaying)
+
+    async def play():
+        return [await replay.generate_json(model="m", prompt=prompt) for prompt in ("q", "q", "q", "other")]
+
+    assert asyncio.run(play()) == [recorded[0], recorded[1], recorded[0], recorded[2]]  # cycles per prompt
+
+    with pytest.raises(OllamaUnavailable):
+        asyncio.run(replay.generate_json(model="other-model", prompt="q"))
+    assert replaying.misses == 1
+
+
+def test_replayed_practice_flow_matches_the_recording(tmp_path):
+    cassette_path = tmp_path / "practice.ndjson"
+
+    def run(data_dir, **kwargs):
+        settings = Settings(
+            data_dir=str(data_dir), metrics_enabled=False, prefetch_concepts=0, practice_random_seed=3, **kwargs
+        )
+        ollama = None
+        if not kwargs:
+            cassette = OllamaCassette(cassette_path, mode="record")
+            ollama = OllamaClient(base_url="http://fake", transport=_ollama_transport(), cassette=cassette)
+
+        trace = []
+        with TestClient(create_app(settings, ollama=ollama)) as client:
+            for title in ("Alpha", "Beta", "Gamma"):
+                client.post("/concepts", json={"title": title, "description": f"About {title}"})
+            for _ in range(4):
+                generated = client.post("/practice/generate").json()
+                graded = client.post(
+                    "/practice/submit",
+                    json={
+                        "concept_id": generated["concept_id"],
+                        "question_id": generated["question"]["id"],
+                        "user_answer": "An answer",
+                    },
+                ).json()
+                attempt = graded["attempt"]
+                trace.append((generated["question"]["question_text"], attempt["score"], attempt["feedback"]))
+        if ollama is not None:
+            ollama.cassette.close()
+        return trace
+
+    recorded = run(tmp_path / "record")
+    replayed = run(
+        tmp_path / "replay",
+        ollama_cassette_mode="replay",
+        ollama_cassette_path=str(cassette_path),
+        ollama_cassette_latency_scale=0,
+    )
+
+    assert replayed == recorded
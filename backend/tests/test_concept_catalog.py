@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+
+from app.domain.concept_catalog import ConceptCatalog
+from app.domain.concepts import Concept, ConceptCreate
+from app.infra.repositories.concepts_repository import ConceptsRepository
+from app.infra.storage.yaml_store import YamlStore
+
+NOW = datetime(2026, 1, 20, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _concept(concept_id: str, title: str, minutes: int) -> Concept:
+    created = NOW + timedelta(minutes=minutes)
+    return Concept(id=concept_id, title=title, created_at=created, updated_at=created)
+
+
+def test_pages_cover_everything_in_created_order() -> None:
+    rng = random.Random(3)
+    concepts = [_concept(f"c{i:03d}", f"t{i}", rng.randint(0, 20)) for i in range(120)]
+    catalog = ConceptCatalog(concepts[:100])
+    for concept in concepts[100:]:
+        catalog.add(concept)
+
+    seen: list[str] = []
+    after = None
+    while True:
+        page = catalog.page(limit=7, after=after)
+        seen.extend(concept.id for concept in page.items)
+        if page.next_key is None:
+            break
+        after = page.next_key
+
+    expected = [c.id for c in sorted(concepts, key=lambda c: (c.created_at, c.id))]
+    assert seen == expected
+
+    only = {c.id for c in concepts if c.id.endswith("7")}
+    assert [c.id for c in catalog.page(limit=100, only=only).items] == [i for i in expected if i in only]
+
+
+def test_repository_page_filters_by_tag_and_title_prefix(tmp_path) -> None:
+    repo = ConceptsRepository(YamlStore(tmp_path))
+    for title, tags in [("Bayes rule", ["prob"]), ("bayesian nets", ["ml"]), ("Baseline", ["prob"]), ("Entropy", [])]:
+        repo.create_concept(ConceptCreate(title=title, tags=tags))
+
+    assert [c.title for c in repo.page(limit=10, title_prefix="BAYES").items] == ["Bayes rule", "bayesian nets"]
+    assert [c.title for c in repo.page(limit=10, tag="prob").items] == ["Bayes rule", "Baseline"]
+    assert [c.title for c in repo.page(limit=10, tag="prob", title_prefix="bayes").items] == ["Bayes rule"]
+
+    first = repo.page(limit=1, tag="prob")
+    assert first.next_key is not None
+    assert [c.title for c in repo.page(limit=1, tag="prob", after=first.next_key).items] == ["Baseline"]
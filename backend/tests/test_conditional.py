@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+
+from app.api.conditional import is_not_modified, validator_headers
+from app.core.settings import Settings
+from app.infra.storage.yaml_store import YamlStore
+from app.main import create_app
+
+MODIFIED = datetime(2026, 1, 20, 12, 0, 0, 500000, tzinfo=timezone.utc)
+
+
+def test_store_version_increases_on_every_change(tmp_path) -> None:
+    store = YamlStore(tmp_path)
+    assert store.version("a.yaml").counter == 0
+
+    store.write_atomic("a.yaml", {"n": 1})
+    first = store.version("a.yaml")
+    assert first.counter == 1
+    assert store.version("a.yaml") == first
+
+    store.write_atomic("a.yaml", {"n": 2})
+    assert store.version("a.yaml").counter == 2
+    assert store.version("b.yaml").counter == 0
+
+
+def test_conditional_headers() -> None:
+    headers = validator_headers('"v1"', MODIFIED)
+    assert headers == {"ETag": '"v1"', "Last-Modified": "Tue, 20 Jan 2026 12:00:00 GMT"}
+
+    def check(*, if_none_match: str | None = None, if_modified_since: str | None = None) -> bool:
+        return is_not_modified(
+            if_none_match=if_none_match, if_modified_since=if_modified_since, etag='"v1"', last_modified=MODIFIED
+        )
+
+    assert check(if_none_match='"v0", W/"v1"')
+    assert check(if_none_match="*")
+    assert not check(if_none_match='"v2"')
+    assert check(if_modified_since=headers["Last-Modified"])
+    assert not check(if_modified_since="Tue, 20 Jan 2026 11:59:59 GMT")
+    # If-None-Match takes precedence over If-Modified-Since.
+    assert not check(if_none_match='"v2"', if_modified_since=headers["Last-Modified"])
+    assert not check(if_modified_since="garbage")
+
+
+def test_concept_get_checks_existence_before_conditionals(tmp_path) -> None:
+    with TestClient(create_app(Settings(data_dir=str(tmp_path), metrics_enabled=False))) as client:
+        concept_id = client.post("/concepts", json={"title": "Alpha"}).json()["id"]
+        existing = client.get(f"/concepts/{concept_id}", headers={"If-None-Match": "*"})
+        missing = client.get("/concepts/nope", headers={"If-None-Match": "*"})
+
+    assert existing.status_code == 304
+    assert missing.status_code == 404
+    assert missing.json()["detail"]["error"]["code"] == "concept_not_found"
+
+
+def test_concept_progress_checks_existence_before_conditionals(tmp_path) -> None:
+    with TestClient(create_app(Settings(data_dir=str(tmp_path), metrics_enabled=False))) as client:
+        alpha = client.post("/concepts", json={"title": "Alpha"}).json()["id"]
+        beta = client.post("/concepts", json={"title": "Beta"}).json()["id"]
+        etag = client.get(f"/concepts/{alpha}/progress").headers["etag"]
+        same = client.get(f"/concepts/{alpha}/progress", headers={"If-None-Match": etag})
+        other = client.get(f"/concepts/{beta}/progress", headers={"If-None-Match": etag})
+        missing = [
+            client.get("/concepts/nope/progress", headers={"If-None-Match": value}) for value in ("*", etag)
+        ]
+
+    assert same.status_code == 304
+    assert other.status_code == 200 and other.json()["concept_id"] == beta
+    assert [response.status_code for response in missing] == [404, 404]
+    assert missing[0].json()["detail"]["error"]["code"] == "concept_not_found"
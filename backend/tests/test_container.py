@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi import Depends
+from fastapi.testclient import TestClient
+
+from app.api.deps.container import AppContainer, build_container
+from app.api.deps.practice_repos import get_concepts_repo, get_practice_service
+from app.api.deps.repositories import get_concepts_repository, get_store
+from app.core.settings import Settings, get_settings
+from app.domain.practice.service import PracticeService
+from app.main import create_app
+
+
+def test_get_settings_is_parsed_once():
+    assert get_settings() is get_settings()
+
+
+def test_container_shares_one_store_and_executor(tmp_path):
+    container = build_container(Settings(data_dir=str(tmp_path)))
+    try:
+        repos = [
+            container.concepts_repo,
+            container.progress_repo,
+            container.bank_repo,
+            container.attempts_repo,
+            container.reports_repo,
+            container.history_repo,
+        ]
+        assert {id(repo.sync._store) for repo in repos} == {id(container.store)}
+        assert {id(repo.executor) for repo in repos} == {id(container.executor)}
+    finally:
+        asyncio.run(container.close())
+
+
+def test_dependencies_resolve_to_app_scoped_objects(tmp_path, fake_ollama):
+    app = create_app(Settings(data_dir=str(tmp_path), metrics_enabled=False), ollama=fake_ollama)
+    seen: list[tuple[object, ...]] = []
+
+    @app.get("/_probe")
+    async def probe(
+        repo=Depends(get_concepts_repo),
+        same_repo=Depends(get_concepts_repository),
+        store=Depends(get_store),
+        service: PracticeService = Depends(get_practice_service),
+    ) -> dict[str, bool]:
+        seen.append((repo, same_repo, store, service))
+        return {"ok": True}
+
+    with TestClient(app) as client:
+        container: AppContainer = app.state.container
+        client.get("/_probe")
+        client.get("/_probe")
+
+        concept = client.post("/concepts", json={"title": "Lifespan", "tags": ["x"]}).json()
+        generated = client.post("/practice/generate")
+
+    assert seen[0] == seen[1]
+    assert seen[0] == (container.concepts_repo, container.concepts_repo, container.store, container.practice)
+    assert generated.status_code == 200
+    assert generated.json()["concept_id"] == concept["id"]
+    assert not hasattr(app.state, "container")
+
+
+def test_requests_without_lifespan_fail_loudly(tmp_path):
+    client = TestClient(create_app(Settings(data_dir=str(tmp_path))), raise_server_exceptions=True)
+
+    with pytest.raises(RuntimeError, match="container"):
+        client.get("/concepts")
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+
+from app.domain.practice.due_histogram import DueHistogram
+from app.domain.practice.models import ConceptProgress
+from app.infra.repositories.progress_repository import ProgressRepository
+from app.infra.storage.yaml_store import YamlStore
+
+NOW = datetime(2026, 1, 20, 12, 30, 0, tzinfo=timezone.utc)
+
+
+def _brute_force(progress: dict[str, ConceptProgress], *, now: datetime, days: int) -> tuple[int, list[int]]:
+    bucket_start = now.replace(minute=0, second=0, microsecond=0)
+    due_now = 0
+    counts = [0] * days
+    for item in progress.values():
+        if item.next_due_at is None or item.next_due_at < bucket_start:
+            due_now += 1
+            continue
+        offset = (item.next_due_at - bucket_start) // timedelta(days=1)
+        if offset < days:
+            counts[offset] += 1
+    return due_now, counts
+
+
+def test_histogram_matches_brute_force_through_updates() -> None:
+    rng = random.Random(7)
+    progress: dict[str, ConceptProgress] = {}
+    histogram = DueHistogram()
+
+    for step in range(2000):
+        concept_id = f"c{rng.randrange(300)}"
+        item = ConceptProgress(concept_id=concept_id)
+        if rng.random() < 0.9:
+            item.next_due_at = NOW + timedelta(minutes=rng.randint(-3000, 12000))
+        progress[concept_id] = item
+        histogram.upsert(item)
+
+        if step % 250 == 0:
+            forecast = histogram.forecast(now=NOW, windows=7)
+            assert (forecast.due_now, [w.count for w in forecast.windows]) == _brute_force(progress, now=NOW, days=7)
+
+    assert len(histogram) == len(progress)
+    assert DueHistogram(progress.values()).forecast(now=NOW, windows=7) == histogram.forecast(now=NOW, windows=7)
+
+
+def test_repository_upsert_updates_forecast(tmp_path) -> None:
+    repo = ProgressRepository(YamlStore(tmp_path))
+    repo.upsert(ConceptProgress(concept_id="a", next_due_at=NOW + timedelta(hours=2)))
+    repo.upsert(ConceptProgress(concept_id="b", next_due_at=NOW + timedelta(days=1, hours=2)))
+
+    forecast, tracked = repo.due_forecast(now=NOW, windows=3)
+    assert tracked == 2
+    assert [w.count for w in forecast.windows] == [1, 1, 0]
+
+    repo.upsert(ConceptProgress(concept_id="a", next_due_at=NOW - timedelta(hours=3)))
+
+    forecast, _ = repo.due_forecast(now=NOW, windows=3)
+    assert forecast.due_now == 1
+    assert [w.count for w in forecast.windows] == [0, 1, 0]
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+
+from app.domain.concepts import Concept
+from app.domain.practice.due_index import DueIndex
+from app.domain.practice.models import ConceptProgress
+from app.domain.practice.selection import pick_due_concept
+from app.infra.repositories.progress_repository import ProgressRepository
+from app.infra.storage.yaml_store import YamlStore
+
+NOW = datetime(2026, 1, 20, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _concept(concept_id: str, tags: list[str]) -> Concept:
+    return Concept(id=concept_id, title=concept_id, tags=tags, created_at=NOW, updated_at=NOW)
+
+
+def _random_library(rng: random.Random, size: int) -> tuple[list[Concept], dict[str, ConceptProgress]]:
+    tags = ["a", "b", "c", "d", "e"]
+    concepts: list[Concept] = []
+    progress: dict[str, ConceptProgress] = {}
+    for i in range(size):
+        concept_id = f"c{i}"
+        concepts.append(_concept(concept_id, rng.sample(tags, rng.randint(0, 3))))
+        if rng.random() < 0.2:
+            continue
+        item = ConceptProgress(concept_id=concept_id, mastery_streak=rng.randint(0, 7))
+        if rng.random() < 0.7:
+            item.next_due_at = NOW + timedelta(minutes=rng.randint(-3000, 3000))
+        if rng.random() < 0.6:
+            item.last_correct_at = NOW - timedelta(minutes=rng.randint(0, 5000))
+        if rng.random() < 0.5:
+            item.last_attempt_score = rng.uniform(0, 100)
+        progress[concept_id] = item
+    return concepts, progress
+
+
+def test_due_index_matches_next_due_at() -> None:
+    index = DueIndex(
+        [
+            ConceptProgress(concept_id="past", next_due_at=NOW - timedelta(minutes=1)),
+            ConceptProgress(concept_id="future", next_due_at=NOW + timedelta(minutes=5)),
+            ConceptProgress(concept_id="never"),
+        ]
+    )
+
+    assert index.cooling_ids(NOW) == {"future"}
+    assert index.advance(NOW + timedelta(minutes=5)) == ["future"]
+    assert index.cooling_ids(NOW + timedelta(minutes=5)) == set()
+
+
+def test_due_index_upsert_supersedes_old_entry() -> None:
+    index = DueIndex([ConceptProgress(concept_id="c1", next_due_at=NOW + timedelta(minutes=5))])
+    index.advance(NOW)
+
+    index.upsert(ConceptProgress(concept_id="c1", next_due_at=NOW + timedelta(days=1)))
+
+    assert index.advance(NOW + timedelta(minutes=10)) == []
+    assert not index.is_due("c1", now=NOW + timedelta(minutes=10))
+    assert index.is_due("c1", now=NOW + timedelta(days=1))
+
+
+def test_due_index_handles_clock_moving_backwards() -> None:
+    index = DueIndex([ConceptProgress(concept_id="c1", next_due_at=NOW)])
+
+    assert index.is_due("c1", now=NOW + timedelta(minutes=1))
+    assert not index.is_due("c1", now=NOW - timedelta(minutes=1))
+
+
+def test_indexed_selection_identical_to_full_scan() -> None:
+    lib_rng = random.Random(7)
+    for _ in range(25):
+        concepts, progress = _random_library(lib_rng, 60)
+        recent_tags = set(lib_rng.sample(["a", "b", "c", "d", "e"], 2))
+        index = DueIndex(progress.values())
+
+        for seed in range(20):
+            expected = pick_due_concept(
+                concepts=concepts,
+                progress_by_concept_id=progress,
+                recent_tags=recent_tags,
+                now=NOW,
+                rng=random.Random(seed),
+            )
+
+            cooling = index.cooling_ids(NOW)
+            due_concepts = [c for c in concepts if c.id not in cooling]
+            actual = pick_due_concept(
+                concepts=due_concepts,
+                progress_by_concept_id={c.id: progress[c.id] for c in due_concepts if c.id in progress},
+                recent_tags=recent_tags,
+                now=NOW,
+                rng=random.Random(seed),
+            )
+
+            assert actual == expected
+
+
+def test_progress_repository_keeps_index_in_sync(tmp_path) -> None:
+    store = YamlStore(tmp_path)
+    repo = ProgressRepository(store)
+
+    repo.upsert(ConceptProgress(concept_id="c1", next_due_at=NOW + timedelta(minutes=10)))
+    assert repo.cooling_ids(now=NOW) == {"c1"}
+
+    repo.upsert(ConceptProgress(concept_id="c1", next_due_at=NOW - timedelta(minutes=10)))
+    assert repo.cooling_ids(now=NOW) == set()
+
+    # A second repository sees the persisted state.
+    assert ProgressRepository(store).get("c1").next_due_at == NOW - timedelta(minutes=10)
+
+
+def test_progress_repository_rebuilds_after_external_write(tmp_path) -> None:
+    store = YamlStore(tmp_path)
+    repo = ProgressRepository(store)
+    assert repo.cooling_ids(now=NOW) == set()
+
+    other = ProgressRepository(store)
+    other.upsert(ConceptProgress(concept_id="c2", next_due_at=NOW + timedelta(hours=1)))
+
+    assert repo.cooling_ids(now=NOW) == {"c2"}
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+from app.api.streaming import ndjson_stream
+from app.domain.time_range import TimeRange
+from app.infra.repositories.attempts_repository import AttemptsRepository
+from app.infra.storage.executor import StorageExecutor
+from app.infra.storage.yaml_store import YamlStore
+
+
+def test_iter_items_streams_only_the_requested_sequence(tmp_path):
+    store = YamlStore(str(tmp_path))
+    store.write_atomic("data.yaml", {"version": 1, "other": [{"x": 1}], "rows": [{"a": 1}, {"a": [2, {"b": None}]}]})
+
+    assert list(store.iter_items("data.yaml", "rows")) == [{"a": 1}, {"a": [2, {"b": None}]}]
+    assert list(store.iter_items("data.yaml", "version")) == []
+    assert list(store.iter_items("missing.yaml", "rows")) == []
+
+
+def test_iter_attempts_filters_by_concept_and_time(tmp_path):
+    repo = AttemptsRepository(YamlStore(str(tmp_path)))
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    for day in range(4):
+        for concept_id in ("a", "b"):
+            repo.append_attempt(
+                concept_id=concept_id,
+                question_id="q",
+                user_answer="x",
+                score=50.0,
+                feedback="",
+                now=start + timedelta(days=day),
+            )
+
+    selected = repo.iter_attempts(
+        concept_ids={"a"}, time_range=TimeRange(since=start + timedelta(days=1), until=start + timedelta(days=3))
+    )
+
+    assert [(a.concept_id, a.created_at.day) for a in selected] == [("a", 2), ("a", 3)]
+    assert len(list(repo.iter_attempts())) == 8
+
+
+def test_ndjson_stream_batches_and_closes_the_iterator():
+    closed = []
+
+    def records():
+        try:
+            for i in range(5):
+                yield {"i": i}
+        finally:
+            closed.append(True)
+
+    executor = StorageExecutor(workers=1)
+
+    async def collect():
+        return [chunk async for chunk in ndjson_stream(executor, records(), batch_size=2)]
+
+    try:
+        chunks = asyncio.run(collect())
+    finally:
+        executor.shutdown()
+
+    assert len(chunks) == 3
+    assert [json.loads(line) for line in b"".join(chunks).splitlines()] == [{"i": i} for i in range(5)]
+    assert closed == [True]
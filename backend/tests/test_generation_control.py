@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.deps.container import build_container
+from app.core.metrics import PRACTICE_GENERATION_DECISIONS
+from app.core.settings import Settings
+from app.domain.concepts import ConceptCreate
+from app.domain.practice.generation_control import GenerationController
+from app.infra.llm.scheduler import LLMScheduler
+from app.infra.llm.usage import LLMUsage
+from app.main import create_app
+
+
+def test_p_new_follows_llm_load():
+    load = [0.0]
+    control = GenerationController(idle_boost=1.5, load=lambda: load[0])
+
+    factors = []
+    for value in (0.0, 0.5, 1.0, 2.0):
+        load[0] = value
+        factors.append(control.load_factor())
+
+    assert factors == [1.5, 1.25, 1.0, 0.25]
+    load[0] = 0.0
+    assert control.p_new("c", 0.8) == 1.0  # capped
+
+    scheduler = LLMScheduler(max_concurrency=2)
+
+    async def scenario():
+        async with scheduler.slot("m"):
+            return scheduler.load()
+
+    assert asyncio.run(scenario()) == 0.5
+    assert scheduler.load() == 0.0
+
+
+def test_budgets_taper_block_and_expire_per_concept_and_globally():
+    now = [0.0]
+    control = GenerationController(
+        budget_per_window=30, concept_budget_per_window=10, window_seconds=60, clock=lambda: now[0]
+    )
+
+    control.record("a", LLMUsage(calls=2, seconds=8.5))
+    assert control.p_new("a", 0.5) == pytest.approx(0.5 * 1.5 * (1.5 / 2.5))  # idle, last quarter of the budget
+    control.record("a", LLMUsage(calls=1, seconds=1.5))
+    assert not control.allows("a") and control.p_new("a", 0.5) == 0.0
+    assert control.allows("b")
+
+    control.record("b", LLMUsage(calls=1, seconds=9))
+    control.record("c", LLMUsage(calls=1, seconds=11))
+    assert not control.allows("d")  # global budget exhausted
+
+    report = control.report()
+    assert report["global"] == {"spent": 30.0, "budget": 30.0, "remaining": 0.0}
+    assert [c["concept_id"] for c in report["concepts"]] == ["c", "a", "b"]
+
+    now[0] = 60.0
+    assert control.allows("a") and control.usage().spent == 0.0
+
+
+def test_exhausted_concept_budget_reuses_the_bank(tmp_path, fake_ollama):
+    fake_ollama.seconds_per_call = 1.0
+    settings = Settings(data_dir=str(tmp_path), metrics_enabled=False, generation_concept_budget_per_hour=2)
+    app = create_app(settings, ollama=fake_ollama)
+
+    with TestClient(app) as client:
+        concept = client.post("/concepts", json={"title": "Budgeted"}).json()
+        first = client.post("/practice/generate").json()
+        served = {client.post("/practice/generate").json()["question"]["id"] for _ in range(5)}
+        report = client.get("/practice/generation-budget").json()
+
+    assert sum(fake_ollama.calls.values()) == 2  # generation + evaluation of the first question only
+    assert served == {first["question"]["id"]}
+    assert report["unit"] == "seconds" and report["global"]["budget"] is None
+    assert report["concepts"] == [{"concept_id": concept["id"], "spent": 2.0, "budget": 2.0, "remaining": 0.0}]
+
+
+def test_each_bank_draw_counts_one_decision(tmp_path, fake_ollama):
+    settings = Settings(data_dir=str(tmp_path), metrics_enabled=False, generation_concept_budget_per_hour=2)
+    container = build_container(settings, ollama=fake_ollama)
+    concept = container.concepts_repo.sync.create_concept(ConceptCreate(title="Budgeted"))
+    decisions = ("generate", "reuse", "forced")
+
+    def draw() -> dict[str, float]:
+        before = {name: PRACTICE_GENERATION_DECISIONS.value(name) for name in decisions}
+        container.practice._draw_from_bank(concept.id)
+        return {name: PRACTICE_GENERATION_DECISIONS.value(name) - before[name] for name in decisions}
+
+    try:
+        assert draw() == {"generate": 1, "reuse": 0, "forced": 0}
+        container.generation_control.record(concept.id, LLMUsage(calls=1, seconds=2))
+        assert draw() == {"generate": 0, "reuse": 0, "forced": 1}
+    finally:
+        asyncio.run(container.close())
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.idempotency import IdempotencyKeyReused, IdempotencyStore
+from app.core.settings import Settings
+from app.main import create_app
+
+
+def test_concurrent_duplicates_share_one_run():
+    store = IdempotencyStore()
+    calls = []
+
+    async def operation():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"n": len(calls)}
+
+    async def scenario():
+        return await asyncio.gather(*(store.run("k", "body", operation) for _ in range(3)))
+
+    results = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    assert [replayed for _, replayed in results] == [False, True, True]
+    assert all(result == {"n": 1} for result, _ in results)
+
+
+def test_failures_are_not_stored_and_keys_expire():
+    now = [0.0]
+    store = IdempotencyStore(ttl_seconds=60, max_entries=2, clock=lambda: now[0])
+
+    async def fail():
+        raise RuntimeError("down")
+
+    async def ok():
+        return "ok"
+
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            await store.run("k", "body", fail)
+        assert await store.run("k", "body", ok) == ("ok", False)
+        assert await store.run("k", "body", ok) == ("ok", True)
+        with pytest.raises(IdempotencyKeyReused):
+            await store.run("k", "other body", ok)
+
+        now[0] = 61
+        assert await store.run("k", "body", ok) == ("ok", False)
+
+        for key in ("a", "b"):
+            await store.run(key, "body", ok)
+        assert len(store) == 2
+        assert await store.run("k", "body", ok) == ("ok", False)  # evicted by size
+
+    asyncio.run(scenario())
+
+
+def test_submit_retries_with_same_key_are_graded_once(tmp_path, fake_ollama):
+    app = create_app(Settings(data_dir=str(tmp_path), metrics_enabled=False), ollama=fake_ollama)
+
+    with TestClient(app) as client:
+        client.post("/concepts", json={"title": "Retry me"})
+        generated = client.post("/practice/generate").json()
+        body = {
+            "concept_id": generated["concept_id"],
+            "question_id": generated["question"]["id"],
+            "user_answer": "answer",
+        }
+
+        first = client.post("/practice/submit", json=body, headers={"Idempotency-Key": "answer-1"})
+        retry = client.post("/practice/submit", json=body, headers={"Idempotency-Key": "answer-1"})
+        reused = client.post(
+            "/practice/submit", json={**body, "user_answer": "other"}, headers={"Idempotency-Key": "answer-1"}
+        )
+        attempts = app.state.container.attempts_repo.sync.list_recent(limit=10)
+
+    assert first.status_code == retry.status_code == 200
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert "Idempotent-Replayed" not in first.headers
+    assert first.json()["progress"]["mastery_streak"] == 1
+    assert fake_ollama.calls["grader"] == 1 and len(attempts) == 1
+    assert reused.status_code == 422
+    assert reused.json()["detail"]["error"]["code"] == "idempotency_key_reused"
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.core.metrics import LLM_BACKEND_EJECTIONS, LLM_BACKEND_HEALTHY
+from app.infra.llm.backends import BackendPool, OllamaBackendConfig, parse_backends
+from app.infra.llm.ollama_client import OllamaClient, OllamaUnavailable
+
+
+class _FakeOllama:
+    """A local HTTP server speaking enough of the Ollama API; `down` makes it answer 503."""
+
+    def __init__(self, models: list[str], delay: float = 0.0) -> None:
+        self.models = models
+        self.delay = delay
+        self.down = False
+        self.generated: list[str] = []
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _reply(self, status: int, body: dict) -> None:
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self) -> None:  # noqa: N802
+                if fake.down:
+                    return self._reply(503, {"error": "down"})
+                self._reply(200, {"models": [{"name": name} for name in fake.models]})
+
+            def do_POST(self) -> None:  # noqa: N802
+                payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                if fake.down:
+                    return self._reply(503, {"error": "down"})
+                time.sleep(fake.delay)
+                fake.generated.append(payload["model"])
+                self._reply(200, {"response": json.dumps({"served_by": fake.url})})
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever, args=(0.05,), daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def servers() -> Iterator[Callable[..., _FakeOllama]]:
+    started: list[_FakeOllama] = []
+
+    def start(models: list[str], delay: float = 0.0) -> _FakeOllama:
+        started.append(_FakeOllama(models, delay))
+        return started[-1]
+
+    yield start
+    for server in started:
+        server.close()
+
+
+def test_parse_backends():
+    assert parse_backends("http://a:11434/=qwen2.5:14b|llama3, http://b:11434") == [
+        OllamaBackendConfig(url="http://a:11434", models=frozenset({"qwen2.5:14b", "llama3:latest"})),
+        OllamaBackendConfig(url="http://b:11434"),
+    ]
+    assert parse_backends("") == []
+    with pytest.raises(ValueError):
+        parse_backends("http://a:11434,http://a:11434")
+
+
+def test_routing_prefers_warm_backend_until_it_is_full():
+    pool = BackendPool(
+        [
+            OllamaBackendConfig("http://a"),
+            OllamaBackendConfig("http://b"),
+            OllamaBackendConfig("http://c", frozenset({"x:latest"})),
+        ],
+        max_concurrency=2,
+        health_interval_seconds=0,
+    )
+    a, b, c = pool.backends
+
+    async def scenario():
+        assert pool.pick("m") is a  # all cold and idle: first backend
+        b.warm["m:latest"] = time.monotonic()
+        async with pool.lease("m") as first:
+            assert first is b  # affinity
+            async with pool.lease("m") as second:
+                assert second is b  # warm backend may carry one extra request
+                assert pool.pick("m") is a  # b is at max_concurrency
+        assert pool.pick("x") in (a, c)
+        with pytest.raises(OllamaUnavailable):
+            BackendPool([OllamaBackendConfig("http://c", frozenset({"x:latest"}))]).pick("m")
+
+    asyncio.run(scenario())
+    assert a.outstanding == b.outstanding == 0
+
+
+def test_calls_spread_by_outstanding_requests(servers):
+    one, two = servers(["m"], delay=0.05), servers(["m"], delay=0.05)
+    pool = BackendPool([OllamaBackendConfig(one.url), OllamaBackendConfig(two.url)], max_concurrency=2)
+    client = OllamaClient(pool=pool)
+
+    async def scenario():
+        return await asyncio.gather(*(client.generate_json(model="m", prompt="p") for _ in range(4)))
+
+    results = asyncio.run(scenario())
+
+    assert client.scheduler.max_concurrency == 4
+    assert sorted(r["served_by"] for r in results) == sorted([one.url] * 2 + [two.url] * 2)
+
+
+def test_failing_backend_is_ejected_and_readded_by_health_check(servers):
+    flaky, steady = servers(["m:latest"]), servers(["m", "other"])
+    pool = BackendPool([OllamaBackendConfig(flaky.url), OllamaBackendConfig(steady.url)], eject_after_failures=1)
+    client = OllamaClient(pool=pool)
+
+    async def scenario():
+        await pool.check_all()  # learns inventories
+        assert await client.generate_json(model="other", prompt="p") == {"served_by": steady.url}
+
+        flaky.down = True
+        with pytest.raises(OllamaUnavailable):
+            await client.generate_json(model="m", prompt="p")  # cold tie: flaky is tried first
+        assert not pool.backends[0].healthy
+        assert await client.generate_json(model="m", prompt="p") == {"served_by": steady.url}
+
+        await pool.check_all()
+        assert not pool.backends[0].healthy  # still down
+
+        flaky.down = False
+        await pool.check_all()
+        assert pool.backends[0].healthy
+
+    asyncio.run(scenario())
+
+    assert LLM_BACKEND_EJECTIONS.value(flaky.url) == 1
+    assert LLM_BACKEND_HEALTHY.value(flaky.url) == 1
+    assert steady.generated == ["other", "m"]
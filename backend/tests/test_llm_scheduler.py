@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.metrics import LLM_QUEUE_WAIT
+from app.core.settings import Settings
+from app.infra.llm.errors import LLMOverloaded, OllamaUnavailable
+from app.infra.llm.scheduler import LLMPriority, LLMScheduler, parse_model_concurrency
+from app.main import create_app
+
+
+async def _hold(scheduler: LLMScheduler, model: str, priority: LLMPriority, order: list[str], name: str) -> None:
+    async with scheduler.slot(model, priority):
+        order.append(name)
+        await asyncio.sleep(0.005)
+
+
+def test_waiters_are_served_by_priority_then_arrival():
+    scheduler = LLMScheduler(max_concurrency=1)
+    order: list[str] = []
+
+    async def scenario():
+        before = LLM_QUEUE_WAIT.count("m", "grading")
+        first = asyncio.create_task(_hold(scheduler, "m", LLMPriority.BACKGROUND, order, "running"))
+        await asyncio.sleep(0)
+        tasks = [
+            asyncio.create_task(_hold(scheduler, "m", priority, order, name))
+            for name, priority in [
+                ("background", LLMPriority.BACKGROUND),
+                ("interactive", LLMPriority.INTERACTIVE),
+                ("grading-1", LLMPriority.GRADING),
+                ("grading-2", LLMPriority.GRADING),
+            ]
+        ]
+        await asyncio.gather(first, *tasks)
+        return LLM_QUEUE_WAIT.count("m", "grading") - before
+
+    assert asyncio.run(scenario()) == 2
+    assert order == ["running", "grading-1", "grading-2", "interactive", "background"]
+
+
+def test_model_limit_does_not_block_other_models():
+    scheduler = LLMScheduler(max_concurrency=2, model_concurrency=parse_model_concurrency("slow=1"))
+    order: list[str] = []
+
+    async def scenario():
+        await asyncio.gather(
+            _hold(scheduler, "slow", LLMPriority.INTERACTIVE, order, "slow-1"),
+            _hold(scheduler, "slow", LLMPriority.GRADING, order, "slow-2"),
+            _hold(scheduler, "fast", LLMPriority.BACKGROUND, order, "fast"),
+        )
+
+    asyncio.run(scenario())
+
+    assert order == ["slow-1", "fast", "slow-2"]
+    with pytest.raises(ValueError):
+        parse_model_concurrency("slow=0")
+
+
+def test_full_queue_sheds_lower_priority_then_rejects():
+    scheduler = LLMScheduler(max_concurrency=1, max_queue_depth=1)
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def blocker():
+            async with scheduler.slot("m", LLMPriority.GRADING):
+                await release.wait()
+
+        running = asyncio.create_task(blocker())
+        await asyncio.sleep(0)
+        background = asyncio.create_task(_hold(scheduler, "m", LLMPriority.BACKGROUND, [], "bg"))
+        await asyncio.sleep(0)
+        grading = asyncio.create_task(_hold(scheduler, "m", LLMPriority.GRADING, [], "grading"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(LLMOverloaded):
+            await background
+        with pytest.raises(LLMOverloaded):
+            await _hold(scheduler, "m", LLMPriority.GRADING, [], "late")
+
+        release.set()
+        await asyncio.gather(running, grading)
+
+    asyncio.run(scenario())
+
+
+def test_queue_timeout_is_reported_as_unavailable():
+    scheduler = LLMScheduler(max_concurrency=1, queue_timeout_seconds=0.01)
+
+    async def scenario():
+        async with scheduler.slot("m"):
+            with pytest.raises(OllamaUnavailable, match="Timed out"):
+                async with scheduler.slot("m"):
+                    pass
+        async with scheduler.slot("m"):  # the timed-out waiter left no trace
+            pass
+
+    asyncio.run(scenario())
+
+
+def test_overloaded_llm_maps_to_429(tmp_path, fake_ollama):
+    fake_ollama.error = LLMOverloaded("LLM queue is full")
+    app = create_app(Settings(data_dir=str(tmp_path), metrics_enabled=False), ollama=fake_ollama)
+
+    with TestClient(app) as client:
+        client.post("/concepts", json={"title": "Busy"})
+        response = client.post("/practice/generate")
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "5"
+    assert response.json()["detail"]["error"]["code"] == "ai_overloaded"
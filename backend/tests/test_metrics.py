@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.api.instrumentation import MetricsMiddleware
+from app.core.metrics import HTTP_REQUEST_DURATION, HTTP_RESPONSES, Counter, Histogram, MetricsRegistry
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("job_seconds", "Job time", ("kind",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, 'a"b')
+
+    lines = registry.render().splitlines()
+
+    assert lines[:2] == ["# HELP job_seconds Job time", "# TYPE job_seconds histogram"]
+    assert 'job_seconds_bucket{kind="a\\"b",le="0.1"} 2' in lines
+    assert 'job_seconds_bucket{kind="a\\"b",le="1"} 3' in lines
+    assert 'job_seconds_bucket{kind="a\\"b",le="+Inf"} 4' in lines
+    assert 'job_seconds_sum{kind="a\\"b"} 3.65' in lines
+    assert 'job_seconds_count{kind="a\\"b"} 4' in lines
+
+
+def test_registry_rejects_duplicate_names():
+    registry = MetricsRegistry()
+    registry.register(Counter("x_total", "x"))
+
+    with pytest.raises(ValueError):
+        registry.register(Histogram("x_total", "x"))
+
+
+def test_middleware_labels_by_route_template_and_status():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: str) -> dict[str, str]:
+        if item_id == "missing":
+            raise HTTPException(status_code=404)
+        return {"id": item_id}
+
+    client = TestClient(app)
+    before = HTTP_REQUEST_DURATION.count("GET", "/items/{item_id}")
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/items/missing")
+    client.get("/nowhere")
+
+    assert HTTP_REQUEST_DURATION.count("GET", "/items/{item_id}") == before + 3
+    assert HTTP_RESPONSES.value("GET", "/items/{item_id}", "404") >= 1
+    assert HTTP_RESPONSES.value("GET", "unmatched", "404") >= 1
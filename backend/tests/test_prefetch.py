@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from app.core.metrics import PRACTICE_PREFETCH
+from app.core.settings import Settings
+from app.domain.practice.prefetch import QuestionPrefetcher
+from app.main import create_app
+
+
+def test_prefetcher_budget_and_single_flight():
+    now = [0.0]
+    prefetcher = QuestionPrefetcher(max_generations_per_hour=2, max_ready=2, clock=lambda: now[0])
+
+    assert [prefetcher.try_spend() for _ in range(3)] == [True, True, False]
+    now[0] = 3600.0
+    assert prefetcher.try_spend()
+
+    assert prefetcher.begin() and not prefetcher.begin()
+    prefetcher.end()
+    assert prefetcher.begin()
+
+    for concept_id in ("a", "b", "c"):
+        prefetcher.put(concept_id, f"q-{concept_id}")
+    assert len(prefetcher) == 2 and not prefetcher.has("a")
+    assert prefetcher.take("c") == "q-c" and prefetcher.take("c") is None
+    assert not QuestionPrefetcher(concepts=0).enabled
+
+
+def test_next_generate_serves_prefetched_question(tmp_path, fake_ollama):
+    app = create_app(Settings(data_dir=str(tmp_path), metrics_enabled=False), ollama=fake_ollama)
+    hits, misses = PRACTICE_PREFETCH.value("hit"), PRACTICE_PREFETCH.value("miss")
+
+    with TestClient(app) as client:
+        for title in ("First", "Second"):
+            client.post("/concepts", json={"title": title})
+
+        served = client.post("/practice/generate").json()
+        prefetcher = app.state.container.prefetcher
+        assert fake_ollama.calls["generator"] == 2  # the served question, then one for the other concept
+        client.post(
+            "/practice/submit",
+            json={"concept_id": served["concept_id"], "question_id": served["question"]["id"], "user_answer": "A"},
+        )
+
+        upcoming = client.post("/practice/generate").json()
+
+    assert upcoming["concept_id"] != served["concept_id"]
+    assert upcoming["question"]["question_text"] == "Question 2?"
+    assert fake_ollama.calls["generator"] == 2  # the second generate did not wait on the LLM
+    assert len(prefetcher) == 0
+    assert PRACTICE_PREFETCH.value("hit") - hits == 1
+    assert PRACTICE_PREFETCH.value("miss") - misses == 1
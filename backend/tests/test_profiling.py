@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+import httpx
+from fastapi.testclient import TestClient
+
+from app.api.profiling import ProfileStore, RequestProfile
+from app.core.profiling import ProfileSummary
+from app.core.settings import Settings
+from app.infra.llm.ollama_client import OllamaClient
+from app.main import create_app
+
+TOKEN = {"X-Profile-Token": "s3cret"}
+
+
+def _ollama() -> OllamaClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        prompt = json.loads(request.content)["prompt"]
+        answer = {"pass": True} if "evaluator" in prompt else {"question_text": "Q?", "model_answer": "A", "rubric": "R"}
+        return httpx.Response(200, json={"response": json.dumps(answer)})
+
+    return OllamaClient(base_url="http://fake", transport=httpx.MockTransport(handler))
+
+
+def test_store_keeps_the_newest_profiles():
+    store = ProfileStore(max_profiles=2)
+    for profile_id in ("a", "b", "c"):
+        store.add(
+            RequestProfile(
+                id=profile_id,
+                method="GET",
+                path="/",
+                status=200,
+                started_at=datetime.now(timezone.utc),
+                duration_seconds=0.0,
+                summary=ProfileSummary(phases={}, packages={}, functions=[]),
+            )
+        )
+
+    assert store.get("a") is None
+    assert [profile.id for profile in store.recent()] == ["c", "b"]
+
+
+def test_flagged_requests_are_profiled_and_fetchable(tmp_path):
+    settings = Settings(data_dir=str(tmp_path), metrics_enabled=False, profiling_token="s3cret", profiling_top_functions=5)
+
+    with TestClient(create_app(settings, ollama=_ollama())) as client:
+        plain = client.post("/concepts", json={"title": "Alpha"})
+        wrong = client.get("/concepts", headers={"X-Profile-Token": "guess"})
+        created = client.post("/concepts", json={"title": "Beta"}, headers=TOKEN)
+        generated = client.post("/practice/generate?profile_token=s3cret")
+
+        assert "x-profile-id" not in plain.headers and "x-profile-id" not in wrong.headers
+        write = client.get(f"/debug/profiles/{created.headers['x-profile-id']}", headers=TOKEN).json()
+        generate = client.get(f"/debug/profiles/{generated.headers['x-profile-id']}", headers=TOKEN).json()
+        listed = client.get("/debug/profiles", headers=TOKEN).json()["profiles"]
+        forbidden = client.get("/debug/profiles")
+        missing = client.get("/debug/profiles/nope", headers=TOKEN)
+
+    assert write["method"] == "POST" and write["path"] == "/concepts" and write["status"] == 201
+    assert write["phases"]["storage"]["calls"] >= 1
+    assert "yaml" in write["packages"]  # serialisation on the storage thread is profiled too
+    assert 0 < len(write["functions"]) <= 5
+    assert generate["phases"]["llm"]["calls"] == 2 and "llm_queue" in generate["phases"]
+    assert [profile["id"] for profile in listed] == [generate["id"], write["id"]]
+    assert forbidden.status_code == 403
+    assert forbidden.json()["detail"]["error"]["code"] == "invalid_profile_token"
+    assert missing.status_code == 404
+
+
+def test_profiling_is_off_without_a_token(tmp_path):
+    with TestClient(create_app(Settings(data_dir=str(tmp_path), metrics_enabled=False))) as client:
+        response = client.get("/concepts", headers={"X-Profile-Token": ""})
+        assert "x-profile-id" not in response.headers
+        assert client.get("/debug/profiles").status_code == 404
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+
+from app.core.settings import Settings
+from app.domain.practice.models import ConceptProgress
+from app.domain.practice.progress_view import ProgressView
+from app.infra.repositories.progress_repository import ProgressRepository
+from app.infra.storage.yaml_store import YamlStore
+from app.main import create_app
+
+NOW = datetime(2026, 1, 20, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def test_view_tracks_changes_and_expiring_cooldowns() -> None:
+    view = ProgressView(
+        concept_ids=["a", "b"],
+        progress_by_concept_id={"a": ConceptProgress(concept_id="a", next_due_at=NOW + timedelta(minutes=5))},
+        now=NOW,
+    )
+    assert [(e.concept_id, e.is_due) for e in view.entries()] == [("a", False), ("b", True)]
+    start = view.version
+
+    view.advance(NOW + timedelta(minutes=1))
+    assert view.version == start
+    assert view.changed_since(start) == []
+
+    view.apply_progress(ConceptProgress(concept_id="b", mastery_streak=1, next_due_at=NOW + timedelta(days=1)))
+    view.advance(NOW + timedelta(minutes=6))
+    assert [(e.concept_id, e.is_due) for e in view.changed_since(start)] == [("a", True), ("b", False)]
+
+    assert view.set_concepts(["a", "b", "c"])
+    assert [e.concept_id for e in view.changed_since(start)] == ["a", "b", "c"]
+    assert not view.set_concepts(["a", "c"])
+    assert view.changed_since("other.0") is None
+
+
+def test_repository_change_feed(tmp_path) -> None:
+    repo = ProgressRepository(YamlStore(tmp_path))
+    cursor = repo.changes_since(generation=-1, revision=-1)
+    assert cursor.changed is None
+
+    repo.upsert(ConceptProgress(concept_id="a"))
+    repo.upsert(ConceptProgress(concept_id="b"))
+    repo.upsert(ConceptProgress(concept_id="a", mastery_streak=2))
+
+    changes = repo.changes_since(generation=cursor.generation, revision=cursor.revision)
+    assert {k: v.mastery_streak for k, v in changes.changed.items()} == {"a": 2, "b": 0}
+    assert repo.changes_since(generation=changes.generation, revision=changes.revision).changed == {}
+
+
+def test_since_must_be_a_view_version(tmp_path) -> None:
+    with TestClient(create_app(Settings(data_dir=str(tmp_path), metrics_enabled=False))) as client:
+        client.post("/concepts", json={"title": "Alpha"})
+        version = client.get("/progress").json()["version"]
+        delta = client.get("/progress", params={"since": version})
+        bad = [client.get("/progress", params={"since": since}) for since in ('a"b', "x\r\nSet-Cookie: y", "1.2")]
+
+    assert delta.status_code == 200 and delta.json()["partial"] is True
+    assert delta.headers["etag"] == f'"{version};since={version}"'
+    assert [response.status_code for response in bad] == [400, 400, 400]
+    assert bad[0].json()["detail"]["error"]["code"] == "invalid_since"
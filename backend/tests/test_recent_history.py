@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from app.domain.practice.models import RecentItem
+from app.infra.repositories.recent_history_repository import RecentHistoryRepository
+from app.infra.storage.yaml_store import YamlStore
+
+NOW = datetime(2026, 1, 20, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _item(question_id: str, tags: list[str], *, event: str = "served", minutes: int = 0) -> RecentItem:
+    return RecentItem(
+        concept_id=f"c-{question_id}",
+        question_id=question_id,
+        tags=tags,
+        event=event,
+        at=NOW + timedelta(minutes=minutes),
+    )
+
+
+def test_ring_buffer_keeps_last_n_items(tmp_path) -> None:
+    repo = RecentHistoryRepository(YamlStore(tmp_path), capacity=3)
+
+    repo.record([_item("q1", ["a"])])
+    repo.record([_item("q2", ["b"]), _item("q3", ["c"]), _item("q4", ["d"])])
+
+    assert [item.question_id for item in repo.list_recent(limit=10)] == ["q2", "q3", "q4"]
+    assert repo.recent_tag_history(limit=2) == [{"c"}, {"d"}]
+    assert repo.recent_tags(limit=3) == {"b", "c", "d"}
+
+
+def test_answering_moves_served_question_to_newest(tmp_path) -> None:
+    repo = RecentHistoryRepository(YamlStore(tmp_path), capacity=5)
+
+    repo.record([_item("q1", ["a"]), _item("q2", ["b"])])
+    repo.record([_item("q1", ["a"], event="answered", minutes=1)])
+
+    items = repo.list_recent(limit=5)
+    assert [(item.question_id, item.event) for item in items] == [("q2", "served"), ("q1", "answered")]
+    assert RecentHistoryRepository(YamlStore(tmp_path)).recent_tags(limit=1) == {"a"}
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+
+from app.api.deps.container import build_container
+from app.core.settings import Settings
+from app.domain.concepts import ConceptCreate
+from app.domain.practice import report_jobs
+from app.domain.practice.report_jobs import retry_delay
+from app.infra.llm.ollama_client import OllamaUnavailable
+from app.infra.repositories.report_jobs_repository import ReportJobsRepository
+from app.infra.storage.yaml_store import YamlStore
+from app.main import create_app
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _rejects_bad_questions(prompt: str) -> bool:
+    return "Bad question" not in prompt
+
+
+def test_enqueue_deduplicates_active_jobs_and_claim_honours_backoff(tmp_path):
+    repo = ReportJobsRepository(YamlStore(str(tmp_path)))
+
+    job, created = repo.enqueue(question_id="q1", concept_id="c1", now=NOW)
+    again, created_again = repo.enqueue(question_id="q1", concept_id="c1", now=NOW)
+    assert created and not created_again
+    assert again.id == job.id and again.reports == 2
+
+    claimed = repo.claim(now=NOW)
+    assert claimed is not None and claimed.status == "running" and claimed.attempts == 1
+    assert repo.claim(now=NOW) is None
+
+    repo.update(claimed.model_copy(update={"status": "queued", "next_attempt_at": NOW + timedelta(seconds=30)}))
+    assert repo.claim(now=NOW + timedelta(seconds=29)) is None
+    assert repo.next_attempt_at() == NOW + timedelta(seconds=30)
+    assert repo.claim(now=NOW + timedelta(seconds=30)).attempts == 2
+
+    # A restart requeues the job that was running.
+    assert repo.recover(now=NOW) == 1
+    assert repo.get(job.id).status == "queued"
+
+
+def test_retry_delay_doubles_and_is_capped():
+    assert [retry_delay(n, base_seconds=30, max_seconds=100) for n in (1, 2, 3, 4)] == [30, 60, 100, 100]
+
+
+def test_worker_retries_when_ollama_is_down_then_completes(tmp_path, fake_ollama):
+    fake_ollama.evaluator_pass = _rejects_bad_questions
+    settings = Settings(data_dir=str(tmp_path), report_job_workers=0, report_job_max_attempts=3)
+    container = build_container(settings, ollama=fake_ollama)
+    bank = container.bank_repo.sync
+    concept = container.concepts_repo.sync.create_concept(ConceptCreate(title="Jobs"))
+    question = bank.upsert_question(concept_id=concept.id, question_text="Bad question", model_answer="A", rubric="R")
+    jobs = container.report_jobs_repo.sync
+    job, _ = jobs.enqueue(question_id=question.id, concept_id=concept.id)
+    worker = container.report_worker
+
+    async def scenario():
+        fake_ollama.error = OllamaUnavailable("connection refused")
+        retried = await worker.run_once()
+        fake_ollama.error = None
+        jobs.update(retried.model_copy(update={"next_attempt_at": NOW}))  # skip the backoff wait
+        return retried, await worker.run_once()
+
+    try:
+        retried, done = asyncio.run(scenario())
+    finally:
+        asyncio.run(container.close())
+
+    assert retried.status == "queued" and retried.attempts == 1 and retried.error == "connection refused"
+    assert retried.next_attempt_at > retried.updated_at
+    assert done.status == "succeeded" and done.removed and done.replaced and done.error is None
+    _, questions = bank.get_bank(concept.id)
+    assert [q.question_text for q in questions] == ["Question 1?"]
+
+
+def test_worker_survives_a_repository_error(tmp_path, fake_ollama, monkeypatch):
+    monkeypatch.setattr(report_jobs, "_ERROR_BACKOFF_SECONDS", 0.01)
+    fake_ollama.evaluator_pass = _rejects_bad_questions
+    container = build_container(Settings(data_dir=str(tmp_path), report_job_workers=1), ollama=fake_ollama)
+    concept = container.concepts_repo.sync.create_concept(ConceptCreate(title="Jobs"))
+    question = container.bank_repo.sync.upsert_question(
+        concept_id=concept.id, question_text="Bad question", model_answer="A", rubric="R"
+    )
+    jobs = container.report_jobs_repo
+    job, _ = jobs.sync.enqueue(question_id=question.id, concept_id=concept.id)
+
+    claim = jobs.claim
+    failures = []
+
+    async def flaky_claim(**kwargs):
+        if not failures:
+            failures.append(kwargs)
+            raise OSError("jobs file unreadable")
+        return await claim(**kwargs)
+
+    monkeypatch.setattr(jobs, "claim", flaky_claim)
+
+    async def scenario():
+        await container.report_worker.start()
+        try:
+            deadline = time.monotonic() + 5
+            while jobs.sync.get(job.id).status != "succeeded":
+                assert time.monotonic() < deadline
+                await asyncio.sleep(0.01)
+        finally:
+            await container.report_worker.stop()
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        asyncio.run(container.close())
+
+    assert len(failures) == 1
+
+
+def test_report_endpoint_queues_job_and_status_is_pollable(tmp_path, fake_ollama):
+    fake_ollama.evaluator_pass = _rejects_bad_questions
+    app = create_app(Settings(data_dir=str(tmp_path), metrics_enabled=False), ollama=fake_ollama)
+
+    with TestClient(app) as client:
+        container = app.state.container
+        concept = client.post("/concepts", json={"title": "Report me"}).json()
+        question = container.bank_repo.sync.upsert_question(
+            concept_id=concept["id"], question_text="Bad question", model_answer="A", rubric="R"
+        )
+
+        response = client.post(f"/questions/{question.id}/report", json={"reason": "unclear"})
+        assert response.status_code == 202
+        body = response.json()
+        assert response.headers["Location"] == f"/questions/report-jobs/{body['job_id']}"
+
+        deadline = time.monotonic() + 10
+        while (job := client.get(f"/questions/report-jobs/{body['job_id']}").json())["status"] != "succeeded":
+            assert time.monotonic() < deadline, job
+            time.sleep(0.02)
+
+        assert job["removed"] is True and job["replaced"] is True
+        assert client.post("/questions/missing/report", json={}).status_code == 404
+        assert client.get("/questions/report-jobs/missing").json()["detail"]["error"]["code"] == "job_not_found"
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from app.api import responses
+from app.api.responses import FastJSONResponse, dump_json
+from app.domain.concepts import Concept
+
+
+def _concept() -> Concept:
+    now = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    return Concept(id="c1", title="Title", description="Déjà vu", tags=["a"], created_at=now, updated_at=now)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dump_json_matches_pydantic_for_models_and_plain_data(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(responses, "orjson", None)
+    concept = _concept()
+    expected = concept.model_dump(mode="json")
+
+    assert json.loads(dump_json(concept)) == expected
+    assert json.loads(dump_json({"items": [concept], "at": concept.created_at})) == {
+        "items": [expected],
+        "at": expected["created_at"],
+    }
+    assert json.loads(dump_json([concept.model_dump(include={"id", "created_at"})])) == [
+        {"id": "c1", "created_at": expected["created_at"]}
+    ]
+    with pytest.raises(TypeError):
+        dump_json({"x": object()})
+
+
+def test_fast_json_response_sends_bytes_unchanged():
+    body = b'{"already":"serialized"}'
+    response = FastJSONResponse(body)
+
+    assert response.body == body
+    assert response.headers["content-type"] == "application/json"
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import random
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+from app.domain.concepts import Concept
+from app.domain.practice.models import ConceptProgress
+from app.domain.practice.sampler import FenwickSampler, IncrementalConceptSelector
+from app.domain.practice.selection import compute_concept_weight, is_due, pick_due_concept
+
+NOW = datetime(2026, 1, 20, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _library(rng: random.Random, size: int) -> tuple[list[Concept], dict[str, ConceptProgress]]:
+    tags = ["a", "b", "c", "d", "e", "f"]
+    concepts: list[Concept] = []
+    progress: dict[str, ConceptProgress] = {}
+    for i in range(size):
+        concept_id = f"c{i}"
+        concepts.append(
+            Concept(id=concept_id, title=concept_id, tags=rng.sample(tags, rng.randint(0, 3)), created_at=NOW, updated_at=NOW)
+        )
+        if rng.random() < 0.25:
+            continue
+        item = ConceptProgress(concept_id=concept_id, mastery_streak=rng.randint(0, 6))
+        if rng.random() < 0.6:
+            item.next_due_at = NOW + timedelta(minutes=rng.randint(-2000, 2000))
+        if rng.random() < 0.6:
+            item.last_correct_at = NOW - timedelta(minutes=rng.randint(0, 4000))
+        if rng.random() < 0.5:
+            item.last_attempt_score = rng.uniform(0, 100)
+        progress[concept_id] = item
+    return concepts, progress
+
+
+def _expected_weights(
+    concepts: list[Concept], progress: dict[str, ConceptProgress], recent_tags: set[str], now: datetime
+) -> dict[str, float]:
+    return {
+        c.id: compute_concept_weight(c, progress.get(c.id), recent_tags=recent_tags, now=now)
+        if is_due(progress.get(c.id), now=now)
+        else 0.0
+        for c in concepts
+    }
+
+
+def test_fenwick_sampler_never_draws_zero_weight_keys() -> None:
+    sampler = FenwickSampler()
+    for i in range(50):
+        sampler.set_weight(f"k{i}", 0.0 if i % 2 else 1.0)
+    sampler.set_weight("k1", 3.0)
+    sampler.set_weight("k0", 0.0)
+
+    rng = random.Random(5)
+    drawn = {sampler.sample(rng)[0] for _ in range(2000)}
+
+    assert "k0" not in drawn
+    assert all(int(key[1:]) % 2 == 0 or key == "k1" for key in drawn)
+    assert sampler.total() == sum(sampler.weight(f"k{i}") for i in range(50))
+
+
+def test_fenwick_sampler_empty_returns_none() -> None:
+    sampler = FenwickSampler()
+    assert sampler.sample(random.Random(1)) is None
+    sampler.set_weight("a", 0.0)
+    assert sampler.sample(random.Random(1)) is None
+
+
+def test_selector_weights_track_scalar_rules_through_updates() -> None:
+    rng = random.Random(21)
+    concepts, progress = _library(rng, 80)
+    recent_tags = {"a"}
+    selector = IncrementalConceptSelector(
+        concepts=concepts, progress_by_concept_id=progress, recent_tags=recent_tags, now=NOW
+    )
+
+    now = NOW
+    for step in range(40):
+        now = now + timedelta(minutes=rng.randint(0, 240))
+        if step % 3 == 0:
+            recent_tags = set(rng.sample(["a", "b", "c", "d", "e", "f"], rng.randint(0, 3)))
+            selector.set_recent_tags(recent_tags)
+        concept_id = rng.choice(concepts).id
+        updated = ConceptProgress(
+            concept_id=concept_id,
+            mastery_streak=rng.randint(0, 6),
+            last_correct_at=now,
+            next_due_at=now + timedelta(minutes=rng.choice([10, 1440])),
+            last_attempt_score=rng.uniform(0, 100),
+        )
+        progress[concept_id] = updated
+        selector.update_progress(updated)
+        selector.pick(now=now, rng=rng)
+
+        expected = _expected_weights(concepts, progress, recent_tags, now)
+        assert {c.id: selector.weight(c.id) for c in concepts} == expected
+
+
+def test_selector_distribution_matches_pick_due_concept() -> None:
+    rng = random.Random(8)
+    concepts, progress = _library(rng, 15)
+    recent_tags = {"a", "c"}
+    selector = IncrementalConceptSelector(
+        concepts=concepts, progress_by_concept_id=progress, recent_tags=recent_tags, now=NOW
+    )
+
+    draws = 20_000
+    incremental = Counter(selector.pick(now=NOW, rng=rng).concept_id for _ in range(draws))
+    scalar = Counter(
+        pick_due_concept(
+            concepts=concepts, progress_by_concept_id=progress, recent_tags=recent_tags, now=NOW, rng=rng
+        ).concept_id
+        for _ in range(draws)
+    )
+
+    weights = {k: w for k, w in _expected_weights(concepts, progress, recent_tags, NOW).items() if w > 0}
+    total = sum(weights.values())
+
+    # Pearson chi-square goodness of fit against the exact probabilities.
+    # Critical value for df <= 14 at p = 0.001 is 36.1.
+    for counts in (incremental, scalar):
+        assert set(counts) <= set(weights)
+        chi_square = sum(
+            (counts.get(k, 0) - draws * w / total) ** 2 / (draws * w / total) for k, w in weights.items()
+        )
+        assert chi_square < 36.1
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from app.domain.practice.scheduling import compute_cooldown_minutes, compute_next_due_at, update_mastery_streak
+from app.domain.practice.scheduling_vectorized import (
+    cooldown_minutes_array,
+    next_due_offset_minutes_array,
+    update_mastery_streak_array,
+)
+
+NOW = datetime(2026, 1, 20, 12, 0, 0, tzinfo=timezone.utc)
+SCORES = [0.0, 10.0, 49.999, 50.0, 70.0, 84.999, 85.0, 99.0, 100.0]
+
+
+def test_cooldown_minutes_array_matches_scalar_rule():
+    streaks = np.arange(-2, 31)
+
+    vectorized = cooldown_minutes_array(streaks)
+
+    assert vectorized.tolist() == [compute_cooldown_minutes(int(s)) for s in streaks]
+
+
+def test_update_mastery_streak_array_matches_scalar_rule():
+    current, score = np.meshgrid(np.arange(-1, 31), np.array(SCORES), indexing="ij")
+
+    vectorized = update_mastery_streak_array(current, score)
+
+    expected = [
+        [update_mastery_streak(int(c), float(s)).mastery_streak for c, s in zip(row_c, row_s)]
+        for row_c, row_s in zip(current, score)
+    ]
+    assert vectorized.tolist() == expected
+
+
+def test_next_due_offset_minutes_array_matches_scalar_rule():
+    score = np.array(SCORES)
+    cooldown = cooldown_minutes_array(update_mastery_streak_array(np.full(score.shape, 4), score))
+
+    offsets = next_due_offset_minutes_array(score, cooldown)
+
+    for s, c, offset in zip(score.tolist(), cooldown.tolist(), offsets.tolist()):
+        expected = compute_next_due_at(now=NOW, score=s, cooldown_minutes=c)
+        if expected is None:
+            assert np.isnan(offset)
+        else:
+            assert NOW + timedelta(minutes=offset) == expected
@@ -5,7 +5,7 @@ from datetime import datetime, timedelta, timezone
 
 from app.domain.concepts import Concept
 from app.domain.practice.models import ConceptProgress
-from app.domain.practice.selection import is_due, pick_due_concept
+from app.domain.practice.selection import is_due, pick_due_concept, pick_due_concepts
 
 
 def _concept(*, concept_id: str, title: str, tags: list[str]) -> Concept:
@@ -81,3 +81,48 @@ def test_pick_due_concept_returns_none_when_none_due() -> None:
     )
 
     assert result is None
+
+
+def test_pick_due_concepts_without_replacement() -> None:
+    now = datetime(2026, 1, 20, 12, 0, 0, tzinfo=timezone.utc)
+
+    concepts = [_concept(concept_id=f"c{i}", title=f"C{i}", tags=["a" if i % 2 else "b"]) for i in range(6)]
+    cool = ConceptProgress(concept_id="c0")
+    cool.next_due_at = now + timedelta(days=1)
+
+    picks = pick_due_concepts(
+        concepts=concepts,
+        progress_by_concept_id={"c0": cool},
+        recent_tag_history=[{"a"}],
+        count=10,
+        now=now,
+        rng=random.Random(3),
+    )
+
+    ids = [p.concept_id for p in picks]
+    assert len(ids) == 5
+    assert len(set(ids)) == 5
+    assert "c0" not in ids
+
+
+def test_pick_due_concepts_first_pick_matches_single_pick() -> None:
+    now = datetime(2026, 1, 20, 12, 0, 0, tzinfo=timezone.utc)
+    concepts = [_concept(concept_id=f"c{i}", title=f"C{i}", tags=[f"t{i % 3}"]) for i in range(9)]
+
+    for seed in range(20):
+        single = pick_due_concept(
+            concepts=concepts,
+            progress_by_concept_id={},
+            recent_tags={"t1", "t2"},
+            now=now,
+            rng=random.Random(seed),
+        )
+        planned = pick_due_concepts(
+            concepts=concepts,
+            progress_by_concept_id={},
+            recent_tag_history=[{"t1"}, {"t2"}],
+            count=3,
+            now=now,
+            rng=random.Random(seed),
+        )
+        assert planned[0] == single
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+
+from app.domain.concepts import Concept
+from app.domain.practice.models import ConceptProgress
+from app.domain.practice.selection import compute_concept_weight, is_due, pick_due_concept
+from app.domain.practice.selection_vectorized import (
+    ConceptColumns,
+    compute_weights,
+    due_mask,
+    pick_due_concept_vectorized,
+)
+
+NOW = datetime(2026, 1, 20, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _library(rng: random.Random, size: int, tag_pool: int) -> tuple[list[Concept], dict[str, ConceptProgress]]:
+    tags = [f"t{i}" for i in range(tag_pool)]
+    concepts: list[Concept] = []
+    progress: dict[str, ConceptProgress] = {}
+    for i in range(size):
+        concept_id = f"c{i}"
+        concept_tags = rng.sample(tags, rng.randint(0, min(4, tag_pool))) + ([""] if rng.random() < 0.1 else [])
+        concepts.append(
+            Concept(id=concept_id, title=concept_id, tags=concept_tags, created_at=NOW, updated_at=NOW)
+        )
+        if rng.random() < 0.2:
+            continue
+        item = ConceptProgress(concept_id=concept_id, mastery_streak=rng.randint(0, 8))
+        if rng.random() < 0.7:
+            item.next_due_at = NOW + timedelta(microseconds=rng.randint(-10**11, 10**11))
+        if rng.random() < 0.6:
+            item.last_correct_at = NOW - timedelta(microseconds=rng.randint(0, 4 * 10**11))
+        if rng.random() < 0.5:
+            item.last_attempt_score = rng.choice([49.999, 50.0, rng.uniform(0, 100)])
+        progress[concept_id] = item
+    return concepts, progress
+
+
+def test_weights_and_due_mask_match_scalar_rules_exactly() -> None:
+    rng = random.Random(3)
+    # 100 tags forces multi-word bitsets.
+    concepts, progress = _library(rng, 400, tag_pool=100)
+    recent_tags = {"t1", "t7", "t70", "t99", "unknown"}
+
+    columns = ConceptColumns.build(concepts, progress)
+    weights = compute_weights(columns, recent_tags=recent_tags, now=NOW)
+    due = due_mask(columns, now=NOW)
+
+    for row, concept in enumerate(concepts):
+        item = progress.get(concept.id)
+        assert weights[row] == compute_concept_weight(concept, item, recent_tags=recent_tags, now=NOW)
+        assert bool(due[row]) == is_due(item, now=NOW)
+
+
+def test_vectorized_pick_identical_to_scalar_pick() -> None:
+    rng = random.Random(11)
+    for _ in range(10):
+        concepts, progress = _library(rng, 200, tag_pool=12)
+        columns = ConceptColumns.build(concepts, progress)
+        recent_tags = {f"t{rng.randrange(12)}" for _ in range(3)}
+
+        for seed in range(50):
+            expected = pick_due_concept(
+                concepts=concepts,
+                progress_by_concept_id=progress,
+                recent_tags=recent_tags,
+                now=NOW,
+                rng=random.Random(seed),
+            )
+            actual = pick_due_concept_vectorized(columns, recent_tags=recent_tags, now=NOW, rng=random.Random(seed))
+            assert actual == expected
+
+
+def test_vectorized_pick_returns_none_when_none_due() -> None:
+    concept = Concept(id="c1", title="C1", tags=["a"], created_at=NOW, updated_at=NOW)
+    progress = ConceptProgress(concept_id="c1", next_due_at=NOW + timedelta(minutes=1))
+    columns = ConceptColumns.build([concept], {"c1": progress})
+
+    assert pick_due_concept_vectorized(columns, recent_tags=set(), now=NOW, rng=random.Random(1)) is None
+
+
+def test_set_progress_updates_row_in_place() -> None:
+    concept = Concept(id="c1", title="C1", tags=["a"], created_at=NOW, updated_at=NOW)
+    columns = ConceptColumns.build([concept], {})
+    assert bool(due_mask(columns, now=NOW)[0]) is True
+
+    columns.set_progress(ConceptProgress(concept_id="c1", next_due_at=NOW + timedelta(days=1), mastery_streak=2))
+
+    assert bool(due_mask(columns, now=NOW)[0]) is False
+    assert int(columns.mastery[0]) == 2
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from fastapi.testclient import TestClient
+
+from app.core.settings import Settings
+from app.domain.practice.session import SessionPlanStore, SessionSlot
+from app.main import create_app
+
+NOW = datetime(2026, 1, 20, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def test_update_slot_replaces_snapshot() -> None:
+    store = SessionPlanStore()
+    plan = store.create([SessionSlot(concept_id="c1", status="pending")], now=NOW)
+
+    store.update_slot(plan.id, 0, SessionSlot(concept_id="c1", status="failed", error="down"))
+
+    assert plan.slots[0].status == "pending"
+    assert store.get(plan.id).slots[0].status == "failed"
+
+
+def test_store_evicts_oldest_plans() -> None:
+    store = SessionPlanStore(max_plans=2)
+    first = store.create([SessionSlot(concept_id="c1", status="pending")], now=NOW)
+    second = store.create([SessionSlot(concept_id="c2", status="pending")], now=NOW)
+    third = store.create([], now=NOW)
+
+    assert store.get(first.id) is None
+    # Filling a slot of an evicted plan is a no-op: it neither revives the plan nor touches the others.
+    store.update_slot(first.id, 0, SessionSlot(concept_id="c1", status="ready"))
+    assert store.get(first.id) is None
+    assert store.get(second.id) == second and store.get(third.id) == third
+
+
+def test_session_endpoint_fills_pending_slots_and_fails_only_the_broken_one(tmp_path, fake_ollama) -> None:
+    fake_ollama.errors["Broken"] = OSError("disk full")
+    app = create_app(Settings(data_dir=str(tmp_path), metrics_enabled=False), ollama=fake_ollama)
+
+    with TestClient(app) as client:
+        for title in ("Broken", "Fine"):
+            client.post("/concepts", json={"title": title})
+        planned = client.post("/practice/session", json={"count": 2}).json()
+        session = client.get(f"/practice/session/{planned['session_id']}").json()
+        titles = {concept["id"]: concept["title"] for concept in client.get("/concepts").json()}
+        history = app.state.container.history_repo.sync.list_recent(limit=10)
+
+    assert [item["status"] for item in planned["items"]] == ["pending", "pending"]
+    by_title = {titles[item["concept_id"]]: item for item in session["items"]}
+    assert by_title["Broken"]["status"] == "failed" and by_title["Broken"]["question"] is None
+    assert by_title["Fine"]["status"] == "ready"
+    assert by_title["Fine"]["question"]["question_text"] == "Question 1?"
+    # Pending items count as served only once filled; the failed slot never does.
+    assert [(item.concept_id, item.question_id, item.event) for item in history] == [
+        (by_title["Fine"]["concept_id"], by_title["Fine"]["question"]["id"], "served")
+    ]
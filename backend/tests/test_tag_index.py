@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta, timezone
+
+from app.domain.concepts import Concept, ConceptCreate
+from app.domain.practice.models import ConceptProgress
+from app.domain.practice.selection import pick_due_concept
+from app.domain.tag_index import TagIndex
+from app.infra.repositories.concepts_repository import ConceptsRepository
+from app.infra.storage.yaml_store import YamlStore
+
+NOW = datetime(2026, 1, 20, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _concept(concept_id: str, tags: list[str]) -> Concept:
+    return Concept(id=concept_id, title=concept_id, tags=tags, created_at=NOW, updated_at=NOW)
+
+
+def test_tag_overlap_matches_set_intersection() -> None:
+    rng = random.Random(4)
+    tags = ["a", "b", "c", "d", "e", ""]
+    concepts = [_concept(f"c{i}", rng.choices(tags, k=rng.randint(0, 4))) for i in range(100)]
+    index = TagIndex(concepts)
+
+    for _ in range(20):
+        recent = set(rng.sample(tags + ["zzz"], 3))
+        overlap = index.tag_overlap(recent)
+        for concept in concepts:
+            expected = len({t for t in concept.tags if t} & recent)
+            assert overlap.get(concept.id, 0) == expected
+            if expected == 0:
+                assert concept.id not in overlap
+
+
+def test_tag_index_add_replaces_previous_tags() -> None:
+    index = TagIndex([_concept("c1", ["a", "b"])])
+
+    index.add(_concept("c1", ["c"]))
+
+    assert index.tags_for("c1") == ["c"]
+    assert index.concepts_with_any({"a", "b"}) == set()
+    assert index.concepts_with_any({"c"}) == {"c1"}
+
+
+def test_pick_with_precomputed_overlap_identical() -> None:
+    rng = random.Random(9)
+    concepts = [_concept(f"c{i}", rng.sample(["a", "b", "c", "d"], rng.randint(0, 3))) for i in range(50)]
+    progress = {
+        c.id: ConceptProgress(concept_id=c.id, mastery_streak=rng.randint(0, 4), last_correct_at=NOW - timedelta(days=1))
+        for c in concepts[::2]
+    }
+    index = TagIndex(concepts)
+    recent_tags = {"a", "d"}
+
+    for seed in range(30):
+        expected = pick_due_concept(
+            concepts=concepts, progress_by_concept_id=progress, recent_tags=recent_tags, now=NOW, rng=random.Random(seed)
+        )
+        actual = pick_due_concept(
+            concepts=concepts,
+            progress_by_concept_id=progress,
+            recent_tags=recent_tags,
+            now=NOW,
+            rng=random.Random(seed),
+            tag_overlap_by_concept_id=index.tag_overlap(recent_tags),
+        )
+        assert actual == expected
+
+
+def test_concepts_repository_index_updates_on_create_and_external_change(tmp_path) -> None:
+    store = YamlStore(tmp_path)
+    repo = ConceptsRepository(store)
+
+    created = repo.create_concept(ConceptCreate(title="One", tags=["x", " y "]))
+    assert set(repo.tags_for(created.id)) == {"x", "y"}
+    assert repo.tag_overlap({"x"}) == {created.id: 1}
+
+    # Written through a different repository (own index) -> signature change.
+    other = ConceptsRepository(store).create_concept(ConceptCreate(title="Two", tags=["x"]))
+
+    assert repo.tag_overlap({"x"}) == {created.id: 1, other.id: 1}
+    assert repo.recent_tags_for([created.id, other.id, "missing"]) == {"x", "y"}
+
+
+def test_concepts_repository_returns_copies_that_do_not_share_tags(tmp_path) -> None:
+    repo = ConceptsRepository(YamlStore(tmp_path))
+    created = repo.create_concept(ConceptCreate(title="One", tags=["x"]))
+    [(_, bulk)] = repo.create_concepts([ConceptCreate(title="Two", tags=["y"])]).created
+
+    created.tags.append("leak")
+    bulk.tags.append("leak")
+    repo.get_concept(created.id).tags.append("leak")
+    repo.list_concepts()[0].tags.append("leak")
+    repo.page(limit=1).items[0].tags.append("leak")
+
+    assert repo.get_concept(created.id).tags == ["x"]
+    assert [concept.tags for concept in repo.list_concepts()] == [["x"], ["y"]]
+    assert repo.tags_for(bulk.id) == ["y"]